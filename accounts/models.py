@@ -1,4 +1,5 @@
 from django.contrib.auth.models import AbstractUser
+from django.utils.functional import cached_property
 
 from people.utils import get_personal_details
 
@@ -7,6 +8,11 @@ class User(AbstractUser):
     class Meta:  # noqa
         ordering = ["email"]
 
-    @property
+    @cached_property
     def personal_details(self):
+        """The user's `Person` record, looked up once per user instance.
+
+        `AuthenticationMiddleware` loads a fresh user for every request, so this
+        is effectively memoized per request.
+        """
         return get_personal_details(self)
@@ -2,6 +2,7 @@ from django.test import SimpleTestCase, TestCase
 from django.utils.module_loading import import_string
 
 from accounts.factories import UserFactory
+from people.factories import AdultFactory
 from people.utils import get_personal_details
 
 
@@ -32,6 +33,13 @@ class UserModelTestCase(TestCase):
     def test_personal_details(self):
         self.assertEqual(self.user.personal_details, get_personal_details(self.user))
 
+    def test_personal_details_is_memoized(self):
+        user = UserFactory()
+        AdultFactory(user=user)
+        with self.assertNumQueries(1):
+            user.personal_details
+            user.personal_details
+
 
 class UserModelFieldsTestCase(SimpleTestCase):
     @classmethod
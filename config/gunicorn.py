@@ -0,0 +1,150 @@
+"""
+Gunicorn config for the Church IMS project.
+
+Run it with ``gunicorn -c python:config.gunicorn``. The number of workers is
+sized from the CPUs and memory available to the container, and every setting
+can be overridden with the environment variables read below.
+
+For more information on this file, see
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import os
+
+import decouple
+
+# the cgroup v2 and v1 files that hold the container's memory limit
+CGROUP_MEMORY_LIMIT_FILES = [
+    "/sys/fs/cgroup/memory.max",
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+]
+
+MEBIBYTE = 1024 * 1024
+
+
+def get_cpu_count():
+    """The number of CPUs this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def get_memory_limit():
+    """The bytes of memory available to the container, if they can be found"""
+    for path in CGROUP_MEMORY_LIMIT_FILES:
+        try:
+            with open(path) as file:
+                limit = file.read().strip()
+        except OSError:
+            continue
+        if limit.isdigit():
+            return int(limit)
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def get_workers(cpu_count, memory_limit, worker_memory):
+    """Returns `2 * CPUs + 1` workers, or as many as fit in the memory limit if
+    that's fewer. `worker_memory` is the MiB a worker is expected to use.
+    """
+    workers = 2 * cpu_count + 1
+    if memory_limit:
+        workers = min(workers, memory_limit // (worker_memory * MEBIBYTE))
+    return max(workers, 1)
+
+
+# Server Mechanics
+# ================
+
+wsgi_app = "config.wsgi:application"
+
+# Load the app before forking, so the workers share its memory copy-on-write
+preload_app = decouple.config("GUNICORN_PRELOAD_APP", cast=bool, default=True)
+
+
+# Worker Processes
+# ================
+
+worker_class = decouple.config("GUNICORN_WORKER_CLASS", default="gthread")
+
+# WEB_CONCURRENCY is set by Heroku from the dyno size
+workers = decouple.config(
+    "WEB_CONCURRENCY",
+    cast=int,
+    default=get_workers(
+        get_cpu_count(),
+        get_memory_limit(),
+        decouple.config("GUNICORN_WORKER_MEMORY", cast=int, default=150),
+    ),
+)
+
+# Only gthread workers serve requests on several threads
+threads = decouple.config(
+    "GUNICORN_THREADS", cast=int, default=4 if worker_class == "gthread" else 1
+)
+
+# Restart each worker after about this many requests to contain memory leaks.
+# The jitter keeps the workers from restarting at the same time.
+max_requests = decouple.config("GUNICORN_MAX_REQUESTS", cast=int, default=1000)
+
+max_requests_jitter = decouple.config(
+    "GUNICORN_MAX_REQUESTS_JITTER", cast=int, default=100
+)
+
+timeout = decouple.config("GUNICORN_TIMEOUT", cast=int, default=30)
+
+keepalive = decouple.config("GUNICORN_KEEPALIVE", cast=int, default=5)
+
+
+# Logging
+# =======
+
+errorlog = "-"
+
+
+# Server Hooks
+# ============
+
+
+def warm_url_resolver(resolver):
+    """Compiles the patterns of `resolver` and builds its reverse lookups and
+    those of the namespaces it includes
+    """
+    resolver.check()
+    resolver.reverse_dict
+    for _, namespace_resolver in resolver.namespace_dict.values():
+        warm_url_resolver(namespace_resolver)
+
+
+def pre_fork(server, worker):
+    """Closes the database connections the preloaded app opened, so the
+    workers don't share their sockets
+    """
+    from django.conf import settings
+
+    if settings.configured:
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_worker_init(worker):
+    """Warms the URL resolver, and the database connections of sync workers, so
+    a worker's first request doesn't pay for them.
+
+    Django's database connections belong to the thread that opened them. Only
+    sync workers serve requests on the thread that runs this hook, the others
+    would keep an idle connection open for the worker's life.
+    """
+    from django.db import connections
+    from django.urls import get_resolver
+
+    from gunicorn.workers.sync import SyncWorker
+
+    if isinstance(worker, SyncWorker):
+        for connection in connections.all():
+            connection.ensure_connection()
+    warm_url_resolver(get_resolver())
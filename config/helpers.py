@@ -9,3 +9,12 @@ def list_of_tuples(config_string):
     names = config[::2]
     emails = list(reversed(config[::-2]))
     return list(zip(names, emails))
+
+
+def session_engine(config_string):
+    """Expands the name of a built-in session backend, like "cached_db", to its
+    module path
+    """
+    if "." in config_string:
+        return config_string
+    return f"django.contrib.sessions.backends.{config_string}"
@@ -15,6 +15,8 @@ from pathlib import Path
 import decouple
 import dj_database_url
 
+from config.helpers import session_engine
+
 # Django settings
 # ===============
 
@@ -76,6 +78,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.RequestTimingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -100,6 +103,7 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "core.context_processors.site_info",
+                "core.cache.permissions_key",
             ],
         },
     },
@@ -132,6 +136,32 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/ref/settings/#caches
+
+CACHES = {
+    "default": {
+        "BACKEND": decouple.config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": decouple.config("CACHE_LOCATION", default=""),
+    }
+}
+
+
+# Sessions
+# https://docs.djangoproject.com/en/4.0/topics/http/sessions/#configuring-the-session-engine
+
+# "cached_db" reads sessions from the cache and writes them through to the
+# database, "cache" keeps them in the cache only and "signed_cookies" keeps them
+# in the browser. Expired database sessions are removed with `clearsessions`.
+# The cached engines need a cache shared by every process, or a logout in one
+# process leaves the session cached in the others.
+SESSION_ENGINE = decouple.config("SESSION_ENGINE", cast=session_engine, default="db")
+
+SESSION_CACHE_ALIAS = decouple.config("SESSION_CACHE_ALIAS", default="default")
+
+
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
@@ -198,6 +228,25 @@ USE_L10N = True
 USE_TZ = True
 
 
+# Logging
+# https://docs.djangoproject.com/en/3.2/topics/logging/
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "core.timing": {
+            "handlers": ["console"],
+            "level": decouple.config("REQUEST_TIMING_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
+
+
 # Third Party Apps Settings
 # =========================
 
@@ -231,6 +280,52 @@ CRISPY_TEMPLATE_PACK = "bootstrap4"
 
 ADMIN_URL = "admin"
 
+# Use keyset pagination on the list views and optionally count the total rows
+CURSOR_PAGINATION = decouple.config("CURSOR_PAGINATION", cast=bool, default=False)
+
+CURSOR_PAGINATION_COUNT = decouple.config(
+    "CURSOR_PAGINATION_COUNT", cast=bool, default=False
+)
+
+# The backend that delivers the queued emails
+EMAIL_QUEUE_BACKEND = decouple.config(
+    "EMAIL_QUEUE_BACKEND", default="django.core.mail.backends.smtp.EmailBackend"
+)
+
+# The number of queued emails delivered over a connection at a time
+EMAIL_QUEUE_BATCH_SIZE = decouple.config("EMAIL_QUEUE_BATCH_SIZE", cast=int, default=50)
+
+# The number of attempts to deliver an email before it's marked as failed
+EMAIL_QUEUE_MAX_ATTEMPTS = decouple.config(
+    "EMAIL_QUEUE_MAX_ATTEMPTS", cast=int, default=5
+)
+
+# The seconds before the first retry of an email, doubled after each attempt
+EMAIL_QUEUE_RETRY_DELAY = decouple.config(
+    "EMAIL_QUEUE_RETRY_DELAY", cast=int, default=60
+)
+
+# The number of rows fetched from the database at a time by the exports
+EXPORT_CHUNK_SIZE = decouple.config("EXPORT_CHUNK_SIZE", cast=int, default=2000)
+
+# The number of CSV rows validated and inserted at a time by the people import
+IMPORT_CHUNK_SIZE = decouple.config("IMPORT_CHUNK_SIZE", cast=int, default=1000)
+
+# How long, in seconds, the pages of the read-heavy views are cached for
+VIEW_CACHE_TIMEOUT = decouple.config("VIEW_CACHE_TIMEOUT", cast=int, default=300)
+
+# The fraction of requests whose queries and timings are measured and logged
+REQUEST_TIMING_SAMPLE_RATE = decouple.config(
+    "REQUEST_TIMING_SAMPLE_RATE", cast=float, default=0.0
+)
+
+# The maximum queries and milliseconds of db, render and total time of a view,
+# by URL name, e.g. {"people:people_list": {"queries": 10, "total": 500}}
+REQUEST_TIMING_BUDGETS = {}
+
+# The search backend of the list views. Defaults to the one for the database.
+SEARCH_BACKEND = decouple.config("SEARCH_BACKEND", default=None)
+
 GOOGLE_ANALYTICS_ID = decouple.config("GOOGLE_ANALYTICS_ID", default=None)
 
 SITE_NAME = decouple.config("SITE_NAME", default="Church IMS")
@@ -1,4 +1,6 @@
-from config.helpers import list_of_tuples
+from django.core.exceptions import ImproperlyConfigured
+
+from config.helpers import list_of_tuples, session_engine
 
 from .base import *
 
@@ -10,6 +12,10 @@ ADMINS = decouple.config("ADMINS", cast=list_of_tuples)
 
 EMAIL_SUBJECT_PREFIX = f"[{SITE_NAME}] "
 
+# Emails are queued in the database and delivered by the `send_queued_email`
+# worker of the Procfile
+EMAIL_BACKEND = decouple.config("EMAIL_BACKEND", default="core.mail.QueuedEmailBackend")
+
 MANAGERS = ADMINS
 
 SECURE_SSL_REDIRECT = decouple.config("SECURE_SSL_REDIRECT", cast=bool, default=True)
@@ -28,6 +34,25 @@ SESSION_COOKIE_SECURE = decouple.config(
 
 CSRF_COOKIE_SECURE = decouple.config("CSRF_COOKIE_SECURE", cast=bool, default=True)
 
+# The gunicorn workers must share the cache, or a worker would keep serving the
+# pages that the cache versions bumped by another worker have invalidated.
+# Without a REDIS_URL, e.g. when CI runs the tests or collects the static files,
+# the CACHE_BACKEND of the base settings has to be set explicitly.
+REDIS_URL = decouple.config("REDIS_URL", default=None)
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+    SESSION_ENGINE = decouple.config(
+        "SESSION_ENGINE", cast=session_engine, default="cached_db"
+    )
+elif decouple.config("CACHE_BACKEND", default=None) is None:
+    raise ImproperlyConfigured("Set REDIS_URL or CACHE_BACKEND to a shared cache")
+
 
 # Third Party Apps Settings
 # =========================
@@ -1,9 +1,68 @@
 import unittest
+from importlib.util import find_spec
+from unittest.mock import Mock, patch
 
-from .helpers import list_of_tuples
+from django.urls import get_resolver
+
+from . import gunicorn
+from .helpers import list_of_tuples, session_engine
 
 
 class ListOfTuplesTestCase(unittest.TestCase):
     def test_list_of_tuples_with_valid_input(self):
         admins = [("Admin", "admin@example.com"), ("Manager", "manager@example.com")]
         self.assertListEqual(admins, list_of_tuples(str(admins)))
+
+
+class SessionEngineTestCase(unittest.TestCase):
+    def test_backend_name(self):
+        self.assertEqual(
+            session_engine("cache"), "django.contrib.sessions.backends.cache"
+        )
+
+    def test_module_path(self):
+        engine = "django.contrib.sessions.backends.signed_cookies"
+        self.assertEqual(session_engine(engine), engine)
+
+
+class GetWorkersTestCase(unittest.TestCase):
+    def test_cpu_bound(self):
+        self.assertEqual(gunicorn.get_workers(2, 4096 * gunicorn.MEBIBYTE, 150), 5)
+
+    def test_memory_bound(self):
+        self.assertEqual(gunicorn.get_workers(8, 512 * gunicorn.MEBIBYTE, 150), 3)
+
+    def test_unknown_memory_limit(self):
+        self.assertEqual(gunicorn.get_workers(1, None, 150), 3)
+
+    def test_at_least_one_worker(self):
+        self.assertEqual(gunicorn.get_workers(4, 64 * gunicorn.MEBIBYTE, 150), 1)
+
+
+class WarmURLResolverTestCase(unittest.TestCase):
+    def test_warm_url_resolver(self):
+        resolver = get_resolver()
+        gunicorn.warm_url_resolver(resolver)
+        _, people_resolver = resolver.namespace_dict["people"]
+        self.assertTrue(people_resolver._populated)
+
+
+@unittest.skipUnless(find_spec("gunicorn"), "Requires gunicorn")
+@patch("config.gunicorn.warm_url_resolver")
+@patch("django.db.connections")
+class PostWorkerInitTestCase(unittest.TestCase):
+    def test_sync_worker(self, connections, warm_url_resolver):
+        from gunicorn.workers.sync import SyncWorker
+
+        connection = Mock()
+        connections.all.return_value = [connection]
+        gunicorn.post_worker_init(Mock(spec=SyncWorker))
+        connection.ensure_connection.assert_called_once_with()
+        warm_url_resolver.assert_called_once_with(get_resolver())
+
+    def test_threaded_worker(self, connections, warm_url_resolver):
+        from gunicorn.workers.gthread import ThreadWorker
+
+        gunicorn.post_worker_init(Mock(spec=ThreadWorker))
+        connections.all.assert_not_called()
+        warm_url_resolver.assert_called_once_with(get_resolver())
@@ -1,5 +1,16 @@
 from django.conf import settings
 from django.contrib import admin
 
+from .models import QueuedEmail
+
 admin.site.site_header = f"{settings.SITE_NAME} administration"
 admin.site.site_title = f"{settings.SITE_NAME} admin"
+
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    exclude = ["message"]
+    list_display = ["subject", "recipients", "status", "attempts", "next_attempt_at"]
+    list_filter = ["status"]
+    readonly_fields = ["subject", "recipients", "attempts", "last_error", "created_at"]
+    search_fields = ["subject", "recipients"]
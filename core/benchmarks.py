@@ -0,0 +1,209 @@
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+from collections import Counter
+from itertools import count
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from people.constants import INTIMATE_RELATIONSHIPS
+
+# the critical request paths, in the order they are benchmarked
+SCENARIOS = [
+    "people_list",
+    "people_search",
+    "person_detail",
+    "person_create",
+    "relationship_create",
+    "temperature_record_create",
+    "temperature_records_list",
+    "temperature_history",
+]
+
+# the number of requests whose memory is traced, after the timed requests
+MEMORY_ITERATIONS = 3
+
+# the longest username the relationship forms accept
+MAX_FORM_USERNAME_LENGTH = 25
+
+PERCENTILES = [50, 90, 95, 99]
+
+# the metrics compared between results, where a higher value is worse
+COMPARED_METRICS = ["p50", "p95", "queries", "peak_memory_kb"]
+
+
+def get_commit():
+    """The current git commit of the working tree, if there's one"""
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return process.stdout.strip()
+
+
+def summarize(latencies, queries, statuses, peak_memory):
+    """Reduces the measurements of a scenario to its latency percentiles in
+    milliseconds, its median number of queries and its peak memory in KiB
+    """
+    cut_points = statistics.quantiles(latencies, n=100, method="inclusive")
+    summary = {f"p{p}": round(cut_points[p - 1] * 1000, 2) for p in PERCENTILES}
+    summary.update(
+        mean=round(statistics.mean(latencies) * 1000, 2),
+        queries=statistics.median_low(queries),
+        max_queries=max(queries),
+        peak_memory_kb=round(peak_memory / 1024, 1),
+        statuses={str(status): n for status, n in sorted(statuses.items())},
+    )
+    return summary
+
+
+def compare_results(baseline, results, threshold=10.0):
+    """Yields `(size, scenario, metric, old, new, change, regressed)` for the
+    metrics measured by both results, where `change` is a percentage and a
+    regression is an increase of more than `threshold` percent
+    """
+    for size, scenarios in results["sizes"].items():
+        for scenario, summary in scenarios.items():
+            old_summary = baseline["sizes"].get(size, {}).get(scenario)
+            if old_summary is None:
+                continue
+            for metric in COMPARED_METRICS:
+                old, new = old_summary.get(metric), summary.get(metric)
+                if old is None or new is None:
+                    continue
+                change = (new - old) / old * 100 if old else 0.0
+                yield size, scenario, metric, old, new, change, change > threshold
+
+
+class Benchmark:
+    """Times the critical request paths with the test client.
+
+    Each scenario is requested `warmup` times, then `iterations` times while
+    the latency and queries of every request are measured, and finally
+    `MEMORY_ITERATIONS` times while the allocated memory is traced. The pages
+    are requested as a superuser, so every view is reachable.
+    """
+
+    username = "benchmark"
+
+    def __init__(self, iterations=50, warmup=5, seed=None):
+        if iterations < 2:
+            raise ValueError("A benchmark needs at least two iterations")
+        self.iterations = iterations
+        self.warmup = warmup
+        self.random = random.Random(seed)
+        self.sequence = count()
+        self.client = Client()
+
+    def setup(self):
+        from people.models import Person
+
+        user_model = get_user_model()
+        user = user_model.objects.filter(username=self.username).first()
+        if user is None:
+            user = user_model.objects.create_superuser(
+                self.username, f"{self.username}@example.com", None
+            )
+        self.client.force_login(user)
+
+        people = Person.objects.values_list("username", "full_name")
+        self.people = [p for p in people if len(p[0]) <= MAX_FORM_USERNAME_LENGTH]
+        if len(self.people) < 2:
+            raise ValueError("A benchmark needs at least two people")
+
+        requests = self.warmup + self.iterations + MEMORY_ITERATIONS
+        unrecorded = Person.objects.exclude(
+            temperaturerecord__record_date=timezone.localdate()
+        ).values_list("username", flat=True)
+        self.unrecorded = list(unrecorded[:requests])
+
+    def run(self):
+        """Returns the summary of each scenario"""
+        self.setup()
+        return {
+            scenario: self.measure(getattr(self, scenario)) for scenario in SCENARIOS
+        }
+
+    def measure(self, scenario):
+        for _ in range(self.warmup):
+            scenario()
+
+        latencies, queries, statuses = [], [], Counter()
+        for _ in range(self.iterations):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = scenario()
+                latencies.append(time.perf_counter() - start)
+            queries.append(len(context.captured_queries))
+            statuses[response.status_code] += 1
+
+        tracemalloc.start()
+        try:
+            for _ in range(MEMORY_ITERATIONS):
+                scenario()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return summarize(latencies, queries, statuses, peak_memory)
+
+    def get_person(self):
+        return self.random.choice(self.people)
+
+    def people_list(self):
+        return self.client.get(reverse("people:people_list"))
+
+    def people_search(self):
+        last_name = self.get_person()[1].split()[-1]
+        return self.client.get(reverse("people:people_list"), {"q": last_name})
+
+    def person_detail(self):
+        username = self.get_person()[0]
+        return self.client.get(reverse("people:person_detail", args=[username]))
+
+    def person_create(self):
+        n = next(self.sequence)
+        full_name = self.get_person()[1]
+        data = {
+            "username": f"{self.username}{n}",
+            "full_name": f"{full_name.split()[0]} Benchmark {n}",
+            "gender": "F",
+            "dob": "1990-01-01",
+        }
+        return self.client.post(reverse("people:person_create"), data)
+
+    def relationship_create(self):
+        person, relative = self.random.sample(self.people, 2)
+        data = {
+            "person": person[0],
+            "relative": relative[0],
+            "relation": INTIMATE_RELATIONSHIPS[0][0],
+        }
+        return self.client.post(reverse("people:relationship_create"), data)
+
+    def temperature_record_create(self):
+        if self.unrecorded:
+            username = self.unrecorded.pop()
+        else:  # measure the rejection of a duplicate record instead
+            username = self.get_person()[0]
+        url = reverse("records:temperature_record_create", args=[username])
+        return self.client.post(url, {"body_temperature": "36.6"})
+
+    def temperature_records_list(self):
+        return self.client.get(reverse("records:temperature_records_list"))
+
+    def temperature_history(self):
+        username = self.get_person()[0]
+        url = reverse("records:temperature_history", args=[username])
+        return self.client.get(url, {"bucket": "week"})
@@ -0,0 +1,267 @@
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+import faker
+
+from core.cache import bump_cache_version
+from people.constants import (
+    AGE_OF_MAJORITY,
+    AGE_OF_SENIORITY,
+    FAMILIAL_RELATIONSHIPS,
+    GENDER_CHOICES,
+    INTIMATE_RELATIONSHIPS,
+)
+from people.utils import bulk_create_people, get_age, get_years_ago
+from records.constants import FEVER_THRESHOLD
+
+PARENT_CHILD = FAMILIAL_RELATIONSHIPS[0][0]
+SIBLING = FAMILIAL_RELATIONSHIPS[1][0]
+ROMANTIC, MARITAL = [relation for relation, _ in INTIMATE_RELATIONSHIPS]
+MALE, FEMALE = [gender for gender, _ in GENDER_CHOICES]
+
+# the chances of each number of children in a household with parents
+CHILDREN_WEIGHTS = [15, 25, 30, 20, 10]
+
+# the local time the temperature records of a day are taken at
+RECORDING_HOUR = 8
+
+
+@dataclass
+class DatasetResult:
+    people: int = 0
+    relationships: int = 0
+    temperature_records: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self):
+        return self.people + self.relationships + self.temperature_records
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"Generated {self.people} people, {self.relationships} relationships "
+            f"and {self.temperature_records} temperature records in "
+            f"{self.seconds:.2f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+
+@dataclass
+class Household:
+    """The people of a household and their relationships, by their positions"""
+
+    people: list
+    relationships: list
+
+
+class DatasetGenerator:
+    """Generates people in households, their relationships and a history of
+    daily temperature records for load testing.
+
+    Households are single adults, single parents and couples with children,
+    some of whom live with a grandparent. Rows are saved with `bulk_create` in
+    batches and every value comes from a Faker and a random generator seeded
+    with `seed`, so a seed generates the same dataset each time. The usernames
+    end with a sequence number that continues after the existing people, so
+    generating another dataset with the same seed doesn't repeat them.
+    """
+
+    def __init__(self, seed=None, batch_size=None, created_by=None, today=None):
+        self.faker = faker.Faker()
+        self.faker.seed_instance(seed)
+        self.random = random.Random(seed)
+        self.batch_size = batch_size or settings.IMPORT_CHUNK_SIZE
+        self.created_by = created_by
+        self.today = today or timezone.localdate()
+        self.sequence = 0
+
+    def generate(self, people, days=0, daily_records=0):
+        """Creates `people` people, then `daily_records` temperature records a
+        day for the last `days` days
+        """
+        from people.models import InterpersonalRelationship, Person
+        from records.models import TemperatureRecord
+        from records.summaries import rebuild_summaries
+
+        result = DatasetResult()
+        start = time.perf_counter()
+        self.sequence = max(
+            self.sequence, Person.objects.aggregate(Max("pk"))["pk__max"] or 0
+        )
+        person_pks = []
+        while result.people < people:
+            size = min(self.batch_size, people - result.people)
+            created, relationships = self.generate_people(size)
+            person_pks += [person.pk for person in created]
+            result.people += len(created)
+            result.relationships += relationships
+
+        if days and daily_records and person_pks:
+            for offset in range(days - 1, -1, -1):
+                record_date = self.today - timedelta(days=offset)
+                result.temperature_records += self.generate_temperature_records(
+                    person_pks, record_date, daily_records
+                )
+            rebuild_summaries(chunk_size=self.batch_size)
+
+        for model in [Person, InterpersonalRelationship, TemperatureRecord]:
+            bump_cache_version(model)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    @transaction.atomic
+    def generate_people(self, size):
+        """Creates households of about `size` people in total and returns the
+        people and the number of relationships
+        """
+        from people.models import InterpersonalRelationship
+
+        households = []
+        people = []
+        while len(people) < size:
+            household = self.get_household()
+            households.append(household)
+            people += household.people
+
+        people = bulk_create_people(people, batch_size=self.batch_size)
+        relationships = InterpersonalRelationship.objects.bulk_create(
+            [
+                InterpersonalRelationship(
+                    person=household.people[person],
+                    relative=household.people[relative],
+                    relation=relation,
+                    created_by=self.created_by,
+                )
+                for household in households
+                for person, relative, relation in household.relationships
+            ],
+            batch_size=self.batch_size,
+        )
+        return people, len(relationships)
+
+    @transaction.atomic
+    def generate_temperature_records(self, person_pks, record_date, count):
+        """Records the temperatures of `count` random people on `record_date`"""
+        from records.models import TemperatureRecord
+
+        started = timezone.now()
+        sample = self.random.sample(person_pks, min(count, len(person_pks)))
+        records = TemperatureRecord.objects.bulk_create(
+            [
+                TemperatureRecord(
+                    person_id=pk,
+                    body_temperature=self.get_body_temperature(),
+                    record_date=record_date,
+                    created_by=self.created_by,
+                )
+                for pk in sample
+            ],
+            batch_size=self.batch_size,
+        )
+        # `created_at` is always set to the current time by `bulk_create`
+        recorded_at = timezone.make_aware(
+            datetime.combine(record_date, datetime.min.time())
+        ) + timedelta(hours=RECORDING_HOUR)
+        TemperatureRecord.objects.filter(
+            record_date=record_date, created_at__gte=started
+        ).update(created_at=recorded_at, last_modified=recorded_at)
+        return len(records)
+
+    def get_household(self):
+        chance = self.random.random()
+        if chance < 0.2:
+            return Household([self.get_person(self.random.randint(18, 90))], [])
+
+        if chance < 0.3:
+            parent = self.get_person(self.random.randint(20, 55))
+            people = [parent] + self.get_children(parent, self.random.randint(1, 3))
+            relationships = [(0, i, PARENT_CHILD) for i in range(1, len(people))]
+            return Household(people, relationships)
+
+        age = self.random.randint(20, 60)
+        gender = self.random.choice([MALE, FEMALE])
+        partner = self.get_person(age, gender=gender)
+        other_gender = FEMALE if gender == MALE else MALE
+        relation = MARITAL if self.random.random() < 0.8 else ROMANTIC
+        last_name = partner.full_name.split()[-1] if relation == MARITAL else None
+        other_partner = self.get_person(
+            max(age + self.random.randint(-5, 5), AGE_OF_MAJORITY),
+            gender=other_gender,
+            last_name=last_name,
+        )
+        count = self.random.choices(range(len(CHILDREN_WEIGHTS)), CHILDREN_WEIGHTS)[0]
+        children = self.get_children(partner, count)
+        people = [partner, other_partner] + children
+        relationships = [(0, 1, relation)]
+        for i in range(2, len(people)):
+            relationships += [(0, i, PARENT_CHILD), (1, i, PARENT_CHILD)]
+        if len(children) > 1 and self.random.random() < 0.25:
+            relationships.append((2, 3, SIBLING))
+        if self.random.random() < 0.1:
+            grandparent_age = max(
+                self.get_age(partner) + self.random.randint(20, 35), AGE_OF_SENIORITY
+            )
+            last_name = partner.full_name.split()[-1]
+            people.append(self.get_person(grandparent_age, last_name=last_name))
+            relationships.append((len(people) - 1, 0, PARENT_CHILD))
+        return Household(people, relationships)
+
+    def get_children(self, parent, count):
+        oldest = max(self.get_age(parent) - AGE_OF_MAJORITY, 0)
+        last_name = parent.full_name.split()[-1]
+        return [
+            self.get_person(self.random.randint(0, oldest), last_name=last_name)
+            for _ in range(count)
+        ]
+
+    def get_person(self, age, gender=None, last_name=None):
+        from people.models import Person
+
+        gender = gender or self.random.choice([MALE, FEMALE])
+        if gender == MALE:
+            first_name = self.faker.first_name_male()
+        else:
+            first_name = self.faker.first_name_female()
+        last_name = last_name or self.faker.last_name()
+        self.sequence += 1
+
+        phone_number = None
+        if age >= AGE_OF_MAJORITY and self.random.random() < 0.8:
+            phone_number = "+2547" + self.faker.msisdn()[:8]
+        # a username of at most 50 characters, with up to 10 for the sequence
+        return Person(
+            username=f"{self.faker.user_name()[:39]}_{self.sequence}",
+            full_name=f"{first_name} {last_name}",
+            gender=gender,
+            dob=self.get_dob(age),
+            phone_number=phone_number,
+            created_by=self.created_by,
+        )
+
+    def get_dob(self, age):
+        # a day in the year of birthdays that make someone `age` years old today
+        latest = get_years_ago(age, today=self.today)
+        earliest = get_years_ago(age + 1, today=self.today) + timedelta(days=1)
+        days = self.random.randint(0, (latest - earliest).days)
+        return latest - timedelta(days=days)
+
+    def get_age(self, person):
+        return get_age(person.dob, today=self.today)
+
+    def get_body_temperature(self):
+        if self.random.random() < 0.02:
+            temperature = self.random.uniform(float(FEVER_THRESHOLD), 40.0)
+        else:
+            temperature = self.random.gauss(36.7, 0.3)
+        return Decimal(f"{temperature:.2f}")
@@ -0,0 +1,126 @@
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def get_delivery_connection(**kwargs):
+    """Returns a connection of the backend that delivers the queued emails"""
+    return get_connection(settings.EMAIL_QUEUE_BACKEND, **kwargs)
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    """Queues messages in the database for the `send_queued_email` worker.
+
+    Requests don't wait on the mail server this way. Messages that can't be
+    queued, like error reports sent while the database is unavailable, are
+    delivered right away with `EMAIL_QUEUE_BACKEND` instead.
+    """
+
+    def send_messages(self, email_messages):
+        from .models import QueuedEmail
+
+        email_messages = [message for message in email_messages if message.recipients()]
+        if not email_messages:
+            return 0
+
+        try:
+            with transaction.atomic():
+                QueuedEmail.objects.bulk_create(
+                    [QueuedEmail.from_message(message) for message in email_messages]
+                )
+        except DatabaseError:
+            logger.exception("Couldn't queue the emails, sending them instead")
+            delivery = get_delivery_connection(fail_silently=self.fail_silently)
+            return delivery.send_messages(email_messages)
+        return len(email_messages)
+
+
+@dataclass
+class DeliveryResult:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    def __bool__(self):
+        return bool(self.sent or self.retried or self.failed)
+
+    def __str__(self):
+        return (
+            f"Sent {self.sent} emails, {self.retried} will be retried "
+            f"and {self.failed} failed"
+        )
+
+
+def get_retry_delay(attempts):
+    """Doubles the wait before each retry"""
+    return timedelta(seconds=settings.EMAIL_QUEUE_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def schedule_retry(queued_email, error, result):
+    from .models import FAILED
+
+    queued_email.attempts += 1
+    queued_email.last_error = repr(error)
+    if queued_email.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+        queued_email.status = FAILED
+        result.failed += 1
+    else:
+        queued_email.next_attempt_at = timezone.now() + get_retry_delay(
+            queued_email.attempts
+        )
+        result.retried += 1
+
+
+def send_queued_emails(batch_size=None):
+    """Delivers a batch of the due emails over a single connection.
+
+    The batch's rows are locked until it has been delivered. On databases that
+    can skip locked rows, several workers can deliver different batches.
+    """
+    from .models import QueuedEmail
+
+    batch_size = batch_size or settings.EMAIL_QUEUE_BATCH_SIZE
+    result = DeliveryResult()
+    with transaction.atomic():
+        emails = QueuedEmail.objects.due()
+        if connection.features.has_select_for_update_skip_locked:
+            emails = emails.select_for_update(skip_locked=True)
+        emails = list(emails[:batch_size])
+        if not emails:
+            return result
+
+        sent, unsent = [], []
+        delivery = get_delivery_connection()
+        try:
+            delivery.open()
+        except Exception as e:
+            for email in emails:
+                schedule_retry(email, e, result)
+            unsent = emails
+        else:
+            try:
+                for email in emails:
+                    try:
+                        delivery.send_messages([email.get_message()])
+                    except Exception as e:
+                        schedule_retry(email, e, result)
+                        unsent.append(email)
+                    else:
+                        sent.append(email.pk)
+            finally:
+                delivery.close()
+
+        QueuedEmail.objects.filter(pk__in=sent).delete()
+        QueuedEmail.objects.bulk_update(
+            unsent, ["status", "attempts", "last_error", "next_attempt_at"]
+        )
+    result.sent = len(sent)
+    return result
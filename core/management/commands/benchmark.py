@@ -0,0 +1,158 @@
+import json
+import platform
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.utils import timezone
+
+from core.benchmarks import Benchmark, compare_results, get_commit
+from core.datasets import DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the critical request paths against generated datasets of "
+        "several sizes in a test database and saves the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000],
+            help="The numbers of people in the benchmarked datasets.",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=50, help="The timed requests per path."
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="The untimed requests per path."
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="The number of days of temperature records in the datasets.",
+        )
+        parser.add_argument(
+            "--daily-records",
+            type=int,
+            default=100,
+            help="The number of temperature records taken each day.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=1, help="The seed of the datasets."
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Serve the read-heavy pages from the cache as configured.",
+        )
+        parser.add_argument(
+            "--output", default="benchmark.json", help="The results' JSON file."
+        )
+        parser.add_argument(
+            "--compare", help="A previous results file to compare the results to."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10.0,
+            help="The percentage increase of a metric reported as a regression.",
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["compare"]:
+            try:
+                with open(options["compare"]) as file:
+                    baseline = json.load(file)
+            except (OSError, ValueError) as e:
+                raise CommandError(e)
+
+        results = {
+            "commit": get_commit(),
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "iterations": options["iterations"],
+            "sizes": self.run(options),
+        }
+        with open(options["output"], "w") as file:
+            json.dump(results, file, indent=2)
+        self.stdout.write(
+            self.style.SUCCESS(f"Saved the results to {options['output']}")
+        )
+
+        if baseline is not None:
+            self.write_comparison(baseline, results, options["threshold"])
+
+    def run(self, options):
+        settings = {
+            "CACHES": {
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+            },
+            "REQUEST_TIMING_SAMPLE_RATE": 0.0,
+        }
+        if not options["cache"]:
+            settings["VIEW_CACHE_TIMEOUT"] = 0
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with override_settings(**settings):
+                return self.run_sizes(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def run_sizes(self, options):
+        from people.models import Person
+
+        generator = DatasetGenerator(seed=options["seed"])
+        benchmark = Benchmark(
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            seed=options["seed"],
+        )
+        sizes = {}
+        generated = 0
+        for size in sorted(set(options["sizes"])):
+            # each dataset adds people and a history of records to the last one
+            generator.generate(
+                size - generated,
+                days=options["days"],
+                daily_records=options["daily_records"],
+            )
+            generated = Person.objects.count()
+            self.stdout.write(f"Benchmarking {generated} people...")
+            sizes[str(size)] = summaries = benchmark.run()
+            for scenario, summary in summaries.items():
+                self.stdout.write(
+                    f"  {scenario}: p50={summary['p50']}ms p95={summary['p95']}ms "
+                    f"queries={summary['queries']} "
+                    f"peak_memory={summary['peak_memory_kb']}KiB"
+                )
+        return sizes
+
+    def write_comparison(self, baseline, results, threshold):
+        self.stdout.write(f"Compared to {baseline.get('commit') or 'the baseline'}:")
+        regressions = 0
+        for size, scenario, metric, old, new, change, regressed in compare_results(
+            baseline, results, threshold
+        ):
+            line = f"  {size} {scenario} {metric}: {old} -> {new} ({change:+.1f}%)"
+            if regressed:
+                regressions += 1
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+        self.stdout.write(f"{regressions} regressions above {threshold}%")
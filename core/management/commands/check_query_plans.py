@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.query_plans import explain, get_hot_queries
+
+
+class Command(BaseCommand):
+    help = "Checks that the database serves the hot queries with their indexes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--disable-seqscan",
+            action="store_true",
+            help="Discourage sequential scans on PostgreSQL, to check the indexes "
+            + "of a database without many rows.",
+        )
+        parser.add_argument(
+            "--plans", action="store_true", help="Print the plans of all queries."
+        )
+
+    def handle(self, *args, **options):
+        plans = explain(get_hot_queries(), disable_seqscan=options["disable_seqscan"])
+        missing = 0
+        for plan in plans:
+            line = f"{plan.query.name}: {plan.query.index}"
+            if plan.uses_index:
+                self.stdout.write(self.style.SUCCESS(f"OK {line}"))
+            else:
+                missing += 1
+                self.stdout.write(self.style.ERROR(f"MISSING {line}"))
+            if options["plans"] or not plan.uses_index:
+                self.stdout.write(plan.plan)
+
+        if missing:
+            raise CommandError(f"{missing} queries don't use their indexes")
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+
+from core.exports import EXPORT_STREAMS, stream_export
+
+EXPORT_VIEWS = {
+    "people": "people.views.PeopleExportView",
+    "relationships": "people.views.RelationshipsExportView",
+    "temperature_records": "records.views.TemperatureRecordsExportView",
+}
+
+
+class Command(BaseCommand):
+    help = "Streams people, relationships or temperature records as CSV or JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=EXPORT_VIEWS.keys())
+        parser.add_argument(
+            "--format", choices=EXPORT_STREAMS.keys(), default="csv", dest="format"
+        )
+        parser.add_argument(
+            "--search", default="", help="The list view's search query."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, help="The number of rows fetched at a time."
+        )
+        parser.add_argument(
+            "--output", help="The file to write to. Defaults to standard output."
+        )
+
+    def get_view(self, model, search):
+        # build the same queryset the export view would for a search request
+        request = HttpRequest()
+        request.GET = request.GET.copy()
+        if search:
+            request.GET["q"] = search
+        view = import_string(EXPORT_VIEWS[model])()
+        view.setup(request)
+        return view
+
+    def handle(self, *args, **options):
+        view = self.get_view(options["model"], options["search"])
+        rows = stream_export(
+            options["format"],
+            view.get_export_queryset(),
+            view.get_export_fields(),
+            options["chunk_size"] or view.export_chunk_size,
+        )
+        if options["output"] is None:
+            for row in rows:
+                self.stdout.write(row, ending="")
+            return
+
+        try:
+            with open(options["output"], "w", newline="") as output:
+                output.writelines(rows)
+        except OSError as e:
+            raise CommandError(e)
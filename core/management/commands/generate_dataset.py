@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from core.datasets import DatasetGenerator
+from core.management.utils import get_user
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates people in households, their relationships and their daily "
+        "temperature records for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("people", type=int, help="The number of people.")
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="The number of days of temperature records, up to today.",
+        )
+        parser.add_argument(
+            "--daily-records",
+            type=int,
+            default=100,
+            help="The number of temperature records taken each day.",
+        )
+        parser.add_argument(
+            "--seed", type=int, help="Generates the same dataset for a seed."
+        )
+        parser.add_argument(
+            "--created-by", help="The email address of the user adding the rows."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, help="The number of rows saved at a time."
+        )
+
+    def handle(self, *args, **options):
+        generator = DatasetGenerator(
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            created_by=get_user(options["created_by"]),
+        )
+        result = generator.generate(
+            options["people"],
+            days=options["days"],
+            daily_records=options["daily_records"],
+        )
+        self.stdout.write(self.style.SUCCESS(str(result)))
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.mail import DeliveryResult, send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Delivers the queued emails in batches, retrying the ones that fail."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, help="The number of emails sent at a time."
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep delivering the emails as they're queued.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="The seconds to wait for new emails when the queue is empty.",
+        )
+
+    def send_batches(self, batch_size):
+        total = DeliveryResult()
+        while result := send_queued_emails(batch_size):
+            total.sent += result.sent
+            total.retried += result.retried
+            total.failed += result.failed
+        return total
+
+    def handle(self, *args, **options):
+        while True:
+            result = self.send_batches(options["batch_size"])
+            if result or not options["loop"]:
+                self.stdout.write(str(result))
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,21 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+
+
+def get_user(email):
+    """Returns the user with `email` for a command's `--created-by` option"""
+    if email is None:
+        return None
+    try:
+        return get_user_model().objects.get(email=email)
+    except get_user_model().DoesNotExist:
+        raise CommandError(f"A user with email '{email}' does not exist")
+
+
+def write_import_result(command, result):
+    """Writes the errors of an import's rows to stderr and its summary to stdout"""
+    for error in result.errors:
+        for field, messages in error.errors.items():
+            for message in messages:
+                command.stderr.write(f"Row {error.row}: {field}: {message}")
+    command.stdout.write(command.style.SUCCESS(str(result)))
@@ -0,0 +1,121 @@
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("core.timing")
+
+
+class QueryTimer:
+    """A database execute wrapper that counts queries and adds up their time"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+class RequestTimingMiddleware:
+    """Measures the queries, database time, rendering time and total time of
+    a sample of the requests.
+
+    The timings are added to the response as `Server-Timing` headers and logged
+    to the `core.timing` logger. A warning is logged when a request exceeds a
+    budget in `REQUEST_TIMING_BUDGETS`, which maps URL names to the maximum
+    `queries` and milliseconds of `db`, `render` and `total` time.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def is_sampled(self):
+        rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        return rate >= 1 or random.random() < rate
+
+    def __call__(self, request):
+        if not self.is_sampled():
+            return self.get_response(request)
+
+        timer = QueryTimer()
+        request._render_timing = {}
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        render = request._render_timing.get("duration", 0.0)
+        timings = {
+            "queries": timer.count,
+            "db": timer.duration * 1000,
+            "render": render * 1000,
+            "total": total * 1000,
+        }
+        response["Server-Timing"] = self.get_server_timing(timings)
+        self.log(request, response, timings)
+        return response
+
+    def process_template_response(self, request, response):
+        timing = getattr(request, "_render_timing", None)
+        if timing is None:
+            return response
+
+        start = time.perf_counter()
+
+        def stop_timer(response):
+            timing["duration"] = time.perf_counter() - start
+
+        response.add_post_render_callback(stop_timer)
+        return response
+
+    @staticmethod
+    def get_server_timing(timings):
+        return ", ".join(
+            [
+                f'db;dur={timings["db"]:.1f};desc="{timings["queries"]} queries"',
+                f'render;dur={timings["render"]:.1f}',
+                f'total;dur={timings["total"]:.1f}',
+            ]
+        )
+
+    @staticmethod
+    def get_url_name(request):
+        match = getattr(request, "resolver_match", None)
+        return match.view_name if match else None
+
+    def log(self, request, response, timings):
+        url_name = self.get_url_name(request)
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "url_name": url_name,
+            "status": response.status_code,
+            **{key: round(value, 1) for key, value in timings.items()},
+        }
+        message = " ".join(f"{key}={value}" for key, value in data.items())
+        logger.info(message, extra={"timing": data})
+
+        budget = settings.REQUEST_TIMING_BUDGETS.get(url_name, {})
+        exceeded = [
+            f"{key}={data[key]} (budget {limit})"
+            for key, limit in budget.items()
+            if data.get(key, 0) > limit
+        ]
+        if exceeded:
+            logger.warning(
+                "%s exceeded its budget: %s",
+                url_name,
+                ", ".join(exceeded),
+                extra={"timing": data},
+            )
@@ -0,0 +1,56 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("message", models.BinaryField(help_text="The pickled email message.")),
+                ("subject", models.CharField(max_length=998)),
+                ("recipients", models.TextField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("P", "Pending"), ("F", "Failed")],
+                        default="P",
+                        max_length=1,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "core_queued_email",
+                "ordering": ["next_attempt_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="queuedemail",
+            index=models.Index(
+                fields=["status", "next_attempt_at"], name="core_queued_email_due_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,63 @@
+import pickle
+
+from django.db import models
+from django.utils import timezone
+
+PENDING, FAILED = "P", "F"
+QUEUED_EMAIL_STATUS_CHOICES = [(PENDING, "Pending"), (FAILED, "Failed")]
+
+
+class QueuedEmailQuerySet(models.QuerySet):
+    def due(self):
+        """The pending emails whose next delivery attempt is due"""
+        return self.filter(status=PENDING, next_attempt_at__lte=timezone.now())
+
+
+class QueuedEmail(models.Model):
+    """An email waiting to be delivered by the `send_queued_email` command.
+
+    Delivered emails are deleted. Emails that can't be delivered after
+    `EMAIL_QUEUE_MAX_ATTEMPTS` attempts are kept as failed.
+    """
+
+    message = models.BinaryField(help_text="The pickled email message.")
+    subject = models.CharField(max_length=998)
+    recipients = models.TextField()
+    status = models.CharField(
+        max_length=1, choices=QUEUED_EMAIL_STATUS_CHOICES, default=PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = QueuedEmailQuerySet.as_manager()
+
+    class Meta:  # noqa
+        db_table = "core_queued_email"
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="core_queued_email_due_idx"
+            ),
+        ]
+        ordering = ["next_attempt_at"]
+
+    def __str__(self):
+        return f"{self.subject} to {self.recipients}"
+
+    @classmethod
+    def from_message(cls, email_message):
+        # the message's connection can't be pickled and is replaced on delivery
+        connection, email_message.connection = email_message.connection, None
+        try:
+            message = pickle.dumps(email_message)
+        finally:
+            email_message.connection = connection
+        return cls(
+            message=message,
+            subject=str(email_message.subject)[:998],
+            recipients=", ".join(email_message.recipients()),
+        )
+
+    def get_message(self):
+        return pickle.loads(self.message)
@@ -0,0 +1,190 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.http import Http404
+from django.utils.functional import cached_property
+
+INVALID_CURSOR_ERROR = "Invalid cursor"
+
+
+class CursorPaginator:
+    """Paginates a queryset by seeking past the ordering values of a row.
+
+    Unlike Django's `Paginator`, fetching a page neither counts the rows nor
+    skips over the preceding ones with an `OFFSET`, so navigating to the next or
+    previous page costs the same no matter how deep the page is. The ordering
+    fields must uniquely identify a row and none of them may be null.
+    """
+
+    cursor_based = True
+
+    def __init__(self, queryset, per_page, ordering, count=False):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = list(ordering)
+        self.with_count = count
+
+    @cached_property
+    def count(self):
+        """The total number of rows, or `None` if it wasn't requested"""
+        if not self.with_count:
+            return None
+        return self.queryset.count()
+
+    def encode_cursor(self, obj, reverse=False):
+        values = [self._get_value(obj, field) for field in self.ordering]
+        data = json.dumps([reverse, values], default=str).encode()
+        return base64.urlsafe_b64encode(data).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            data = base64.urlsafe_b64decode(cursor.encode())
+            reverse, values = json.loads(data)
+        except (binascii.Error, TypeError, UnicodeError, ValueError):
+            raise InvalidPage(INVALID_CURSOR_ERROR)
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidPage(INVALID_CURSOR_ERROR)
+        return bool(reverse), values
+
+    def page(self, cursor=None):
+        if not cursor:
+            return self._page(self.queryset.order_by(*self.ordering))
+
+        reverse, values = self.decode_cursor(cursor)
+        try:
+            queryset = self.queryset.filter(self._get_seek_filter(values, reverse))
+        except (ValidationError, ValueError, TypeError):
+            raise InvalidPage(INVALID_CURSOR_ERROR)
+
+        if not reverse:
+            queryset = queryset.order_by(*self.ordering)
+            return self._page(queryset, has_previous=True)
+
+        ordering = [self._reverse_field(field) for field in self.ordering]
+        return self._page(queryset.order_by(*ordering), has_next=True, reverse=True)
+
+    def _page(self, queryset, has_next=False, has_previous=False, reverse=False):
+        object_list = list(queryset[: self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if reverse:
+            object_list.reverse()
+            has_previous = has_more
+        else:
+            has_next = has_more
+        return CursorPage(object_list, self, has_next, has_previous)
+
+    def _get_seek_filter(self, values, reverse):
+        """Builds `(f1 > v1) OR (f1 = v1 AND f2 > v2) OR ...` for the ordering"""
+        filters = []
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            equal = {f.lstrip("-"): v for f, v in zip(self.ordering, values[:index])}
+            filters.append(Q(**equal, **{f"{name}__{lookup}": values[index]}))
+        return reduce(or_, filters)
+
+    @staticmethod
+    def _reverse_field(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _get_value(obj, field):
+        value = obj
+        for attr in field.lstrip("-").split("__"):
+            value = getattr(value, attr)
+        return value
+
+
+class CursorPage(Sequence):
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f"<Page of {len(self)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous():
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], reverse=True)
+
+
+class CursorPaginationMixin:
+    """Opt-in keyset pagination for a `ListView`.
+
+    Cursor pagination is used when `cursor_pagination` (or, if it's `None`, the
+    `CURSOR_PAGINATION` setting) is true. Otherwise the view falls back to
+    Django's page number pagination.
+    """
+
+    cursor_kwarg = "cursor"
+    cursor_ordering = None
+    cursor_pagination = None
+    cursor_pagination_count = None
+
+    def get_cursor_pagination(self):
+        if self.cursor_pagination is None:
+            return settings.CURSOR_PAGINATION
+        return self.cursor_pagination
+
+    def get_cursor_pagination_count(self):
+        if self.cursor_pagination_count is None:
+            return settings.CURSOR_PAGINATION_COUNT
+        return self.cursor_pagination_count
+
+    def get_cursor_ordering(self):
+        if self.cursor_ordering is None:
+            return [*self.model._meta.ordering, "pk"]
+        return self.cursor_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.get_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset,
+            page_size,
+            self.get_cursor_ordering(),
+            count=self.get_cursor_pagination_count(),
+        )
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        try:
+            page = paginator.page(cursor)
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return (paginator, page, page.object_list, page.has_other_pages())
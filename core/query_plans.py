@@ -0,0 +1,140 @@
+"""
+The project's hot queries and the indexes that should serve them.
+
+The queries are explained by the database, and a query whose plan doesn't
+mention its index is reported by the `check_query_plans` command.
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+
+@dataclass
+class HotQuery:
+    name: str
+    index: str
+    get_queryset: Callable
+
+
+@dataclass
+class QueryPlan:
+    query: HotQuery
+    plan: str
+    index_names: set
+
+    @property
+    def uses_index(self):
+        return any(name in self.plan for name in self.index_names)
+
+
+def get_index_names(table, index):
+    """The names of `index` in the database's plans.
+
+    SQLite serves unique constraints with `sqlite_autoindex_*` indexes, which are
+    matched to the constraint by their columns.
+    """
+    names = {index}
+    if connection.vendor != "sqlite":
+        return names
+
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+        columns = constraints.get(index, {}).get("columns")
+        cursor.execute(f"PRAGMA index_list({quote_name(table)})")
+        for name in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"PRAGMA index_info({quote_name(name)})")
+            if [row[2] for row in cursor.fetchall()] == columns:
+                names.add(name)
+    return names
+
+
+def get_hot_queries():
+    from people.models import InterpersonalRelationship, Person
+    from records.models import TemperatureRecord
+
+    # the plans don't depend on the rows the values match, and the querysets
+    # aren't ordered so the planner can't prefer an index for the ordering
+    pk, today = 1, timezone.localdate()
+    since = timezone.now() - timedelta(days=1)
+    return [
+        HotQuery(
+            "person by username",
+            "people_unique_person_lower_username",
+            lambda: Person.objects.with_username("username").order_by(),
+        ),
+        HotQuery(
+            "people added by a user",
+            "people_person_creator_idx",
+            lambda: Person.objects.filter(created_by=pk)
+            .values("pk", "full_name")
+            .order_by(),
+        ),
+        HotQuery(
+            "people added since",
+            "people_person_created_idx",
+            lambda: Person.objects.filter(created_at__gte=since).order_by(),
+        ),
+        HotQuery(
+            "people in an age category",
+            "people_person_dob_idx",
+            lambda: Person.objects.in_age_category("child").order_by(),
+        ),
+        HotQuery(
+            "relationships of a person",
+            "people_unique_interpersonalrelationship",
+            lambda: InterpersonalRelationship.objects.filter(person=pk).order_by(),
+        ),
+        HotQuery(
+            "relationships of a kind added since",
+            "people_rel_relation_idx",
+            lambda: InterpersonalRelationship.objects.filter(
+                relation="PC", created_at__gte=since
+            ).order_by(),
+        ),
+        HotQuery(
+            "temperature records of a person",
+            "records_temp_person_time_idx",
+            lambda: TemperatureRecord.objects.filter(person=pk).order_by("created_at"),
+        ),
+        HotQuery(
+            "temperature record of a person on a day",
+            "records_unique_daily_temperaturerecord",
+            lambda: TemperatureRecord.objects.filter(
+                person=pk, record_date=today
+            ).order_by(),
+        ),
+        HotQuery(
+            "temperature records of a day",
+            "records_temp_date_idx",
+            lambda: TemperatureRecord.objects.filter(record_date=today).order_by(),
+        ),
+        HotQuery(
+            "temperature records added since",
+            "records_temp_created_idx",
+            lambda: TemperatureRecord.objects.filter(created_at__gte=since).order_by(),
+        ),
+    ]
+
+
+def explain(queries, disable_seqscan=False):
+    """Returns the plans of `queries`.
+
+    The PostgreSQL planner prefers sequential scans of small tables.
+    `disable_seqscan` discourages them, to check that the indexes can serve the
+    queries on a database without many rows.
+    """
+    with transaction.atomic():
+        if disable_seqscan and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        plans = []
+        for query in queries:
+            queryset = query.get_queryset()
+            index_names = get_index_names(queryset.model._meta.db_table, query.index)
+            plans.append(QueryPlan(query, queryset.explain(), index_names))
+        return plans
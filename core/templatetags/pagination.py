@@ -0,0 +1,19 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def query_string(context, **params):
+    """The request's query string with `params` replacing its parameters.
+
+    Parameters set to `None` are removed, so a page link keeps the list's search
+    and filters, e.g. `{% query_string page=2 cursor=None %}`.
+    """
+    query = context["request"].GET.copy()
+    for key, value in params.items():
+        if value is None:
+            query.pop(key, None)
+        else:
+            query[key] = value
+    return f"?{query.urlencode()}" if query else ""
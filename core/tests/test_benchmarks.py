@@ -0,0 +1,64 @@
+from collections import Counter
+
+from django.test import TestCase, override_settings
+
+from core.benchmarks import SCENARIOS, Benchmark, compare_results, summarize
+from core.datasets import DatasetGenerator
+
+
+class SummarizeTestCase(TestCase):
+    def test_summarize(self):
+        latencies = [i / 1000 for i in range(1, 101)]
+        queries = [3] * 99 + [10]
+        summary = summarize(latencies, queries, Counter({200: 100}), 2048)
+        self.assertEqual(summary["p50"], 50.5)
+        self.assertEqual(summary["p99"], 99.01)
+        self.assertEqual(summary["queries"], 3)
+        self.assertEqual(summary["max_queries"], 10)
+        self.assertEqual(summary["peak_memory_kb"], 2.0)
+        self.assertEqual(summary["statuses"], {"200": 100})
+
+
+class CompareResultsTestCase(TestCase):
+    def test_compare_results(self):
+        baseline = {"sizes": {"10": {"people_list": {"p95": 10.0, "queries": 4}}}}
+        results = {
+            "sizes": {
+                "10": {"people_list": {"p95": 10.5, "queries": 6}},
+                "100": {"people_list": {"p95": 20.0, "queries": 4}},
+            }
+        }
+        self.assertEqual(
+            list(compare_results(baseline, results)),
+            [
+                ("10", "people_list", "p95", 10.0, 10.5, 5.0, False),
+                ("10", "people_list", "queries", 4, 6, 50.0, True),
+            ],
+        )
+
+
+@override_settings(VIEW_CACHE_TIMEOUT=0)
+class BenchmarkTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        DatasetGenerator(seed=1).generate(20, days=2, daily_records=5)
+
+    def test_run(self):
+        results = Benchmark(iterations=2, warmup=1, seed=1).run()
+        self.assertEqual(list(results), SCENARIOS)
+        for scenario in [
+            "people_list",
+            "person_detail",
+            "temperature_records_list",
+            "temperature_history",
+        ]:
+            self.assertEqual(results[scenario]["statuses"], {"200": 2})
+        for scenario in ["person_create", "relationship_create"]:
+            self.assertEqual(results[scenario]["statuses"], {"302": 2})
+        self.assertGreater(results["people_list"]["queries"], 0)
+
+    def test_too_few_iterations(self):
+        with self.assertRaises(ValueError):
+            Benchmark(iterations=1)
@@ -0,0 +1,193 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+from django.views.generic import View
+
+from accounts.factories import UserFactory
+from core.cache import (
+    CachePageMixin,
+    bump_cache_version,
+    get_cache_versions,
+    get_permissions_key,
+)
+from people import views
+from people.factories import PersonFactory
+from people.models import InterpersonalRelationship, Person
+from records.models import TemperatureRecord
+
+
+class CacheVersionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_initial_versions(self):
+        self.assertEqual(get_cache_versions([Person, TemperatureRecord]), [1, 1])
+
+    def test_bump_version(self):
+        bump_cache_version(Person)
+        bump_cache_version(Person)
+        self.assertEqual(get_cache_versions([Person, TemperatureRecord]), [3, 1])
+
+    def test_signals(self):
+        person = PersonFactory()
+        self.assertEqual(get_cache_versions([Person]), [2])
+        person.delete()
+        self.assertEqual(get_cache_versions([Person]), [3])
+
+    def test_number_of_cache_reads(self):
+        with patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+            get_cache_versions([Person, InterpersonalRelationship, TemperatureRecord])
+        get_many.assert_called_once()
+
+
+class GetPermissionsKeyTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.view_person = Permission.objects.filter(name="Can view person")
+
+    def test_same_permissions(self):
+        user = UserFactory(user_permissions=tuple(self.view_person))
+        other_user = UserFactory(user_permissions=tuple(self.view_person))
+        self.assertEqual(get_permissions_key(user), get_permissions_key(other_user))
+
+    def test_different_permissions(self):
+        user = UserFactory(user_permissions=tuple(self.view_person))
+        self.assertNotEqual(
+            get_permissions_key(user), get_permissions_key(UserFactory())
+        )
+
+    def test_personal_details(self):
+        user, other_user = UserFactory(), UserFactory()
+        PersonFactory(user=user)
+        self.assertNotEqual(get_permissions_key(user), get_permissions_key(other_user))
+
+    def test_anonymous_user(self):
+        self.assertEqual(get_permissions_key(AnonymousUser()), "anonymous")
+
+
+class CountingView(CachePageMixin, View):
+    calls = 0
+
+    def get(self, request, *args, **kwargs):
+        CountingView.calls += 1
+        return HttpResponse(f"call {CountingView.calls}")
+
+    post = get
+
+
+class CachePageMixinTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.user = UserFactory()
+
+    def setUp(self):
+        cache.clear()
+        CountingView.calls = 0
+        self.factory = RequestFactory()
+        self.view_func = CountingView.as_view(cache_models=[Person])
+
+    def get(self, path="dummy_path", user=None):
+        request = self.factory.get(path)
+        request.user = user or self.user
+        return self.view_func(request).content.decode()
+
+    def test_cached_response(self):
+        self.assertEqual(self.get(), "call 1")
+        self.assertEqual(self.get(), "call 1")
+
+    def test_query_string(self):
+        self.get()
+        self.assertEqual(self.get("dummy_path?q=jane"), "call 2")
+
+    def test_invalidation(self):
+        self.get()
+        PersonFactory()
+        self.assertEqual(self.get(), "call 2")
+
+    def test_shared_by_users_with_same_permissions(self):
+        self.get()
+        self.assertEqual(self.get(user=UserFactory()), "call 1")
+
+    def test_varies_on_permissions(self):
+        self.get()
+        view_person = Permission.objects.filter(name="Can view person")
+        user = UserFactory(user_permissions=tuple(view_person))
+        self.assertEqual(self.get(user=user), "call 2")
+
+    def test_pending_messages(self):
+        request = self.factory.get("dummy_path")
+        request.user = self.user
+        request._messages = ["A pending message"]
+        self.view_func(request)
+        self.view_func(request)
+        self.assertEqual(CountingView.calls, 2)
+
+    def test_post(self):
+        request = self.factory.post("dummy_path")
+        request.user = self.user
+        self.view_func(request)
+        self.view_func(request)
+        self.assertEqual(CountingView.calls, 2)
+
+
+class CachedViewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        view_person = Permission.objects.filter(name="Can view person")
+        cls.user = UserFactory(user_permissions=tuple(view_person))
+        cls.person = PersonFactory()
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get("dummy_path")
+        self.request.user = self.user
+        self.view_func = views.PersonDetailView.as_view()
+
+    def test_number_of_queries(self):
+        self.view_func(self.request, username=self.person.username).render()
+        # the user's permissions and personal details were memoized by the first
+        # request, so the page is served without touching the database
+        with self.assertNumQueries(0):
+            self.view_func(self.request, username=self.person.username)
+
+    def test_updated_person(self):
+        self.view_func(self.request, username=self.person.username).render()
+        self.person.full_name = "Updated Name"
+        self.person.save()
+        response = self.view_func(self.request, username=self.person.username)
+        response.render()
+        self.assertIn("Updated Name", response.content.decode())
+
+
+class SidebarCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def render_sidebar(self, user, permissions_cache_key=None):
+        request = RequestFactory().get("dummy_path")
+        request.user = user
+        context = {}
+        if permissions_cache_key is not None:
+            context["permissions_cache_key"] = permissions_cache_key
+        return render_to_string("_sidebar.html", context, request=request)
+
+    def test_sidebar_is_cached_by_permissions(self):
+        user = UserFactory()
+        view_person = Permission.objects.filter(name="Can view person")
+        other_user = UserFactory(user_permissions=tuple(view_person))
+        sidebar = self.render_sidebar(user)
+        self.assertNotIn("All people", sidebar)
+        self.assertEqual(
+            self.render_sidebar(other_user, get_permissions_key(user)), sidebar
+        )
+        self.assertIn("All people", self.render_sidebar(other_user))
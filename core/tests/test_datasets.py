@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase
+
+from core.datasets import DatasetGenerator
+from people.constants import FAMILIAL_RELATIONSHIPS
+from people.models import InterpersonalRelationship, Person, PersonNameToken
+from people.utils import get_age
+from records.models import DailyTemperatureSummary, TemperatureRecord
+
+
+class DatasetGeneratorTestCase(TestCase):
+    today = date(2021, 6, 30)
+
+    def generate(self, people=50, seed=1, **kwargs):
+        generator = DatasetGenerator(seed=seed, batch_size=20, today=self.today)
+        return generator.generate(people, **kwargs)
+
+    def test_people(self):
+        result = self.generate()
+        self.assertEqual(result.people, Person.objects.count())
+        self.assertGreaterEqual(result.people, 50)
+        for person in Person.objects.all():
+            self.assertGreaterEqual(len(person.full_name.split()), 2)
+            self.assertLessEqual(person.dob, self.today)
+        self.assertTrue(PersonNameToken.objects.exists())
+
+    def test_dob(self):
+        for today in [self.today, date(2024, 2, 29), date(2023, 3, 1)]:
+            generator = DatasetGenerator(seed=1, today=today)
+            for age in range(0, 100):
+                with self.subTest(today=today, age=age):
+                    for _ in range(10):
+                        dob = generator.get_dob(age)
+                        self.assertEqual(get_age(dob, today=today), age)
+
+    def test_relationships(self):
+        result = self.generate()
+        self.assertEqual(
+            result.relationships, InterpersonalRelationship.objects.count()
+        )
+        parent_child = FAMILIAL_RELATIONSHIPS[0][0]
+        relationships = InterpersonalRelationship.objects.filter(
+            relation=parent_child
+        ).select_related("person", "relative")
+        self.assertTrue(relationships)
+        for relationship in relationships:
+            self.assertLess(relationship.person.dob, relationship.relative.dob)
+
+    def test_seeded(self):
+        self.generate()
+        usernames = list(Person.objects.values_list("username", flat=True))
+        Person.objects.all().delete()
+        self.generate()
+        self.assertEqual(
+            list(Person.objects.values_list("username", flat=True)), usernames
+        )
+
+    def test_generate_again_with_same_seed(self):
+        first_result = self.generate()
+        second_result = self.generate()
+        self.assertEqual(
+            Person.objects.count(), first_result.people + second_result.people
+        )
+
+    def test_temperature_records(self):
+        result = self.generate(days=3, daily_records=10)
+        self.assertEqual(result.temperature_records, 30)
+        dates = TemperatureRecord.objects.values("record_date").annotate(
+            count=Count("pk")
+        )
+        self.assertEqual(
+            {row["record_date"]: row["count"] for row in dates},
+            {self.today - timedelta(days=days): 10 for days in range(3)},
+        )
+        for record in TemperatureRecord.objects.all():
+            self.assertEqual(record.created_at.date(), record.record_date)
+        totals = DailyTemperatureSummary.objects.values_list("count", flat=True)
+        self.assertEqual(sum(totals), 30)
+
+    def test_number_of_queries(self):
+        # a savepoint and an insert of the people, name tokens and relationships
+        with self.assertNumQueries(5):
+            DatasetGenerator(seed=1, batch_size=1000).generate_people(60)
+
+
+class GenerateDatasetCommandTestCase(TestCase):
+    def test_generate_dataset(self):
+        stdout = StringIO()
+        call_command(
+            "generate_dataset", "20", "--days=2", "--daily-records=5", stdout=stdout
+        )
+        self.assertIn("10 temperature records", stdout.getvalue())
+        self.assertEqual(TemperatureRecord.objects.count(), 10)
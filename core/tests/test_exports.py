@@ -0,0 +1,160 @@
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.exceptions import PermissionDenied
+from django.core.management import call_command
+from django.http import Http404
+from django.test import RequestFactory, TestCase
+
+from accounts.factories import UserFactory
+from core.exports import stream_csv, stream_export, stream_json
+from people import views as people_views
+from people.factories import InterpersonalRelationshipFactory, PersonFactory
+from people.models import Person
+from records import views as records_views
+from records.factories import TemperatureRecordFactory
+
+
+class StreamExportTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.people = PersonFactory.create_batch(3, phone_number="+254712345678")
+        cls.queryset = Person.objects.order_by("username")
+        cls.fields = {"username": "username", "phone": "phone_number", "dob": "dob"}
+
+    def test_csv(self):
+        output = "".join(stream_csv(self.queryset, self.fields))
+        rows = list(csv.reader(output.splitlines()))
+        self.assertEqual(rows[0], ["username", "phone", "dob"])
+        self.assertEqual(
+            rows[1:],
+            [
+                [person.username, "+254712345678", str(person.dob)]
+                for person in self.queryset
+            ],
+        )
+
+    def test_json(self):
+        data = json.loads("".join(stream_json(self.queryset, self.fields)))
+        self.assertEqual(
+            data,
+            [
+                {
+                    "username": person.username,
+                    "phone": "+254712345678",
+                    "dob": person.dob.isoformat(),
+                }
+                for person in self.queryset
+            ],
+        )
+
+    def test_empty_json(self):
+        queryset = Person.objects.none()
+        self.assertEqual(json.loads("".join(stream_json(queryset, self.fields))), [])
+
+    def test_rows_are_streamed(self):
+        rows = stream_csv(self.queryset, self.fields, chunk_size=1)
+        with self.assertNumQueries(0):
+            next(rows)
+        with self.assertNumQueries(1):
+            list(rows)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            stream_export("xml", self.queryset, self.fields)
+
+
+class ExportMixinTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        view_temp = Permission.objects.filter(name="Can view temperature record")
+        cls.user = UserFactory(user_permissions=tuple(view_temp))
+        cls.jane = PersonFactory(username="jane", full_name="Jane Doe")
+        cls.john = PersonFactory(username="john", full_name="John Smith")
+        TemperatureRecordFactory(person=cls.jane)
+        TemperatureRecordFactory(person=cls.john)
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.view_func = records_views.TemperatureRecordsExportView.as_view()
+
+    def build_get_request(self, data=None, user=None):
+        request = self.factory.get("dummy_path", data=data)
+        request.user = user or self.user
+        return request
+
+    def test_csv_response(self):
+        response = self.view_func(self.build_get_request())
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="temperature_records.csv"',
+        )
+        rows = list(csv.reader(b"".join(response).decode().splitlines()))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row[0] for row in rows[1:]], ["jane", "john"])
+
+    def test_json_response(self):
+        response = self.view_func(self.build_get_request({"format": "json"}))
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = json.loads(b"".join(response))
+        self.assertEqual([row["person"] for row in data], ["jane", "john"])
+
+    def test_search_query(self):
+        response = self.view_func(self.build_get_request({"q": "smith"}))
+        rows = list(csv.reader(b"".join(response).decode().splitlines()))
+        self.assertEqual([row[0] for row in rows[1:]], ["john"])
+
+    def test_invalid_format(self):
+        with self.assertRaises(Http404):
+            self.view_func(self.build_get_request({"format": "xml"}))
+
+    def test_anonymous_user(self):
+        request = self.build_get_request()
+        request.user = AnonymousUser()
+        response = self.view_func(request)
+        self.assertEqual(response.status_code, 302)
+
+    def test_user_without_permission(self):
+        with self.assertRaises(PermissionDenied):
+            self.view_func(self.build_get_request(user=UserFactory()))
+
+
+class ExportCommandTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.jane = PersonFactory(username="jane", full_name="Jane Doe")
+        cls.john = PersonFactory(username="john", full_name="John Smith")
+        InterpersonalRelationshipFactory(person=cls.jane, relative=cls.john)
+
+    def call_command(self, *args, **kwargs):
+        stdout = io.StringIO()
+        call_command("export", *args, stdout=stdout, **kwargs)
+        return stdout.getvalue()
+
+    def test_people(self):
+        rows = list(csv.reader(self.call_command("people").splitlines()))
+        self.assertEqual(rows[0], list(people_views.PeopleExportView.export_fields))
+        self.assertEqual([row[0] for row in rows[1:]], ["jane", "john"])
+
+    def test_search(self):
+        output = self.call_command("people", "--format=json", "--search=smith")
+        self.assertEqual([row["username"] for row in json.loads(output)], ["john"])
+
+    def test_output_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "relationships.csv"
+            self.call_command("relationships", f"--output={path}")
+            rows = list(csv.reader(path.read_text().splitlines()))
+        self.assertEqual(rows[1][:2], ["jane", "john"])
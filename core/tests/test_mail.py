@@ -0,0 +1,112 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.mail import send_queued_emails
+from core.models import FAILED, PENDING, QueuedEmail
+
+LOCMEM_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+
+def queue_email(subject="Hello", to=("jane@example.com",)):
+    send_mail(subject, "Body", "church@example.com", list(to))
+
+
+@override_settings(
+    EMAIL_BACKEND="core.mail.QueuedEmailBackend",
+    EMAIL_QUEUE_BACKEND=LOCMEM_BACKEND,
+    EMAIL_QUEUE_MAX_ATTEMPTS=2,
+    EMAIL_QUEUE_RETRY_DELAY=60,
+)
+class QueuedEmailBackendTestCase(TestCase):
+    def test_queues_messages(self):
+        queue_email()
+        self.assertEqual(mail.outbox, [])
+        email = QueuedEmail.objects.get()
+        self.assertEqual(email.subject, "Hello")
+        self.assertEqual(email.recipients, "jane@example.com")
+        self.assertEqual(email.status, PENDING)
+
+    def test_skips_messages_without_recipients(self):
+        connection = get_connection()
+        message = EmailMultiAlternatives("Hello", "Body", to=[])
+        self.assertEqual(connection.send_messages([message]), 0)
+        self.assertFalse(QueuedEmail.objects.exists())
+
+    def test_sends_messages_that_cant_be_queued(self):
+        with patch.object(
+            QueuedEmail.objects, "bulk_create", side_effect=DatabaseError
+        ), self.assertLogs("core.mail", "ERROR"):
+            queue_email()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_delivery(self):
+        message = EmailMultiAlternatives("Hello", "Body", to=["jane@example.com"])
+        message.attach_alternative("<p>Body</p>", "text/html")
+        get_connection().send_messages([message])
+
+        result = send_queued_emails()
+        self.assertEqual((result.sent, result.retried, result.failed), (1, 0, 0))
+        self.assertFalse(QueuedEmail.objects.exists())
+        self.assertEqual(mail.outbox[0].subject, "Hello")
+        self.assertEqual(mail.outbox[0].alternatives, [("<p>Body</p>", "text/html")])
+
+    def test_batches(self):
+        for i in range(3):
+            queue_email(f"Email {i}")
+        result = send_queued_emails(batch_size=2)
+        self.assertEqual(result.sent, 2)
+        self.assertEqual(QueuedEmail.objects.count(), 1)
+
+    def test_not_due(self):
+        queue_email()
+        QueuedEmail.objects.update(next_attempt_at=timezone.now() + timedelta(hours=1))
+        self.assertFalse(send_queued_emails())
+        self.assertEqual(mail.outbox, [])
+
+    def test_retries(self):
+        queue_email()
+        error = ConnectionError("The server is unavailable")
+        with patch("core.mail.get_delivery_connection") as get_delivery_connection:
+            get_delivery_connection.return_value.open.side_effect = error
+            result = send_queued_emails()
+        self.assertEqual(result.retried, 1)
+        email = QueuedEmail.objects.get()
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.status, PENDING)
+        self.assertIn("The server is unavailable", email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+
+    def test_fails_after_max_attempts(self):
+        queue_email()
+        QueuedEmail.objects.update(attempts=1)
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError,
+        ):
+            result = send_queued_emails()
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(QueuedEmail.objects.get().status, FAILED)
+        self.assertFalse(send_queued_emails())
+
+    def test_number_of_queries(self):
+        for i in range(3):
+            queue_email(f"Email {i}")
+        # a savepoint, the batch, the delete of the sent emails and a release
+        with self.assertNumQueries(4):
+            send_queued_emails()
+
+    def test_command(self):
+        for i in range(3):
+            queue_email(f"Email {i}")
+        stdout = StringIO()
+        call_command("send_queued_email", "--batch-size=2", stdout=stdout)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn("Sent 3 emails", stdout.getvalue())
@@ -0,0 +1,107 @@
+from unittest.mock import Mock, patch
+
+from django.http import HttpResponse
+from django.template import engines
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import ResolverMatch
+
+from core.middleware import RequestTimingMiddleware
+from people.models import Person
+
+
+def list_people(request):
+    count = Person.objects.count()
+    return TemplateResponse(
+        request, engines["django"].from_string("{{ count }}"), {"count": count}
+    )
+
+
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0, REQUEST_TIMING_BUDGETS={})
+class RequestTimingMiddlewareTestCase(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get("/people/")
+        self.request.resolver_match = ResolverMatch(
+            list_people, (), {}, url_name="people_list", namespaces=["people"]
+        )
+
+    def get_response(self, view=list_people):
+        middleware = RequestTimingMiddleware(view)
+
+        def get_response(request):
+            response = view(request)
+            if hasattr(response, "render"):
+                response = middleware.process_template_response(request, response)
+                response.render()
+            return response
+
+        middleware.get_response = get_response
+        return middleware(self.request)
+
+    def test_server_timing(self):
+        with self.assertLogs("core.timing", "INFO"):
+            response = self.get_response()
+        timings = response["Server-Timing"].split(", ")
+        self.assertRegex(timings[0], r'^db;dur=[\d.]+;desc="1 queries"$')
+        self.assertRegex(timings[1], r"^render;dur=[\d.]+$")
+        self.assertRegex(timings[2], r"^total;dur=[\d.]+$")
+
+    def test_counts_queries(self):
+        def view(request):
+            Person.objects.exists()
+            Person.objects.count()
+            return HttpResponse()
+
+        with self.assertLogs("core.timing", "INFO") as logs:
+            self.get_response(view)
+        timing = logs.records[0].timing
+        self.assertEqual(timing["queries"], 2)
+        self.assertEqual(timing["render"], 0)
+
+    def test_structured_log(self):
+        with self.assertLogs("core.timing", "INFO") as logs:
+            self.get_response()
+        self.assertEqual(len(logs.records), 1)
+        timing = logs.records[0].timing
+        self.assertEqual(timing["url_name"], "people:people_list")
+        self.assertEqual(timing["path"], "/people/")
+        self.assertEqual(timing["status"], 200)
+        self.assertIn("url_name=people:people_list", logs.output[0])
+
+    @override_settings(REQUEST_TIMING_BUDGETS={"people:people_list": {"queries": 0}})
+    def test_budget_exceeded(self):
+        with self.assertLogs("core.timing", "WARNING") as logs:
+            self.get_response()
+        self.assertEqual(
+            logs.output,
+            [
+                "WARNING:core.timing:people:people_list exceeded its budget: "
+                + "queries=1 (budget 0)"
+            ],
+        )
+
+    @override_settings(REQUEST_TIMING_BUDGETS={"people:people_list": {"queries": 1}})
+    def test_within_budget(self):
+        with self.assertLogs("core.timing", "INFO") as logs:
+            self.get_response()
+        self.assertEqual([record.levelname for record in logs.records], ["INFO"])
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=0.0)
+    def test_not_sampled(self):
+        view = Mock(return_value=HttpResponse())
+        response = RequestTimingMiddleware(view)(self.request)
+        self.assertNotIn("Server-Timing", response)
+        self.assertFalse(hasattr(self.request, "_render_timing"))
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=0.5)
+    def test_sample_rate(self):
+        middleware = RequestTimingMiddleware(Mock())
+        with patch("core.middleware.random.random", return_value=0.4):
+            self.assertTrue(middleware.is_sampled())
+        with patch("core.middleware.random.random", return_value=0.6):
+            self.assertFalse(middleware.is_sampled())
+
+    def test_client_request(self):
+        with self.assertLogs("core.timing", "INFO"):
+            response = self.client.get("/")
+        self.assertIn("Server-Timing", response)
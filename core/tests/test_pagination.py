@@ -0,0 +1,166 @@
+import base64
+import json
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.contrib.auth.models import Permission
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from accounts.factories import UserFactory
+from core.pagination import CursorPaginator
+from people.factories import PersonFactory
+from records import views
+from records.factories import TemperatureRecordFactory
+from records.models import TemperatureRecord
+
+
+class CursorPaginatorTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        today = timezone.localdate()
+        people = PersonFactory.create_batch(3)
+        for person in people:
+            for days in range(3):
+                record_date = today - timedelta(days=days)
+                TemperatureRecordFactory(person=person, record_date=record_date)
+        cls.ordering = ["person__username", "created_at", "id"]
+        cls.queryset = TemperatureRecord.objects.select_related("person")
+
+    def setUp(self):
+        self.paginator = CursorPaginator(self.queryset, 4, self.ordering)
+        self.records = list(self.queryset.order_by(*self.ordering))
+
+    def test_first_page(self):
+        page = self.paginator.page()
+        self.assertEqual(list(page), self.records[:4])
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertIsNone(page.previous_cursor)
+
+    def test_next_pages(self):
+        page = self.paginator.page()
+        second_page = self.paginator.page(page.next_cursor)
+        last_page = self.paginator.page(second_page.next_cursor)
+        self.assertEqual(list(second_page), self.records[4:8])
+        self.assertTrue(second_page.has_previous())
+        self.assertEqual(list(last_page), self.records[8:])
+        self.assertFalse(last_page.has_next())
+        self.assertIsNone(last_page.next_cursor)
+
+    def test_previous_pages(self):
+        page = self.paginator.page()
+        last_page = self.paginator.page(
+            self.paginator.page(page.next_cursor).next_cursor
+        )
+        second_page = self.paginator.page(last_page.previous_cursor)
+        first_page = self.paginator.page(second_page.previous_cursor)
+        self.assertEqual(list(second_page), self.records[4:8])
+        self.assertTrue(second_page.has_next())
+        self.assertEqual(list(first_page), self.records[:4])
+        self.assertFalse(first_page.has_previous())
+
+    def test_descending_ordering(self):
+        ordering = ["-created_at", "id"]
+        paginator = CursorPaginator(self.queryset, 5, ordering)
+        records = list(self.queryset.order_by(*ordering))
+        page = paginator.page()
+        self.assertEqual(list(paginator.page(page.next_cursor)), records[5:])
+
+    def test_invalid_cursor(self):
+        invalid_values = "WzAsIFsiYSIsICJiIiwgImMiXV0="  # [0, ["a", "b", "c"]]
+        for cursor in ["not a cursor", "W10=", "WzEsIDJd", invalid_values]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidPage):
+                    self.paginator.page(cursor)
+
+    def test_cursor_with_invalid_field_values(self):
+        created_at = "2022-01-01T00:00:00+00:00"
+        for values in [
+            ["a", created_at, "abc"],
+            ["a", created_at, [1]],
+            ["a", created_at, {}],
+            ["a", created_at, None],
+            ["a", "not a date", 1],
+        ]:
+            data = json.dumps([False, values]).encode()
+            cursor = base64.urlsafe_b64encode(data).decode()
+            with self.subTest(values=values):
+                with self.assertRaises(InvalidPage):
+                    self.paginator.page(cursor)
+
+    def test_count(self):
+        self.assertIsNone(self.paginator.count)
+        paginator = CursorPaginator(self.queryset, 4, self.ordering, count=True)
+        self.assertEqual(paginator.count, 9)
+
+    def test_number_of_queries(self):
+        cursor = self.paginator.encode_cursor(self.records[4])
+        with self.assertNumQueries(1):
+            self.paginator.page(cursor)
+
+
+@override_settings(CURSOR_PAGINATION=True)
+class CursorPaginationMixinTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        view_temp = Permission.objects.filter(name="Can view temperature record")
+        cls.user = UserFactory(user_permissions=tuple(view_temp))
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.view_class = views.TemperatureRecordsListView
+        self.view_func = self.view_class.as_view()
+        self.view = self.view_class()
+
+    def build_get_request(self, data=None):
+        request = self.factory.get("dummy_path", data=data)
+        request.user = self.user
+        return request
+
+    def test_context_data(self):
+        TemperatureRecordFactory.create_batch(11)
+        self.view.setup(self.build_get_request())
+        self.view.object_list = self.view.get_queryset()
+        context_data = self.view.get_context_data()
+        self.assertTrue(context_data["is_paginated"])
+        self.assertTrue(context_data["paginator"].cursor_based)
+        self.assertEqual(len(context_data["object_list"]), 10)
+
+    def test_response_with_next_page(self):
+        TemperatureRecordFactory.create_batch(11)
+        response = self.view_func(self.build_get_request())
+        response.render()
+        next_cursor = response.context_data["page_obj"].next_cursor
+        query = urlencode({"cursor": next_cursor})
+        self.assertIn(f"?{query}", response.content.decode())
+
+        response = self.view_func(self.build_get_request({"cursor": next_cursor}))
+        self.assertEqual(len(response.context_data["object_list"]), 1)
+
+    def test_response_with_invalid_cursor(self):
+        with self.assertRaises(Http404):
+            self.view_func(self.build_get_request({"cursor": "invalid"}))
+
+    def test_response_with_search_query(self):
+        for number in range(11):
+            TemperatureRecordFactory(person=PersonFactory(username=f"jane{number}"))
+        response = self.view_func(self.build_get_request({"q": "jane"}))
+        response.render()
+        self.assertFalse(
+            getattr(response.context_data["paginator"], "cursor_based", False)
+        )
+        self.assertIn("?q=jane&amp;page=2", response.content.decode())
+
+    @override_settings(CURSOR_PAGINATION_COUNT=True)
+    def test_response_with_count(self):
+        TemperatureRecordFactory.create_batch(11)
+        response = self.view_func(self.build_get_request())
+        response.render()
+        self.assertInHTML("11 in total", response.content.decode())
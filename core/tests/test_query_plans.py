@@ -0,0 +1,51 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from core.datasets import DatasetGenerator
+from core.query_plans import HotQuery, explain, get_hot_queries
+from people.models import Person
+
+FULL_NAME_QUERY = HotQuery(
+    "people by full name",
+    "people_person_full_name_idx",
+    lambda: Person.objects.filter(full_name="Jane Doe"),
+)
+
+
+class QueryPlansTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # the planner picks between indexes by the statistics of the tables, which
+        # are otherwise left to whenever autovacuum analyzes the test database
+        DatasetGenerator(seed=1).generate(200, days=30, daily_records=50)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_hot_queries_use_their_indexes(self):
+        for plan in explain(get_hot_queries(), disable_seqscan=True):
+            with self.subTest(query=plan.query.name):
+                self.assertTrue(plan.uses_index, plan.plan)
+
+    def test_query_without_its_index(self):
+        [plan] = explain([FULL_NAME_QUERY])
+        self.assertFalse(plan.uses_index)
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("check_query_plans", "--disable-seqscan", stdout=stdout)
+        self.assertIn("OK temperature records of a person", stdout.getvalue())
+        self.assertNotIn("MISSING", stdout.getvalue())
+
+    @patch(
+        "core.management.commands.check_query_plans.get_hot_queries",
+        return_value=[FULL_NAME_QUERY],
+    )
+    def test_command_with_missing_index(self, get_hot_queries):
+        stdout = StringIO()
+        with self.assertRaisesMessage(CommandError, "1 queries"):
+            call_command("check_query_plans", stdout=stdout)
+        self.assertIn("MISSING people by full name", stdout.getvalue())
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.factories import UserFactory
+
+
+class SessionEngineTestCase(TestCase):
+    def setUp(self):
+        caches[settings.SESSION_CACHE_ALIAS].clear()
+        self.user = UserFactory()
+
+    def get_session_queries(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse("core:index"))
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse("core:index"))
+        table = Session._meta.db_table
+        return [q["sql"] for q in context.captured_queries if table in q["sql"]]
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.db")
+    def test_db(self):
+        self.assertTrue(self.get_session_queries())
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+    def test_cached_db(self):
+        self.assertEqual(self.get_session_queries(), [])
+        self.assertTrue(Session.objects.exists())
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache")
+    def test_cache(self):
+        self.assertEqual(self.get_session_queries(), [])
+        self.assertFalse(Session.objects.exists())
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies")
+    def test_signed_cookies(self):
+        self.assertEqual(self.get_session_queries(), [])
+        self.assertFalse(Session.objects.exists())
@@ -1,16 +1,61 @@
+import io
+
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.template.response import TemplateResponse
+from django.urls import path
 
+from .forms import PersonImportUploadForm
+from .imports import PersonImporter
 from .models import InterpersonalRelationship, Person
 
 
 @admin.register(Person)
 class PersonAdmin(admin.ModelAdmin):
+    change_list_template = "admin/people/person/change_list.html"
     list_display = ["username", "dob", "created_by", "created_at"]
     list_display_links = None
     list_filter = ["created_at", "last_modified"]
     ordering = ["username"]
     search_fields = ["username", "created_by__email"]
 
+    def get_urls(self):
+        urls = [
+            path(
+                "import/",
+                self.admin_site.admin_view(self.import_view),
+                name="people_person_import",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def import_view(self, request):
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+
+        result = None
+        form = PersonImportUploadForm(request.POST or None, request.FILES or None)
+        if form.is_valid():
+            # large uploads are read from their temporary file a chunk at a time
+            file = io.TextIOWrapper(
+                form.cleaned_data["file"], encoding="utf-8-sig", newline=""
+            )
+            try:
+                result = PersonImporter(created_by=request.user).import_file(file)
+            except (UnicodeDecodeError, ValueError) as e:
+                form.add_error("file", str(e))
+
+        context = {
+            **self.admin_site.each_context(request),
+            "form": form,
+            "opts": self.model._meta,
+            "result": result,
+            "title": "Import people",
+        }
+        return TemplateResponse(
+            request, "admin/people/person/import_form.html", context
+        )
+
 
 @admin.register(InterpersonalRelationship)
 class InterpersonalRelationshipAdmin(admin.ModelAdmin):
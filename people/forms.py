@@ -2,6 +2,8 @@ from django import forms
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 
+from phonenumber_field.formfields import PhoneNumberField
+
 from . import constants, validators
 from .models import InterpersonalRelationship, Person
 
@@ -19,6 +21,15 @@ class PersonUpdateForm(forms.ModelForm):
         model = Person
         fields = ["username", "full_name"]
 
+    def clean_username(self):
+        # the unique index on LOWER(username) isn't checked by the model's
+        # validate_unique()
+        username = self.cleaned_data["username"]
+        people = Person.objects.with_username(username).exclude(pk=self.instance.pk)
+        if people.exists():
+            raise ValidationError(validators.NON_UNIQUE_USERNAME_ERROR, code="unique")
+        return username
+
 
 class PersonCreationForm(PersonUpdateForm):
     dob = forms.DateField(
@@ -29,6 +40,55 @@ class PersonCreationForm(PersonUpdateForm):
         fields = ["username", "full_name", "gender", "dob"]
 
 
+class PersonImportForm(PersonCreationForm):
+    """Validates a row of a people CSV file.
+
+    The importer checks whether the usernames are taken for many rows at a time,
+    so the form doesn't query the database for each row.
+    """
+
+    phone_number = PhoneNumberField(required=False)
+
+    class Meta(PersonCreationForm.Meta):  # noqa
+        fields = ["username", "full_name", "gender", "dob", "phone_number"]
+
+    def clean_username(self):
+        return self.cleaned_data["username"]
+
+    def clean_phone_number(self):
+        return self.cleaned_data["phone_number"] or None
+
+    def validate_unique(self):
+        pass
+
+
+class InterpersonalRelationshipImportForm(forms.Form):
+    """Validates a row of a relationships file.
+
+    The importer looks up the people of many rows at a time, so the form
+    doesn't query the database for each row.
+    """
+
+    person = forms.CharField(max_length=50, validators=[UnicodeUsernameValidator()])
+    relative = forms.CharField(max_length=50, validators=[UnicodeUsernameValidator()])
+    relation = forms.ChoiceField(choices=constants.INTERPERSONAL_RELATIONSHIP_CHOICES)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        person, relative = cleaned_data.get("person"), cleaned_data.get("relative")
+        if person and relative and person.lower() == relative.lower():
+            raise ValidationError(SELF_RELATIONSHIPS_ERROR)
+        return cleaned_data
+
+
+class PersonImportUploadForm(forms.Form):
+    file = forms.FileField(
+        label="CSV file",
+        help_text="The columns are username, full_name, gender, dob and, "
+        + "optionally, phone_number.",
+    )
+
+
 class AdultCreationForm(PersonCreationForm):
     dob = forms.DateField(
         label="Date of birth",
@@ -47,33 +107,78 @@ class ChildCreationForm(PersonCreationForm):
     is_parent = forms.BooleanField(label="I am the child's parent", required=False)
 
 
-class ParentChildRelationshipCreationForm(forms.ModelForm):
-    person = forms.CharField(
-        label="The parent's username",
-        max_length=25,
-        validators=[validators.validate_person_username],
-    )
+class PersonUsernameField(forms.CharField):
+    """A username field whose cleaned value is the person with that username,
+    ignoring case.
+
+    `PersonUsernameFormMixin` looks up the people of all the form's fields in one
+    query. A field cleaned on its own looks its person up by itself.
+    """
+
+    default_error_messages = {
+        "does_not_exist": validators.PERSON_DOES_NOT_EXIST_ERROR,
+    }
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("max_length", 25)
+        super().__init__(**kwargs)
+        self.people = None
+
+    def clean(self, value):
+        username = super().clean(value)
+        if username in self.empty_values:
+            return None
+        people = self.people
+        if people is None:
+            people = Person.objects.in_bulk_by_username([username])
+        try:
+            return people[username.lower()]
+        except KeyError:
+            raise ValidationError(
+                self.error_messages["does_not_exist"],
+                code="does_not_exist",
+                params={"username": username},
+            )
+
+
+class PersonUsernameFormMixin:
+    """Looks up the people of the form's `PersonUsernameField`s in one query"""
+
+    def full_clean(self):
+        if self.is_bound:
+            self.resolve_people()
+        super().full_clean()
+
+    def resolve_people(self):
+        fields = [
+            (name, field)
+            for name, field in self.fields.items()
+            if isinstance(field, PersonUsernameField)
+        ]
+        usernames = set()
+        for name, field in fields:
+            try:
+                username = field.to_python(self[name].data)
+            except ValidationError:
+                continue
+            if username not in field.empty_values:
+                usernames.add(username)
+        people = Person.objects.in_bulk_by_username(usernames)
+        for _, field in fields:
+            field.people = people
+
+
+class ParentChildRelationshipCreationForm(PersonUsernameFormMixin, forms.ModelForm):
+    person = PersonUsernameField(label="The parent's username")
 
     class Meta:  # noqa
         model = InterpersonalRelationship
         fields = ["person"]
 
-    def clean_person(self):
-        person = self.cleaned_data["person"]
-        return Person.objects.get(username=person)
-
 
 class InterpersonalRelationshipCreationForm(ParentChildRelationshipCreationForm):
-    person = forms.CharField(
-        label="The person's username",
-        max_length=25,
-        validators=[validators.validate_person_username],
-    )
-    relative = forms.CharField(
-        label="The relative's username",
-        max_length=25,
-        validators=[validators.validate_person_username],
-    )
+    person = PersonUsernameField(label="The person's username")
+    relative = PersonUsernameField(label="The relative's username")
     relation = forms.ChoiceField(
         label="Relationship type",
         choices=constants.INTERPERSONAL_RELATIONSHIP_CHOICES,
@@ -92,7 +197,3 @@ class InterpersonalRelationshipCreationForm(ParentChildRelationshipCreationForm)
         cleaned_data = super().clean()
         if cleaned_data.get("person") == cleaned_data.get("relative"):
             raise ValidationError(SELF_RELATIONSHIPS_ERROR)
-
-    def clean_relative(self):
-        relative = self.cleaned_data["relative"]
-        return Person.objects.get(username=relative)
@@ -0,0 +1,207 @@
+from collections import deque
+from dataclasses import dataclass, field
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .constants import FAMILIAL_RELATIONSHIPS, INTIMATE_RELATIONSHIPS
+
+PARENT_CHILD = FAMILIAL_RELATIONSHIPS[0][0]
+SIBLING = FAMILIAL_RELATIONSHIPS[1][0]
+INTIMATE = [relation for relation, _ in INTIMATE_RELATIONSHIPS]
+
+# the databases whose recursive CTEs can run as a subquery of another query
+RECURSIVE_QUERY_VENDORS = ["postgresql", "sqlite"]
+
+
+class FamilyGraph:
+    """Traverses the directed `InterpersonalRelationship` edge list.
+
+    A parent-child relationship points from the parent (`person`) to the child
+    (`relative`), the other relationships are treated as undirected. On
+    databases in `RECURSIVE_QUERY_VENDORS` a whole traversal is a single query
+    with a recursive CTE. Elsewhere the graph is walked breadth-first with a
+    query per generation.
+    """
+
+    def __init__(self, recursive=None):
+        if recursive is None:
+            recursive = connection.vendor in RECURSIVE_QUERY_VENDORS
+        self.recursive = recursive
+
+    def household(self, person):
+        """The person, their partners and the children of any of them"""
+        from .models import InterpersonalRelationship, Person
+
+        relationships = InterpersonalRelationship.objects.all()
+        intimate = relationships.filter(relation__in=INTIMATE)
+        partners = Q(pk__in=intimate.filter(person=person).values("relative")) | Q(
+            pk__in=intimate.filter(relative=person).values("person")
+        )
+        parents = Person.objects.filter(Q(pk=person.pk) | partners)
+        children = relationships.filter(relation=PARENT_CHILD, person__in=parents)
+        return Person.objects.filter(
+            Q(pk=person.pk) | partners | Q(pk__in=children.values("relative"))
+        )
+
+    def descendants(self, person):
+        return self.traverse(person, [PARENT_CHILD], forwards=True, backwards=False)
+
+    def ancestors(self, person):
+        return self.traverse(person, [PARENT_CHILD], forwards=False, backwards=True)
+
+    def family(self, person):
+        """Everyone the person is connected to through any relationship"""
+        return self.traverse(person)
+
+    def relationships(self, person):
+        """The relationships between the members of the person's family"""
+        from .models import InterpersonalRelationship
+
+        family = self.family(person).values("pk")
+        return InterpersonalRelationship.objects.filter(
+            Q(person=person) | Q(person__in=family)
+        ).select_related("person", "relative")
+
+    def traverse(self, person, relations=None, forwards=True, backwards=True):
+        """Returns the people reachable from `person` through `relations`.
+
+        `forwards` follows relationships from the person to the relative and
+        `backwards` from the relative to the person.
+        """
+        from .models import Person
+
+        if self.recursive:
+            sql, params = self.get_traversal_sql(relations, forwards, backwards)
+            people = RawSQL(sql, [person.pk, *params])
+        else:
+            people = self.walk(person, relations, forwards, backwards)
+        return Person.objects.filter(pk__in=people).exclude(pk=person.pk)
+
+    def get_traversal_sql(self, relations, forwards, backwards):
+        from .models import InterpersonalRelationship, Person
+
+        people = connection.ops.quote_name(Person._meta.db_table)
+        pk = connection.ops.quote_name(Person._meta.pk.column)
+        meta = InterpersonalRelationship._meta
+        table = connection.ops.quote_name(meta.db_table)
+        person = connection.ops.quote_name(meta.get_field("person").column)
+        relative = connection.ops.quote_name(meta.get_field("relative").column)
+        column = connection.ops.quote_name(meta.get_field("relation").column)
+
+        if forwards and backwards:
+            target = (
+                f"CASE WHEN r.{person} = f.id THEN r.{relative} ELSE r.{person} END"
+            )
+            join = f"r.{person} = f.id OR r.{relative} = f.id"
+        elif forwards:
+            target, join = f"r.{relative}", f"r.{person} = f.id"
+        else:
+            target, join = f"r.{person}", f"r.{relative} = f.id"
+
+        where, params = "", []
+        if relations is not None:
+            where = f"WHERE r.{column} IN ({', '.join(['%s'] * len(relations))})"
+            params = list(relations)
+
+        # UNION drops the people who were already visited, so cycles terminate
+        sql = (
+            f"WITH RECURSIVE family(id) AS ("
+            f"SELECT {pk} FROM {people} WHERE {pk} = %s UNION "
+            f"SELECT {target} FROM {table} r INNER JOIN family f ON {join} {where}) "
+            f"SELECT id FROM family"
+        )
+        return sql, params
+
+    def walk(self, person, relations, forwards, backwards):
+        from .models import InterpersonalRelationship
+
+        relationships = InterpersonalRelationship.objects.all()
+        if relations is not None:
+            relationships = relationships.filter(relation__in=relations)
+
+        visited = {person.pk}
+        frontier = {person.pk}
+        while frontier:
+            filters = Q()
+            if forwards:
+                filters |= Q(person__in=frontier)
+            if backwards:
+                filters |= Q(relative__in=frontier)
+            edges = relationships.filter(filters).values_list("person", "relative")
+
+            reached = set()
+            for source, target in edges:
+                if forwards and source in frontier:
+                    reached.add(target)
+                if backwards and target in frontier:
+                    reached.add(source)
+            frontier = reached - visited
+            visited |= frontier
+        return visited
+
+
+@dataclass
+class FamilyTree:
+    """A person's relatives, grouped from their family's relationships"""
+
+    person: object
+    parents: list = field(default_factory=list)
+    children: list = field(default_factory=list)
+    partners: list = field(default_factory=list)
+    siblings: list = field(default_factory=list)
+    ancestors: list = field(default_factory=list)
+    descendants: list = field(default_factory=list)
+    relatives: list = field(default_factory=list)
+
+    @classmethod
+    def for_person(cls, person, graph=None):
+        """Builds the tree from the single query of `FamilyGraph.relationships`"""
+        graph = graph or FamilyGraph()
+        relationships = list(graph.relationships(person))
+
+        people = {}
+        parents, children, siblings, partners = {}, {}, {}, {}
+        for relationship in relationships:
+            source, target = relationship.person, relationship.relative
+            people[source.pk], people[target.pk] = source, target
+            if relationship.relation == PARENT_CHILD:
+                parents.setdefault(target.pk, set()).add(source.pk)
+                children.setdefault(source.pk, set()).add(target.pk)
+            elif relationship.relation == SIBLING:
+                siblings.setdefault(source.pk, set()).add(target.pk)
+                siblings.setdefault(target.pk, set()).add(source.pk)
+            else:
+                partners.setdefault(source.pk, set()).add(target.pk)
+                partners.setdefault(target.pk, set()).add(source.pk)
+
+        def get_people(pks):
+            return sorted((people[pk] for pk in pks), key=lambda p: p.username)
+
+        pk = person.pk
+        sibling_pks = set(siblings.get(pk, ()))
+        for parent in parents.get(pk, ()):
+            sibling_pks |= children.get(parent, set())
+        sibling_pks.discard(pk)
+        return cls(
+            person=person,
+            parents=get_people(parents.get(pk, ())),
+            children=get_people(children.get(pk, ())),
+            partners=get_people(partners.get(pk, ())),
+            siblings=get_people(sibling_pks),
+            ancestors=get_people(cls.reach(pk, parents)),
+            descendants=get_people(cls.reach(pk, children)),
+            relatives=get_people(set(people) - {pk}),
+        )
+
+    @staticmethod
+    def reach(pk, edges):
+        reached = set()
+        queue = deque([pk])
+        while queue:
+            for target in edges.get(queue.popleft(), ()):
+                if target not in reached and target != pk:
+                    reached.add(target)
+                    queue.append(target)
+        return reached
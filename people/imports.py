@@ -0,0 +1,466 @@
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from itertools import chain, combinations, islice
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from thefuzz import fuzz
+
+from core.cache import bump_cache_version
+
+from .forms import (
+    DUPLICATE_RELATIONSHIPS_ERROR,
+    InterpersonalRelationshipImportForm,
+    PersonImportForm,
+)
+from .graph import PARENT_CHILD
+from .models import InterpersonalRelationship, Person, PersonNameToken
+from .utils import bulk_create_people, get_name_tokens
+from .validators import NON_UNIQUE_USERNAME_ERROR, PERSON_DOES_NOT_EXIST_ERROR
+
+DUPLICATE_PERSON_ERROR = "This person already exists"
+MISSING_COLUMNS_ERROR = "The file is missing the columns: %(columns)s"
+INVALID_JSON_ERROR = "The file must hold a JSON list of objects"
+PARENT_CHILD_CYCLE_ERROR = "This relationship would make a person their own ancestor"
+
+REQUIRED_COLUMNS = ["username", "full_name", "gender", "dob"]
+RELATIONSHIP_COLUMNS = ["person", "relative", "relation"]
+
+
+@dataclass
+class ImportRowError:
+    row: int
+    errors: dict
+
+
+def check_columns(columns, required_columns):
+    missing = set(required_columns) - set(columns)
+    if missing:
+        columns = ", ".join(sorted(missing))
+        raise ValueError(MISSING_COLUMNS_ERROR % dict(columns=columns))
+
+
+def read_csv(file, required_columns):
+    """Returns the numbered rows of a CSV file with a header row"""
+    reader = csv.DictReader(file)
+    check_columns(reader.fieldnames or [], required_columns)
+    return enumerate(reader, start=2)  # the header is the first line
+
+
+def iter_json_list(file, read_size=64 * 1024):
+    """Yields the items of the JSON list in `file`, reading it a part at a time"""
+    decoder = json.JSONDecoder()
+    buffer, end_of_file = "", False
+
+    def read():
+        nonlocal buffer, end_of_file
+        part = file.read(read_size)
+        end_of_file = not part
+        buffer += part
+
+    def next_character():
+        """Skips whitespace and returns the next character, or "" at the end"""
+        nonlocal buffer
+        while True:
+            buffer = buffer.lstrip()
+            if buffer or end_of_file:
+                return buffer[:1]
+            read()
+
+    if next_character() != "[":
+        raise ValueError(INVALID_JSON_ERROR)
+    buffer = buffer[1:]
+    if next_character() == "]":
+        buffer = buffer[1:]
+    else:
+        while True:
+            next_character()
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if end_of_file:
+                    raise ValueError(INVALID_JSON_ERROR)
+                read()  # the item may continue in the next part
+                continue
+            buffer = buffer[end:]
+            yield item
+
+            character = next_character()
+            buffer = buffer[1:]
+            if character == "]":
+                break
+            if character != ",":
+                raise ValueError(INVALID_JSON_ERROR)
+    if next_character():
+        raise ValueError(INVALID_JSON_ERROR)
+
+
+def read_json(file, required_columns):
+    """Returns the numbered objects of a JSON list.
+
+    The file is read as the rows are needed. The columns are checked against the
+    first object, and a later object without them fails its row's validation.
+    """
+    rows = iter_json_list(file)
+    first_row = next(rows, None)
+    if first_row is None:
+        return iter([])
+    if not isinstance(first_row, dict):
+        raise ValueError(INVALID_JSON_ERROR)
+    check_columns(first_row, required_columns)
+
+    def check_rows():
+        for row in chain([first_row], rows):
+            if not isinstance(row, dict):
+                raise ValueError(INVALID_JSON_ERROR)
+            yield row
+
+    return enumerate(check_rows(), start=1)
+
+
+READERS = {"csv": read_csv, "json": read_json}
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    errors: list = field(default_factory=list)
+    seconds: float = 0.0
+    label: str = "people"
+
+    @property
+    def rows(self):
+        return self.created + len(self.errors)
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"Imported {self.created} of {self.rows} {self.label} in "
+            f"{self.seconds:.2f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+
+class NameIndex:
+    """The full names of people, by their name tokens.
+
+    `fuzz.token_set_ratio` of two names is only 100 when one name's tokens are a
+    subset of the other's. The candidates for a name are the names with all of
+    its tokens, the intersection of its tokens' posting lists, and the names
+    whose tokens are all among its tokens, looked up by each subset of them.
+    """
+
+    # the subsets of longer names are more than the names that share a token
+    max_subset_tokens = 10
+
+    def __init__(self, full_names=()):
+        self.postings = {}
+        self.names = {}
+        for full_name in full_names:
+            self.add(full_name)
+
+    def add(self, full_name):
+        tokens = frozenset(get_name_tokens(full_name))
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(full_name)
+        self.names.setdefault(tokens, set()).add(full_name)
+
+    def get_candidates(self, tokens):
+        if not tokens:
+            return set()
+
+        postings = sorted(
+            (self.postings.get(token, set()) for token in tokens), key=len
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        if len(tokens) > self.max_subset_tokens:
+            for name in set().union(*postings):
+                if get_name_tokens(name) <= tokens:
+                    candidates.add(name)
+            return candidates
+
+        for size in range(1, len(tokens)):
+            for subset in combinations(tokens, size):
+                candidates.update(self.names.get(frozenset(subset), ()))
+        return candidates
+
+
+class PersonImporter:
+    """Creates people from the rows of a CSV file in chunks.
+
+    Each row is validated with `PersonImportForm`. A chunk of rows is checked for
+    existing usernames, ignoring case, in a query and for duplicate names in two,
+    and is then saved with `bulk_create`. Only one chunk of the file is held in
+    memory at a time.
+
+    People the same creator has already added, or that appear earlier in the
+    file, are reported as duplicates the same way `is_duplicate_person` does.
+    """
+
+    form_class = PersonImportForm
+
+    def __init__(self, created_by=None, chunk_size=None):
+        self.created_by = created_by
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        self.usernames = set()
+        self.name_index = NameIndex()  # the names imported so far
+
+    def import_file(self, file):
+        result = ImportResult()
+        start = time.perf_counter()
+        rows = read_csv(file, REQUIRED_COLUMNS)
+        while chunk := list(islice(rows, self.chunk_size)):
+            self.import_chunk(chunk, result)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def import_chunk(self, chunk, result):
+        forms = []
+        for row_number, row in chunk:
+            form = self.form_class(data=row)
+            if form.is_valid():
+                forms.append((row_number, form))
+            else:
+                errors = {
+                    field: list(messages) for field, messages in form.errors.items()
+                }
+                result.errors.append(ImportRowError(row_number, errors))
+
+        usernames = {form.cleaned_data["username"] for _, form in forms}
+        existing_usernames = {
+            username.lower()
+            for username in Person.objects.with_usernames(usernames).values_list(
+                "username", flat=True
+            )
+        }
+        existing_names = self.get_existing_names(
+            [form.cleaned_data["full_name"] for _, form in forms]
+        )
+
+        people = []
+        for row_number, form in forms:
+            username = form.cleaned_data["username"].lower()
+            full_name = form.cleaned_data["full_name"]
+            if username in existing_usernames or username in self.usernames:
+                error = {"username": [NON_UNIQUE_USERNAME_ERROR]}
+                result.errors.append(ImportRowError(row_number, error))
+            elif self.is_duplicate_name(full_name, existing_names):
+                error = {"__all__": [DUPLICATE_PERSON_ERROR]}
+                result.errors.append(ImportRowError(row_number, error))
+            else:
+                self.usernames.add(username)
+                self.name_index.add(full_name)
+                form.instance.created_by = self.created_by
+                people.append(form.instance)
+
+        self.create_people(people)
+        result.created += len(people)
+
+    def get_existing_names(self, full_names):
+        """Indexes the names of the people who may be duplicates of `full_names`.
+
+        These are the people whose tokens are all among the tokens of the chunk,
+        and the people who have a row's rarest token, which is any person with
+        all of the row's tokens.
+        """
+        token_sets = [get_name_tokens(full_name) for full_name in full_names]
+        tokens = set().union(*token_sets)
+        name_tokens = PersonNameToken.objects.filter(
+            person__created_by=self.created_by, token__in=tokens
+        )
+        frequencies = dict(name_tokens.values_list("token").annotate(Count("pk")))
+        rarest_tokens = {
+            min(tokens, key=lambda token: frequencies.get(token, 0))
+            for tokens in token_sets
+            if tokens
+        }
+
+        people_within_tokens = (
+            Person.objects.filter(created_by=self.created_by)
+            .with_shared_name_tokens(tokens)
+            .filter(shared_tokens=F("name_token_count"))
+            .values("pk")
+        )
+        people = Person.objects.filter(
+            Q(pk__in=name_tokens.filter(token__in=rarest_tokens).values("person"))
+            | Q(pk__in=people_within_tokens)
+        )
+        return NameIndex(people.values_list("full_name", flat=True))
+
+    def is_duplicate_name(self, full_name, existing_names):
+        tokens = get_name_tokens(full_name)
+        for index in [existing_names, self.name_index]:
+            for name in index.get_candidates(tokens):
+                if fuzz.token_set_ratio(full_name, name) == 100:
+                    return True
+        return False
+
+    @transaction.atomic
+    def create_people(self, people):
+        bulk_create_people(people)
+        bump_cache_version(Person)
+
+
+class RelationshipImporter:
+    """Creates interpersonal relationships from the rows of a CSV or JSON file.
+
+    Each row is validated with `InterpersonalRelationshipImportForm`. For a chunk
+    of rows, the people are looked up in one query and the relationships they
+    already have in another. A parent-child relationship is rejected if it would
+    make a person their own ancestor, which is checked against the descendants
+    of the chunk's children with a query per generation. The relationships are
+    then saved with `bulk_create`. Any that were added in the meantime are
+    skipped and reported as duplicates.
+    """
+
+    form_class = InterpersonalRelationshipImportForm
+
+    def __init__(self, created_by=None, chunk_size=None):
+        self.created_by = created_by
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        self.pairs = set()  # the (person, relative) pks imported so far
+
+    def import_file(self, file, format="csv"):
+        result = ImportResult(label="relationships")
+        start = time.perf_counter()
+        rows = READERS[format](file, RELATIONSHIP_COLUMNS)
+        while chunk := list(islice(rows, self.chunk_size)):
+            self.import_chunk(chunk, result)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def import_chunk(self, chunk, result):
+        forms = []
+        for row_number, row in chunk:
+            form = self.form_class(data=row)
+            if form.is_valid():
+                forms.append((row_number, form.cleaned_data))
+            else:
+                errors = {
+                    field: list(messages) for field, messages in form.errors.items()
+                }
+                result.errors.append(ImportRowError(row_number, errors))
+
+        people = self.get_people(forms)
+        rows = []
+        for row_number, data in forms:
+            errors = {}
+            for name in ["person", "relative"]:
+                username = data[name]
+                if username.lower() not in people:
+                    error = PERSON_DOES_NOT_EXIST_ERROR % dict(username=username)
+                    errors[name] = [error]
+            if errors:
+                result.errors.append(ImportRowError(row_number, errors))
+            else:
+                person = people[data["person"].lower()]
+                relative = people[data["relative"].lower()]
+                rows.append((row_number, person, relative, data["relation"]))
+
+        existing_pairs = self.get_existing_pairs(rows)
+        children = self.get_children(
+            [
+                relative.pk
+                for _, _, relative, relation in rows
+                if relation == PARENT_CHILD
+            ]
+        )
+
+        relationships = {}  # by the row they're imported from
+        for row_number, person, relative, relation in rows:
+            pair = (person.pk, relative.pk)
+            if pair in existing_pairs or pair in self.pairs:
+                error = {"__all__": [DUPLICATE_RELATIONSHIPS_ERROR]}
+                result.errors.append(ImportRowError(row_number, error))
+            elif relation == PARENT_CHILD and self.is_descendant(
+                person.pk, relative.pk, children
+            ):
+                error = {"__all__": [PARENT_CHILD_CYCLE_ERROR]}
+                result.errors.append(ImportRowError(row_number, error))
+            else:
+                self.pairs.add(pair)
+                if relation == PARENT_CHILD:
+                    children.setdefault(person.pk, set()).add(relative.pk)
+                relationships[row_number] = InterpersonalRelationship(
+                    person=person,
+                    relative=relative,
+                    relation=relation,
+                    created_by=self.created_by,
+                )
+
+        if relationships:
+            created = self.create_relationships(list(relationships.values()))
+            result.created += len(created)
+            skipped = [
+                ImportRowError(row_number, {"__all__": [DUPLICATE_RELATIONSHIPS_ERROR]})
+                for row_number, relationship in relationships.items()
+                if relationship.pk not in created
+            ]
+            if skipped:
+                result.errors = sorted(
+                    result.errors + skipped, key=lambda error: error.row
+                )
+
+    def get_people(self, forms):
+        """The people of the rows, by their lowercased usernames"""
+        usernames = set()
+        for _, data in forms:
+            usernames |= {data["person"], data["relative"]}
+        return Person.objects.in_bulk_by_username(usernames)
+
+    def get_existing_pairs(self, rows):
+        if not rows:
+            return set()
+        queryset = InterpersonalRelationship.objects.filter(
+            person__in={person.pk for _, person, _, _ in rows},
+            relative__in={relative.pk for _, _, relative, _ in rows},
+        )
+        return set(queryset.values_list("person", "relative"))
+
+    def get_children(self, pks):
+        """The children of `pks` and of all their descendants, by parent"""
+        children = {}
+        visited, frontier = set(pks), set(pks)
+        while frontier:
+            edges = InterpersonalRelationship.objects.filter(
+                relation=PARENT_CHILD, person__in=frontier
+            ).values_list("person", "relative")
+            reached = set()
+            for parent, child in edges:
+                children.setdefault(parent, set()).add(child)
+                reached.add(child)
+            frontier = reached - visited
+            visited |= frontier
+        return children
+
+    @staticmethod
+    def is_descendant(pk, ancestor, children):
+        """Whether `pk` can be reached from `ancestor` through `children`"""
+        visited, stack = {ancestor}, [ancestor]
+        while stack:
+            for child in children.get(stack.pop(), ()):
+                if child == pk:
+                    return True
+                if child not in visited:
+                    visited.add(child)
+                    stack.append(child)
+        return False
+
+    @transaction.atomic
+    def create_relationships(self, relationships):
+        """Inserts the relationships and returns the primary keys of those that
+        weren't skipped for another user adding them in the meantime
+        """
+        InterpersonalRelationship.objects.bulk_create(
+            relationships, ignore_conflicts=True
+        )
+        bump_cache_version(InterpersonalRelationship)
+        pks = [relationship.pk for relationship in relationships]
+        queryset = InterpersonalRelationship.objects.filter(pk__in=pks)
+        return set(queryset.values_list("pk", flat=True))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.utils import get_user, write_import_result
+from people.imports import PersonImporter
+
+
+class Command(BaseCommand):
+    help = "Creates people from a CSV file with a header row."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The CSV file to import.")
+        parser.add_argument(
+            "--created-by", help="The email address of the user adding the people."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, help="The number of rows saved at a time."
+        )
+
+    def handle(self, *args, **options):
+        importer = PersonImporter(
+            created_by=get_user(options["created_by"]),
+            chunk_size=options["chunk_size"],
+        )
+        try:
+            with open(options["path"], newline="", encoding="utf-8-sig") as file:
+                result = importer.import_file(file)
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
+
+        write_import_result(self, result)
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.utils import get_user, write_import_result
+from people.imports import READERS, RelationshipImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates interpersonal relationships from a CSV file with a header row "
+        "or a JSON list of objects, with person, relative and relation fields."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The CSV or JSON file to import.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(READERS),
+            help="The file's format. Defaults to the file's extension.",
+        )
+        parser.add_argument(
+            "--created-by",
+            help="The email address of the user adding the relationships.",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, help="The number of rows saved at a time."
+        )
+
+    def get_format(self, path, format):
+        format = format or Path(path).suffix.lstrip(".").lower()
+        if format not in READERS:
+            raise CommandError(
+                f"Can't tell the format of '{path}', set it with --format"
+            )
+        return format
+
+    def handle(self, *args, **options):
+        importer = RelationshipImporter(
+            created_by=get_user(options["created_by"]),
+            chunk_size=options["chunk_size"],
+        )
+        format = self.get_format(options["path"], options["format"])
+        try:
+            with open(options["path"], newline="", encoding="utf-8-sig") as file:
+                result = importer.import_file(file, format=format)
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
+
+        write_import_result(self, result)
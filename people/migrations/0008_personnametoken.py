@@ -0,0 +1,68 @@
+# Generated by Django 4.0.10 on 2026-10-16 22:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from thefuzz import utils as fuzz_utils
+
+
+def index_name_tokens(apps, schema_editor):
+    Person = apps.get_model("people", "Person")
+    PersonNameToken = apps.get_model("people", "PersonNameToken")
+
+    for person in Person.objects.only("full_name").iterator():
+        tokens = set(
+            fuzz_utils.full_process(person.full_name, force_ascii=True).split()
+        )
+        PersonNameToken.objects.bulk_create(
+            [PersonNameToken(person=person, token=token) for token in tokens]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0007_person_user_account"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersonNameToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "token",
+                    models.CharField(
+                        help_text="A normalized token from the person's full name.",
+                        max_length=300,
+                    ),
+                ),
+                (
+                    "person",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="name_tokens",
+                        to="people.person",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "people_name_token",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="personnametoken",
+            constraint=models.UniqueConstraint(
+                fields=("token", "person"), name="people_unique_personnametoken"
+            ),
+        ),
+        migrations.RunPython(index_name_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+POSTGRESQL_FORWARDS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX people_person_username_trgm "
+    "ON people_person USING gin (UPPER(username) gin_trgm_ops)",
+    "CREATE INDEX people_person_full_name_trgm "
+    "ON people_person USING gin (UPPER(full_name) gin_trgm_ops)",
+]
+
+POSTGRESQL_BACKWARDS = [
+    "DROP INDEX IF EXISTS people_person_username_trgm",
+    "DROP INDEX IF EXISTS people_person_full_name_trgm",
+]
+
+# the first SQLite version whose FTS5 provides the trigram tokenizer
+SQLITE_TRIGRAM_VERSION = (3, 34, 0)
+
+SQLITE_FORWARDS = [
+    "CREATE VIRTUAL TABLE people_person_fts USING fts5("
+    "username, full_name, content='people_person', content_rowid='id', "
+    "tokenize='trigram')",
+    "CREATE TRIGGER people_person_fts_insert AFTER INSERT ON people_person BEGIN "
+    "INSERT INTO people_person_fts(rowid, username, full_name) "
+    "VALUES (new.id, new.username, new.full_name); END",
+    "CREATE TRIGGER people_person_fts_delete AFTER DELETE ON people_person BEGIN "
+    "INSERT INTO people_person_fts(people_person_fts, rowid, username, full_name) "
+    "VALUES ('delete', old.id, old.username, old.full_name); END",
+    "CREATE TRIGGER people_person_fts_update AFTER UPDATE ON people_person BEGIN "
+    "INSERT INTO people_person_fts(people_person_fts, rowid, username, full_name) "
+    "VALUES ('delete', old.id, old.username, old.full_name); "
+    "INSERT INTO people_person_fts(rowid, username, full_name) "
+    "VALUES (new.id, new.username, new.full_name); END",
+    "INSERT INTO people_person_fts(people_person_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARDS = [
+    "DROP TRIGGER IF EXISTS people_person_fts_insert",
+    "DROP TRIGGER IF EXISTS people_person_fts_delete",
+    "DROP TRIGGER IF EXISTS people_person_fts_update",
+    "DROP TABLE IF EXISTS people_person_fts",
+]
+
+
+def run_statements(schema_editor, statements):
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def is_trigram_extension_available(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def is_trigram_tokenizer_available(schema_editor):
+    version = schema_editor.connection.Database.sqlite_version_info
+    return version >= SQLITE_TRIGRAM_VERSION
+
+
+def create_search_indexes(apps, schema_editor):
+    statements = {"postgresql": POSTGRESQL_FORWARDS, "sqlite": SQLITE_FORWARDS}
+    vendor = schema_editor.connection.vendor
+    # without trigrams, `get_search_backend()` falls back to SearchBackend
+    if vendor == "postgresql" and not is_trigram_extension_available(schema_editor):
+        return
+    if vendor == "sqlite" and not is_trigram_tokenizer_available(schema_editor):
+        return
+    run_statements(schema_editor, statements)
+
+
+def drop_search_indexes(apps, schema_editor):
+    statements = {"postgresql": POSTGRESQL_BACKWARDS, "sqlite": SQLITE_BACKWARDS}
+    run_statements(schema_editor, statements)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0008_personnametoken"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersonSearchDocument",
+            fields=[
+                (
+                    "person",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="people.person",
+                    ),
+                ),
+                ("document", models.TextField(db_column="people_person_fts")),
+                ("rank", models.FloatField()),
+            ],
+            options={
+                "db_table": "people_person_fts",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
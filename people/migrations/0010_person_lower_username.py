@@ -0,0 +1,53 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:48
+
+from django.core.management.base import CommandError
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+import django.db.models.functions.text
+
+DUPLICATE_USERNAMES_ERROR = (
+    "Usernames must be unique ignoring case before the unique index on "
+    "LOWER(username) is added. Rename the people with these usernames: %s"
+)
+
+
+def check_case_insensitive_usernames(apps, schema_editor):
+    """Reports the usernames that only differ in case, which the forms used to
+    accept, instead of failing to add the index
+    """
+    Person = apps.get_model("people", "Person")
+
+    people = Person.objects.annotate(lower_username=Lower("username"))
+    duplicates = (
+        people.values("lower_username")
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .values("lower_username")
+    )
+    usernames = people.filter(lower_username__in=duplicates).values_list(
+        "username", flat=True
+    )
+    if usernames:
+        usernames = ", ".join(sorted(usernames, key=lambda u: (u.lower(), u)))
+        raise CommandError(DUPLICATE_USERNAMES_ERROR % usernames)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0009_person_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_insensitive_usernames, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="person",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("username"),
+                name="people_unique_person_lower_username",
+            ),
+        ),
+    ]
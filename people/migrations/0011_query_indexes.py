@@ -0,0 +1,40 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0010_person_lower_username"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="interpersonalrelationship",
+            name="person",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="relationships",
+                to="people.person",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="interpersonalrelationship",
+            index=models.Index(
+                fields=["relation", "created_at"], name="people_rel_relation_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=models.Index(
+                fields=["created_by", "full_name"], name="people_person_creator_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=models.Index(fields=["created_at"], name="people_person_created_idx"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.10 on 2026-10-17 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0011_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="person",
+            index=models.Index(fields=["dob"], name="people_person_dob_idx"),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.0.10 on 2026-10-17 01:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# the index Django created for the foreign key, named the same on every database
+CREATED_BY_INDEX = "people_person_created_by_id_82aa5eb7"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("people", "0012_person_dob_index"),
+    ]
+
+    operations = [
+        # AlterField would rebuild the table on SQLite, which drops the triggers
+        # that keep people_person_fts up to date, so the index is dropped directly
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="person",
+                    name="created_by",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        help_text="The user who created this record.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="people_creators",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    f"DROP INDEX {CREATED_BY_INDEX}",
+                    f"CREATE INDEX {CREATED_BY_INDEX} "
+                    "ON people_person (created_by_id)",
+                ),
+            ],
+        ),
+    ]
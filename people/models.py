@@ -1,9 +1,12 @@
 import uuid
+from datetime import date
 
 from django.conf import settings
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import ExtractYear, Lower
 from django.urls import reverse
+from django.utils.functional import cached_property
 
 from phonenumber_field.modelfields import PhoneNumberField
 
@@ -12,10 +15,113 @@ from .constants import (
     GENDER_CHOICES,
     INTERPERSONAL_RELATIONSHIP_CHOICES,
 )
-from .utils import get_age, get_age_category
+from .utils import (
+    AGE_CATEGORIES,
+    get_age,
+    get_age_category,
+    get_years_ago,
+    update_name_tokens,
+)
 from .validators import validate_full_name
 
 
+class PersonQuerySet(models.QuerySet):
+    def with_age(self):
+        """Annotates each person's age, age category and whether they're an adult.
+
+        The annotations are computed by the database and replace the `Person`
+        properties of the same name.
+        """
+        today = date.today()
+        had_birthday = models.Q(dob__month__lt=today.month) | models.Q(
+            dob__month=today.month, dob__day__lte=today.day
+        )
+        age = models.ExpressionWrapper(
+            today.year
+            - ExtractYear("dob")
+            - models.Case(models.When(had_birthday, then=0), default=1),
+            output_field=models.IntegerField(),
+        )
+        age_category = models.Case(
+            *[
+                models.When(age__range=age_range, then=models.Value(category))
+                for category, age_range in AGE_CATEGORIES.items()
+            ],
+            default=None,
+            output_field=models.CharField(),
+        )
+        is_adult = models.Case(
+            models.When(age__gte=AGE_OF_MAJORITY, then=True),
+            default=False,
+            output_field=models.BooleanField(),
+        )
+        queryset = self.annotate(age=age)
+        return queryset.annotate(age_category=age_category, is_adult=is_adult)
+
+    def with_usernames(self, usernames):
+        """Filters people by their usernames, ignoring case.
+
+        Unlike `username__iexact`, the filter is served by the unique index on
+        `LOWER(username)`.
+        """
+        usernames = [Lower(models.Value(username)) for username in usernames]
+        queryset = self.alias(lower_username=Lower("username"))
+        return queryset.filter(lower_username__in=usernames)
+
+    def with_username(self, username):
+        return self.with_usernames([username])
+
+    def in_bulk_by_username(self, usernames):
+        """Returns the people with `usernames`, ignoring case, by their lowercased
+        usernames
+        """
+        if not usernames:
+            return {}
+        people = self.with_usernames(usernames)
+        return {person.username.lower(): person for person in people}
+
+    def with_shared_name_tokens(self, tokens):
+        """Filters the people with any of the name `tokens`, and annotates how many
+        of them each person has and how many name tokens they have in all.
+
+        A person whose name tokens are all among `tokens` has as many
+        `shared_tokens` as `name_token_count`.
+        """
+        token_count = (
+            PersonNameToken.objects.filter(person=models.OuterRef("pk"))
+            .values("person")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        queryset = self.filter(name_tokens__token__in=tokens)
+        return queryset.annotate(
+            shared_tokens=models.Count("name_tokens"),
+            name_token_count=models.Subquery(token_count),
+        )
+
+    def aged(self, minimum=None, maximum=None):
+        """Filters people by their age in years, both bounds inclusive.
+
+        The bounds are converted to a date of birth range, so the filter can use
+        an index on `dob`.
+        """
+        queryset = self
+        if minimum is not None:
+            queryset = queryset.filter(dob__lte=get_years_ago(minimum))
+        if maximum is not None:
+            queryset = queryset.filter(dob__gt=get_years_ago(maximum + 1))
+        return queryset
+
+    def in_age_category(self, age_category):
+        return self.aged(*AGE_CATEGORIES[age_category])
+
+    def adults(self):
+        return self.aged(minimum=AGE_OF_MAJORITY)
+
+    def children(self):
+        return self.aged(maximum=AGE_OF_MAJORITY - 1)
+
+
 class Person(models.Model):
     username = models.CharField(
         max_length=50,
@@ -37,41 +143,112 @@ class Person(models.Model):
         to=settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
         null=True,
+        db_index=False,  # people_person_creator_idx starts with this column
         help_text="The user who created this record.",
         related_name="people_creators",
     )
     created_at = models.DateTimeField(auto_now_add=True)
     last_modified = models.DateTimeField(auto_now=True)
 
+    objects = PersonQuerySet.as_manager()
+
     class Meta:  # noqa
+        constraints = [
+            models.UniqueConstraint(
+                Lower("username"), name="%(app_label)s_unique_%(class)s_lower_username"
+            )
+        ]
+        indexes = [
+            # the names of the people a user has added, for is_duplicate_person
+            models.Index(
+                fields=["created_by", "full_name"], name="people_person_creator_idx"
+            ),
+            models.Index(fields=["created_at"], name="people_person_created_idx"),
+            # the date of birth ranges of aged() and in_age_category()
+            models.Index(fields=["dob"], name="people_person_dob_idx"),
+        ]
         ordering = ["username"]
         verbose_name_plural = "people"
 
     def __str__(self):
         return self.username
 
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "full_name" in update_fields:
+            update_name_tokens(self)
+
     def get_absolute_url(self):
         return reverse("people:person_detail", kwargs={"username": self.username})
 
-    @property
+    # overridden by the annotations of `PersonQuerySet.with_age()`
+    @cached_property
     def age(self):
         return get_age(self.dob)
 
-    @property
+    @cached_property
     def age_category(self):
         return get_age_category(self.age)
 
-    @property
+    @cached_property
     def is_adult(self):
         return self.age >= AGE_OF_MAJORITY
 
 
+class PersonNameToken(models.Model):
+    person = models.ForeignKey(
+        to=Person, on_delete=models.CASCADE, related_name="name_tokens"
+    )
+    token = models.CharField(
+        max_length=300, help_text="A normalized token from the person's full name."
+    )
+
+    class Meta:  # noqa
+        constraints = [
+            models.UniqueConstraint(
+                fields=["token", "person"],
+                name="%(app_label)s_unique_%(class)s",
+            )
+        ]
+        db_table = "people_name_token"
+
+    def __str__(self):
+        return self.token
+
+
+class PersonSearchDocument(models.Model):
+    """A row of the SQLite full-text search index on people.
+
+    The FTS5 table is kept in sync with the people table by triggers, and only
+    exists on SQLite databases.
+    """
+
+    person = models.OneToOneField(
+        to=Person,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="+",
+    )
+    document = models.TextField(db_column="people_person_fts")
+    rank = models.FloatField()
+
+    class Meta:  # noqa
+        db_table = "people_person_fts"
+        managed = False
+
+
 class InterpersonalRelationship(models.Model):
     id = models.UUIDField(
         editable=False, default=uuid.uuid4, primary_key=True, verbose_name="ID"
     )
     person = models.ForeignKey(
-        to=Person, on_delete=models.CASCADE, related_name="relationships"
+        to=Person,
+        on_delete=models.CASCADE,
+        related_name="relationships",
+        db_index=False,  # covered by the unique constraint on person and relative
     )
     relative = models.ForeignKey(
         to=Person, on_delete=models.CASCADE, related_name="reverse_relationships"
@@ -98,6 +275,11 @@ class InterpersonalRelationship(models.Model):
             )
         ]
         db_table = "people_relationship"
+        indexes = [
+            models.Index(
+                fields=["relation", "created_at"], name="people_rel_relation_idx"
+            ),
+        ]
         ordering = ["person__username"]
 
     def __str__(self):
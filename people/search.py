@@ -0,0 +1,200 @@
+from functools import lru_cache, reduce
+from operator import and_, or_
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, FloatField, Lookup, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest, Least
+from django.utils.module_loading import import_string
+
+from extra_views import SearchableListMixin
+
+DEFAULT_SEARCH_BACKENDS = {
+    "postgresql": "people.search.PostgresSearchBackend",
+    "sqlite": "people.search.SQLiteSearchBackend",
+}
+
+# the person fields covered by the database search indexes
+INDEXED_FIELDS = ["username", "full_name"]
+
+# the first SQLite version whose FTS5 provides the trigram tokenizer
+SQLITE_TRIGRAM_VERSION = (3, 34, 0)
+
+
+class Match(Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", [*lhs_params, *rhs_params]
+
+
+@lru_cache(maxsize=None)
+def has_trigram_extension():
+    """Whether the `pg_trgm` extension is installed in the PostgreSQL database.
+
+    The search indexes migration skips the extension and its indexes if the
+    server doesn't provide it.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def has_trigram_tokenizer():
+    """Whether SQLite's FTS5 provides the trigram tokenizer.
+
+    The search indexes migration skips the `people_person_fts` table on SQLite
+    versions before 3.34.
+    """
+    return connection.Database.sqlite_version_info >= SQLITE_TRIGRAM_VERSION
+
+
+def get_search_backend():
+    backend = settings.SEARCH_BACKEND
+    if backend is None:
+        backend = DEFAULT_SEARCH_BACKENDS.get(
+            connection.vendor, "people.search.SearchBackend"
+        )
+        if connection.vendor == "postgresql" and not has_trigram_extension():
+            backend = "people.search.SearchBackend"
+        if connection.vendor == "sqlite" and not has_trigram_tokenizer():
+            backend = "people.search.SearchBackend"
+    return import_string(backend)()
+
+
+def get_default_ordering(queryset):
+    return list(queryset.query.order_by or queryset.model._meta.ordering)
+
+
+class SearchBackend:
+    """Matches each word of the query with any of the search fields.
+
+    This is how `extra_views.SearchableListMixin` searches. It works on any
+    database but can neither use an index nor rank the results.
+    """
+
+    def get_word_filter(self, word, search_fields):
+        filters = [Q(**{f"{field}__icontains": word}) for field in search_fields]
+        return reduce(or_, filters)
+
+    def filter(self, queryset, words, search_fields):
+        filters = [self.get_word_filter(word, search_fields) for word in words]
+        return queryset.filter(reduce(and_, filters))
+
+    def search(self, queryset, query, search_fields):
+        words = query.split()
+        if not words:
+            return queryset
+        return self.filter(queryset, words, search_fields)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Ranks the matches by their trigram word similarity to the query.
+
+    The `icontains` lookups on `username` and `full_name` are served by the
+    `UPPER(...) gin_trgm_ops` indexes on the people table.
+    """
+
+    def search(self, queryset, query, search_fields):
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        ordering = get_default_ordering(queryset)
+        queryset = super().search(queryset, query, search_fields)
+        similarities = [TrigramWordSimilarity(query, f) for f in search_fields]
+        if len(similarities) > 1:
+            rank = Greatest(*similarities)
+        else:
+            rank = similarities[0]
+        return queryset.annotate(search_rank=rank).order_by("-search_rank", *ordering)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Matches and ranks people with the `people_person_fts` FTS5 table.
+
+    The table uses the trigram tokenizer, so it finds the same case-insensitive
+    substrings as `icontains` for words of at least three characters. Shorter
+    words and fields that aren't indexed fall back to `icontains`.
+    """
+
+    min_word_length = 3
+
+    @staticmethod
+    def get_match_expression(words, columns):
+        columns = " ".join(columns)
+        words = ['"{}"'.format(word.replace('"', '""')) for word in words]
+        return " AND ".join(f"{{{columns}}} : {word}" for word in words)
+
+    @staticmethod
+    def get_documents(expression):
+        from .models import PersonSearchDocument
+
+        return PersonSearchDocument.objects.filter(Match(F("document"), expression))
+
+    def get_indexed_fields(self, search_fields):
+        """Groups the indexed search fields by the path to their person"""
+        indexed_fields = {}
+        for field in search_fields:
+            prefix, _, name = field.rpartition("__")
+            if name in INDEXED_FIELDS:
+                prefix = f"{prefix}__" if prefix else ""
+                indexed_fields.setdefault(prefix, []).append(name)
+        return indexed_fields
+
+    def get_word_filter(self, word, search_fields):
+        if len(word) < self.min_word_length:
+            return super().get_word_filter(word, search_fields)
+
+        indexed_fields = self.get_indexed_fields(search_fields)
+        filters = [
+            Q(**{f"{field}__icontains": word})
+            for field in search_fields
+            if field.rpartition("__")[2] not in INDEXED_FIELDS
+        ]
+        for prefix, columns in indexed_fields.items():
+            expression = self.get_match_expression([word], columns)
+            documents = self.get_documents(expression).values("person_id")
+            filters.append(Q(**{f"{prefix}pk__in": documents}))
+        return reduce(or_, filters)
+
+    def search(self, queryset, query, search_fields):
+        ordering = get_default_ordering(queryset)
+        queryset = super().search(queryset, query, search_fields)
+        words = [word for word in query.split() if len(word) >= self.min_word_length]
+        indexed_fields = self.get_indexed_fields(search_fields)
+        if not words or not indexed_fields:
+            return queryset
+
+        # bm25 ranks are negative and a lower rank means a better match
+        ranks = []
+        for prefix, columns in indexed_fields.items():
+            expression = self.get_match_expression(words, columns)
+            documents = self.get_documents(expression).filter(
+                person=OuterRef(f"{prefix}pk")
+            )
+            rank = Subquery(documents.values("rank")[:1], output_field=FloatField())
+            ranks.append(Coalesce(rank, 0.0))
+        rank = Least(*ranks) if len(ranks) > 1 else ranks[0]
+        return queryset.annotate(search_rank=rank).order_by("search_rank", *ordering)
+
+
+class SearchMixin(SearchableListMixin):
+    """Searches a `ListView` with the configured search backend.
+
+    The backends may order the matches by their rank, which a cursor can't seek
+    past, so search results are paginated by page number.
+    """
+
+    def get_cursor_pagination(self):
+        if self.get_search_query():
+            return False
+        return super().get_cursor_pagination()
+
+    def get_queryset(self):
+        queryset = super(SearchableListMixin, self).get_queryset()
+        query = self.get_search_query()
+        if query:
+            search_fields = [f for f, _ in self.get_search_fields_with_filters()]
+            queryset = get_search_backend().search(queryset, query, search_fields)
+        return queryset
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+
+from core.cache import invalidate_cache
+
+from .models import InterpersonalRelationship, Person
+
+
+def connect_signals():
+    for model in [Person, InterpersonalRelationship]:
+        post_save.connect(invalidate_cache, sender=model)
+        post_delete.connect(invalidate_cache, sender=model)
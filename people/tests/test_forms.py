@@ -1,5 +1,6 @@
 from datetime import date, timedelta
 
+from django.core.exceptions import ValidationError
 from django.test import SimpleTestCase, TestCase
 from django.utils.module_loading import import_string
 
@@ -79,6 +80,21 @@ class PersonUpdateUsernameTestCase(PersonUpdateFormFieldsTestCase):
         errors = {"username": ["A person with that username already exists."]}
         self.assertEqual(form.errors, errors)
 
+    def test_non_unique_value_in_another_case(self):
+        person = PersonFactory()
+        data = self.data.copy()
+        data["username"] = person.username.upper()
+        form = self.form(data=data)
+        self.assertFalse(form.is_valid())
+        errors = {"username": ["A person with that username already exists."]}
+        self.assertEqual(form.errors, errors)
+
+    def test_unchanged_value_of_instance(self):
+        person = PersonFactory()
+        data = {"username": person.username.upper(), "full_name": person.full_name}
+        form = self.form(data=data, instance=person)
+        self.assertTrue(form.is_valid())
+
     def test_value_with_spaces(self):
         # setup
         data = self.data.copy()
@@ -754,6 +770,27 @@ class ChildCreationIsParentTestCase(ChildCreationFormFieldsTestCase):
         self.assertFalse(self.field.required)
 
 
+class PersonUsernameFieldTestCase(TestCase):
+    def test_clean(self):
+        person = PersonFactory()
+        field = forms.PersonUsernameField()
+        with self.assertNumQueries(1):
+            self.assertEqual(field.clean(person.username), person)
+
+    def test_clean_ignores_case(self):
+        person = PersonFactory(username="jane")
+        field = forms.PersonUsernameField()
+        self.assertEqual(field.clean("JANE"), person)
+
+    def test_non_existent_person(self):
+        field = forms.PersonUsernameField()
+        with self.assertRaisesMessage(
+            ValidationError,
+            validators.PERSON_DOES_NOT_EXIST_ERROR % dict(username="does-not-exist"),
+        ):
+            field.clean("does-not-exist")
+
+
 class ParentChildRelationshipCreationFormTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -796,17 +833,13 @@ class ParentChildRelationshipCreationPersonTestCase(
         self.assertTrue(self.field.required)
 
     def test_validators(self):
-        self.assertEqual(len(self.field.validators), 3)
-        self.assertEqual(
-            self.field.validators[0],
-            import_string("people.validators.validate_person_username"),
-        )
+        self.assertEqual(len(self.field.validators), 2)
         self.assertIsInstance(
-            self.field.validators[1],
+            self.field.validators[0],
             import_string("django.core.validators.MaxLengthValidator"),
         )
         self.assertIsInstance(
-            self.field.validators[2],
+            self.field.validators[1],
             import_string("django.core.validators.ProhibitNullCharactersValidator"),
         )
 
@@ -856,6 +889,21 @@ class InterpersonalRelationshipCreationFormTestCase(TestCase):
         errors = {"__all__": [forms.DUPLICATE_RELATIONSHIPS_ERROR]}
         self.assertEqual(form.errors, errors)
 
+    def test_number_of_queries(self):
+        person, relative = PersonFactory(), PersonFactory()
+        data = {
+            "person": person.username,
+            "relative": relative.username,
+            "relation": InterpersonalRelationshipFactory.build().relation,
+        }
+        form = self.form_class(data=data)
+        # the people, the model validation's checks that each of them exists
+        # and the check for a duplicate relationship
+        with self.assertNumQueries(4):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["person"], person)
+        self.assertEqual(form.cleaned_data["relative"], relative)
+
 
 class InterpersonalRelationshipCreationFormFieldsTestCase(TestCase):
     @classmethod
@@ -892,17 +940,13 @@ class InterpersonalRelationshipPersonTestCase(
         self.assertTrue(self.field.required)
 
     def test_validators(self):
-        self.assertEqual(len(self.field.validators), 3)
-        self.assertEqual(
-            self.field.validators[0],
-            import_string("people.validators.validate_person_username"),
-        )
+        self.assertEqual(len(self.field.validators), 2)
         self.assertIsInstance(
-            self.field.validators[1],
+            self.field.validators[0],
             import_string("django.core.validators.MaxLengthValidator"),
         )
         self.assertIsInstance(
-            self.field.validators[2],
+            self.field.validators[1],
             import_string("django.core.validators.ProhibitNullCharactersValidator"),
         )
 
@@ -937,17 +981,13 @@ class InterpersonalRelationshipRelativeTestCase(
         self.assertTrue(self.field.required)
 
     def test_validators(self):
-        self.assertEqual(len(self.field.validators), 3)
-        self.assertEqual(
-            self.field.validators[0],
-            import_string("people.validators.validate_person_username"),
-        )
+        self.assertEqual(len(self.field.validators), 2)
         self.assertIsInstance(
-            self.field.validators[1],
+            self.field.validators[0],
             import_string("django.core.validators.MaxLengthValidator"),
         )
         self.assertIsInstance(
-            self.field.validators[2],
+            self.field.validators[1],
             import_string("django.core.validators.ProhibitNullCharactersValidator"),
         )
 
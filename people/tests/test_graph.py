@@ -0,0 +1,120 @@
+from django.test import TestCase
+
+from people.factories import InterpersonalRelationshipFactory, PersonFactory
+from people.graph import FamilyGraph, FamilyTree
+
+
+class FamilyTestCase(TestCase):
+    """
+    grandma -PC-> dad -M- mum
+                  dad -PC-> son, mum -PC-> daughter, son -S- daughter
+                  son -PC-> grandson
+    stranger has no relationships
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        for name in [
+            "grandma",
+            "dad",
+            "mum",
+            "son",
+            "daughter",
+            "grandson",
+            "stranger",
+        ]:
+            setattr(cls, name, PersonFactory(username=name))
+        for person, relative, relation in [
+            (cls.grandma, cls.dad, "PC"),
+            (cls.dad, cls.mum, "M"),
+            (cls.dad, cls.son, "PC"),
+            (cls.mum, cls.daughter, "PC"),
+            (cls.son, cls.daughter, "S"),
+            (cls.son, cls.grandson, "PC"),
+        ]:
+            InterpersonalRelationshipFactory(
+                person=person, relative=relative, relation=relation
+            )
+
+
+class FamilyGraphTestCase(FamilyTestCase):
+    recursive = True
+
+    def setUp(self):
+        self.graph = FamilyGraph(recursive=self.recursive)
+
+    def test_household(self):
+        self.assertQuerysetEqual(
+            self.graph.household(self.dad),
+            [self.dad, self.daughter, self.mum, self.son],
+            ordered=False,
+        )
+
+    def test_descendants(self):
+        self.assertQuerysetEqual(
+            self.graph.descendants(self.grandma),
+            [self.dad, self.son, self.grandson],
+            ordered=False,
+        )
+
+    def test_ancestors(self):
+        self.assertQuerysetEqual(
+            self.graph.ancestors(self.grandson),
+            [self.son, self.dad, self.grandma],
+            ordered=False,
+        )
+
+    def test_family(self):
+        self.assertQuerysetEqual(
+            self.graph.family(self.daughter),
+            [self.grandma, self.dad, self.mum, self.son, self.grandson],
+            ordered=False,
+        )
+
+    def test_no_relationships(self):
+        self.assertQuerysetEqual(self.graph.family(self.stranger), [])
+
+    def test_cycle(self):
+        InterpersonalRelationshipFactory(
+            person=self.grandson, relative=self.grandma, relation="PC"
+        )
+        self.assertEqual(self.graph.descendants(self.grandma).count(), 3)
+
+    def test_relationships(self):
+        self.assertEqual(self.graph.relationships(self.grandson).count(), 6)
+        self.assertEqual(self.graph.relationships(self.stranger).count(), 0)
+
+    def test_number_of_queries(self):
+        with self.assertNumQueries(1):
+            list(self.graph.family(self.grandma))
+
+
+class BreadthFirstFamilyGraphTestCase(FamilyGraphTestCase):
+    recursive = False
+
+    def test_number_of_queries(self):
+        # a query per generation, including the childless last one, and the people
+        with self.assertNumQueries(5):
+            list(self.graph.descendants(self.grandma))
+
+
+class FamilyTreeTestCase(FamilyTestCase):
+    def test_tree(self):
+        with self.assertNumQueries(1):
+            tree = FamilyTree.for_person(self.son)
+        self.assertEqual(tree.parents, [self.dad])
+        self.assertEqual(tree.partners, [])
+        self.assertEqual(tree.siblings, [self.daughter])
+        self.assertEqual(tree.children, [self.grandson])
+        self.assertEqual(tree.ancestors, [self.dad, self.grandma])
+        self.assertEqual(tree.descendants, [self.grandson])
+        self.assertEqual(
+            tree.relatives,
+            [self.dad, self.daughter, self.grandma, self.grandson, self.mum],
+        )
+
+    def test_tree_without_relationships(self):
+        tree = FamilyTree.for_person(self.stranger)
+        self.assertEqual(tree.relatives, [])
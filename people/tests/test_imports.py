@@ -0,0 +1,443 @@
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db.models import QuerySet
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from accounts.factories import UserFactory
+from people.factories import PersonFactory
+from people.forms import DUPLICATE_RELATIONSHIPS_ERROR, SELF_RELATIONSHIPS_ERROR
+from people.imports import (
+    PARENT_CHILD_CYCLE_ERROR,
+    ImportRowError,
+    NameIndex,
+    PersonImporter,
+    RelationshipImporter,
+    iter_json_list,
+)
+from people.models import InterpersonalRelationship, Person, PersonNameToken
+
+HEADER = ["username", "full_name", "gender", "dob", "phone_number"]
+RELATIONSHIP_HEADER = ["person", "relative", "relation"]
+
+
+def build_csv(rows, header=HEADER):
+    file = io.StringIO()
+    writer = csv.writer(file)
+    writer.writerow(header)
+    writer.writerows(rows)
+    file.seek(0)
+    return file
+
+
+class PersonImporterTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.user = UserFactory()
+        cls.existing_person = PersonFactory(
+            username="jane", full_name="Jane Doe", created_by=cls.user
+        )
+
+    def setUp(self):
+        self.importer = PersonImporter(created_by=self.user, chunk_size=2)
+
+    def test_import(self):
+        rows = [
+            ["john", "John Smith", "M", "1990-01-01", "+254712345678"],
+            ["mary", "Mary Atieno", "F", "2015-06-30", ""],
+            ["peter", "Peter Otieno", "M", "1985-03-12", ""],
+        ]
+        result = self.importer.import_file(build_csv(rows))
+        self.assertEqual(result.created, 3)
+        self.assertEqual(result.errors, [])
+        people = Person.objects.filter(created_by=self.user).exclude(username="jane")
+        self.assertQuerysetEqual(
+            people.values_list("username", flat=True),
+            ["john", "mary", "peter"],
+            transform=str,
+        )
+        self.assertIsNone(Person.objects.get(username="mary").phone_number)
+        self.assertEqual(
+            set(
+                PersonNameToken.objects.filter(person__username="john").values_list(
+                    "token", flat=True
+                )
+            ),
+            {"john", "smith"},
+        )
+
+    def test_row_errors(self):
+        rows = [
+            ["john", "John", "M", "1990-01-01", ""],
+            ["jane", "Jane Atieno", "F", "1990-01-01", ""],
+            ["mary", "Mary Atieno", "X", "1990-01-01", ""],
+            ["peter", "Peter Otieno", "M", "1985-03-12", ""],
+        ]
+        result = self.importer.import_file(build_csv(rows))
+        self.assertEqual(result.created, 1)
+        self.assertEqual([error.row for error in result.errors], [2, 3, 4])
+        self.assertIn("full_name", result.errors[0].errors)
+        self.assertEqual(
+            result.errors[1].errors,
+            {"username": ["A person with that username already exists."]},
+        )
+        self.assertIn("gender", result.errors[2].errors)
+
+    def test_duplicates(self):
+        rows = [
+            ["jane_doe", "Doe Jane", "F", "1990-01-01", ""],
+            ["john", "John Smith", "M", "1990-01-01", ""],
+            ["john", "John Otieno", "M", "1990-01-01", ""],
+            ["smith", "John Smith", "M", "1990-01-01", ""],
+        ]
+        result = self.importer.import_file(build_csv(rows))
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            [(error.row, list(error.errors)) for error in result.errors],
+            [(2, ["__all__"]), (4, ["username"]), (5, ["__all__"])],
+        )
+
+    def test_duplicates_of_existing_people(self):
+        for full_name in ["John Smith", "Mary Atieno Otieno", "John Otieno"]:
+            PersonFactory(full_name=full_name, created_by=self.user)
+        rows = [
+            ["smith", "Smith John", "M", "1990-01-01", ""],
+            ["john_kamau", "John Kamau Smith", "M", "1990-01-01", ""],
+            ["mary", "Mary Otieno", "F", "1990-01-01", ""],
+            ["mary_wanjiku", "Mary Wanjiku", "F", "1990-01-01", ""],
+        ]
+        result = self.importer.import_file(build_csv(rows))
+        self.assertEqual(result.created, 1)
+        self.assertEqual([error.row for error in result.errors], [2, 3, 4])
+
+    def test_usernames_in_another_case(self):
+        rows = [
+            ["JANE", "Jane Atieno", "F", "1990-01-01", ""],
+            ["peter", "Peter Otieno", "M", "1985-03-12", ""],
+            ["Peter", "Peter Omondi", "M", "1986-04-13", ""],
+        ]
+        result = self.importer.import_file(build_csv(rows))
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            [(error.row, list(error.errors)) for error in result.errors],
+            [(2, ["username"]), (4, ["username"])],
+        )
+
+    def test_missing_columns(self):
+        with self.assertRaises(ValueError):
+            self.importer.import_file(build_csv([], header=["username"]))
+
+    def test_number_of_queries(self):
+        rows = [
+            [f"person{i}", f"Person Number{i}", "M", "1990-01-01", ""]
+            for i in range(10)
+        ]
+        importer = PersonImporter(created_by=self.user, chunk_size=10)
+        # check usernames, count the name tokens and fetch the names they may
+        # duplicate, then insert people and name tokens between a savepoint and
+        # its release
+        with self.assertNumQueries(7):
+            importer.import_file(build_csv(rows))
+
+    def test_result(self):
+        rows = [["john", "John Smith", "M", "1990-01-01", ""]]
+        result = self.importer.import_file(build_csv(rows))
+        self.assertEqual(result.rows, 1)
+        self.assertGreater(result.rows_per_second, 0)
+        self.assertTrue(str(result).startswith("Imported 1 of 1 people in "))
+
+
+class NameIndexTestCase(SimpleTestCase):
+    def test_candidates(self):
+        index = NameIndex(
+            ["John Smith", "John", "John Kamau Smith", "Mary Smith", "Smith John"]
+        )
+        self.assertEqual(
+            index.get_candidates({"john", "smith"}),
+            {"John Smith", "John", "John Kamau Smith", "Smith John"},
+        )
+        self.assertEqual(index.get_candidates({"mary"}), {"Mary Smith"})
+        self.assertEqual(index.get_candidates({"peter"}), set())
+        self.assertEqual(index.get_candidates(set()), set())
+
+    def test_candidates_of_a_long_name(self):
+        tokens = {f"name{number}" for number in range(12)}
+        index = NameIndex(["Name1 Name2", "Name1 Other"])
+        self.assertEqual(index.get_candidates(tokens), {"Name1 Name2"})
+
+
+class ImportPeopleCommandTestCase(TestCase):
+    def test_import(self):
+        user = UserFactory()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "people.csv"
+            rows = [
+                ["john", "John Smith", "M", "1990-01-01", ""],
+                ["mary", "Mary", "F", "1990-01-01", ""],
+            ]
+            path.write_text(build_csv(rows).getvalue())
+            stdout, stderr = io.StringIO(), io.StringIO()
+            call_command(
+                "import_people",
+                str(path),
+                f"--created-by={user.email}",
+                stdout=stdout,
+                stderr=stderr,
+            )
+        self.assertIn("Imported 1 of 2 people", stdout.getvalue())
+        self.assertIn("Row 3: full_name:", stderr.getvalue())
+        self.assertEqual(Person.objects.get(username="john").created_by, user)
+
+    def test_missing_file(self):
+        with self.assertRaises(CommandError):
+            call_command("import_people", "does-not-exist.csv")
+
+    def test_unknown_user(self):
+        message = "A user with email 'nobody@example.com' does not exist"
+        with self.assertRaisesMessage(CommandError, message):
+            call_command(
+                "import_people",
+                "people.csv",
+                "--created-by=nobody@example.com",
+            )
+
+
+class RelationshipImporterTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.user = UserFactory()
+        for username in ["grandma", "mum", "dad", "son", "daughter"]:
+            PersonFactory(username=username)
+        InterpersonalRelationship.objects.create(
+            person=Person.objects.get(username="grandma"),
+            relative=Person.objects.get(username="mum"),
+            relation="PC",
+        )
+
+    def setUp(self):
+        self.importer = RelationshipImporter(created_by=self.user, chunk_size=2)
+
+    def get_relationships(self):
+        return set(
+            InterpersonalRelationship.objects.values_list(
+                "person__username", "relative__username", "relation"
+            )
+        )
+
+    def test_import(self):
+        rows = [
+            ["mum", "son", "PC"],
+            ["Dad", "SON", "PC"],
+            ["mum", "dad", "M"],
+            ["son", "daughter", "S"],
+        ]
+        result = self.importer.import_file(build_csv(rows, header=RELATIONSHIP_HEADER))
+        self.assertEqual(result.created, 4)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(
+            self.get_relationships(),
+            {
+                ("grandma", "mum", "PC"),
+                ("mum", "son", "PC"),
+                ("dad", "son", "PC"),
+                ("mum", "dad", "M"),
+                ("son", "daughter", "S"),
+            },
+        )
+        self.assertEqual(
+            InterpersonalRelationship.objects.filter(created_by=self.user).count(), 4
+        )
+
+    def test_import_json(self):
+        rows = [{"person": "mum", "relative": "son", "relation": "PC"}]
+        result = self.importer.import_file(io.StringIO(json.dumps(rows)), "json")
+        self.assertEqual(result.created, 1)
+        self.assertIn(("mum", "son", "PC"), self.get_relationships())
+
+    def test_row_errors(self):
+        rows = [
+            ["mum", "son", "X"],
+            ["mum", "MUM", "S"],
+            ["mum", "nobody", "S"],
+            ["grandma", "mum", "PC"],
+            ["dad", "son", "PC"],
+            ["dad", "son", "PC"],
+        ]
+        result = self.importer.import_file(build_csv(rows, header=RELATIONSHIP_HEADER))
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            [(error.row, list(error.errors)) for error in result.errors],
+            [
+                (2, ["relation"]),
+                (3, ["__all__"]),
+                (4, ["relative"]),
+                (5, ["__all__"]),
+                (7, ["__all__"]),
+            ],
+        )
+        self.assertEqual(
+            result.errors[1].errors, {"__all__": [SELF_RELATIONSHIPS_ERROR]}
+        )
+        self.assertEqual(
+            result.errors[3].errors, {"__all__": [DUPLICATE_RELATIONSHIPS_ERROR]}
+        )
+
+    def test_parent_child_cycles(self):
+        rows = [
+            ["mum", "son", "PC"],
+            ["son", "grandma", "PC"],
+            ["son", "daughter", "PC"],
+            ["daughter", "mum", "PC"],
+            ["son", "mum", "S"],
+        ]
+        result = self.importer.import_file(build_csv(rows, header=RELATIONSHIP_HEADER))
+        self.assertEqual(result.created, 3)
+        self.assertEqual(
+            result.errors,
+            [
+                ImportRowError(3, {"__all__": [PARENT_CHILD_CYCLE_ERROR]}),
+                ImportRowError(5, {"__all__": [PARENT_CHILD_CYCLE_ERROR]}),
+            ],
+        )
+
+    def test_invalid_json(self):
+        for content in [
+            '{"person": "mum"}',
+            "[1, 2]",
+            '[{"person": "mum", "relative": "son", "relation": "PC"},]',
+            '[{"person": "mum", "relative": "son", "relation": "PC"}',
+            '[{"person": "mum", "relative": "son", "relation": "PC"}] []',
+        ]:
+            with self.subTest(content=content):
+                with self.assertRaises(ValueError):
+                    self.importer.import_file(io.StringIO(content), "json")
+
+    def test_import_json_in_parts(self):
+        rows = [
+            {"person": "mum", "relative": "son", "relation": "PC"},
+            {"person": "dad", "relative": "son", "relation": "PC"},
+        ]
+        content = json.dumps(rows, indent=2)
+        self.assertEqual(list(iter_json_list(io.StringIO(content), 5)), rows)
+        self.assertEqual(list(iter_json_list(io.StringIO(" [ ] "), 1)), [])
+
+    def test_import_json_without_columns(self):
+        with self.assertRaises(ValueError):
+            self.importer.import_file(io.StringIO('[{"person": "mum"}]'), "json")
+
+    def test_relationships_added_in_the_meantime(self):
+        rows = [["mum", "son", "PC"], ["dad", "son", "PC"]]
+        bulk_create = QuerySet.bulk_create
+
+        def add_first_relationship(relationships, **kwargs):
+            # another user adds the first relationship before the insert
+            InterpersonalRelationship.objects.create(
+                person=relationships[0].person,
+                relative=relationships[0].relative,
+                relation="PC",
+            )
+            queryset = InterpersonalRelationship.objects.all()
+            return bulk_create(queryset, relationships, **kwargs)
+
+        with patch.object(QuerySet, "bulk_create", side_effect=add_first_relationship):
+            result = self.importer.import_file(
+                build_csv(rows, header=RELATIONSHIP_HEADER)
+            )
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            result.errors,
+            [ImportRowError(2, {"__all__": [DUPLICATE_RELATIONSHIPS_ERROR]})],
+        )
+
+    def test_missing_columns(self):
+        with self.assertRaises(ValueError):
+            self.importer.import_file(build_csv([], header=["person", "relative"]))
+
+    def test_number_of_queries(self):
+        rows = [["mum", "son", "PC"], ["dad", "son", "PC"], ["son", "daughter", "S"]]
+        importer = RelationshipImporter(created_by=self.user, chunk_size=10)
+        # look up the people and their relationships, walk the son's
+        # descendants, then insert and check what was inserted between a
+        # savepoint and its release
+        with self.assertNumQueries(7):
+            importer.import_file(build_csv(rows, header=RELATIONSHIP_HEADER))
+
+    def test_result(self):
+        rows = [["mum", "son", "PC"]]
+        result = self.importer.import_file(build_csv(rows, header=RELATIONSHIP_HEADER))
+        self.assertEqual(result.rows, 1)
+        self.assertGreater(result.rows_per_second, 0)
+        self.assertTrue(str(result).startswith("Imported 1 of 1 relationships in "))
+
+
+class ImportRelationshipsCommandTestCase(TestCase):
+    def test_import(self):
+        user = UserFactory()
+        PersonFactory(username="mum")
+        PersonFactory(username="son")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "relationships.json"
+            rows = [
+                {"person": "mum", "relative": "son", "relation": "PC"},
+                {"person": "mum", "relative": "nobody", "relation": "PC"},
+            ]
+            path.write_text(json.dumps(rows))
+            stdout, stderr = io.StringIO(), io.StringIO()
+            call_command(
+                "import_relationships",
+                str(path),
+                f"--created-by={user.email}",
+                stdout=stdout,
+                stderr=stderr,
+            )
+        self.assertIn("Imported 1 of 2 relationships", stdout.getvalue())
+        self.assertIn("rows/s", stdout.getvalue())
+        self.assertIn("Row 2: relative:", stderr.getvalue())
+        self.assertEqual(InterpersonalRelationship.objects.get().created_by, user)
+
+    def test_unknown_format(self):
+        with self.assertRaises(CommandError):
+            call_command("import_relationships", "relationships.txt")
+
+
+class PersonAdminImportTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        add_person = Permission.objects.filter(codename="add_person")
+        cls.user = UserFactory(is_staff=True, user_permissions=tuple(add_person))
+        cls.url = reverse("admin:people_person_import")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "admin/people/person/import_form.html")
+
+    def test_upload(self):
+        rows = [["john", "John Smith", "M", "1990-01-01", ""]]
+        file = SimpleUploadedFile("people.csv", build_csv(rows).getvalue().encode())
+        response = self.client.post(self.url, {"file": file})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["result"].created, 1)
+        self.assertEqual(Person.objects.get(username="john").created_by, self.user)
+
+    def test_without_permission(self):
+        self.client.force_login(UserFactory(is_staff=True))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
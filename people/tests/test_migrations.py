@@ -0,0 +1,39 @@
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class LowerUsernameMigrationTestCase(TransactionTestCase):
+    migrate_from = [("people", "0009_person_search_indexes")]
+    migrate_to = [("people", "0010_person_lower_username")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        apps = self.migrate(self.migrate_from)
+        apps.get_model("people", "Person").objects.all().delete()
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+        super().tearDown()
+
+    def create_people(self, usernames):
+        apps = self.migrate(self.migrate_from)
+        Person = apps.get_model("people", "Person")
+        for username in usernames:
+            Person.objects.create(
+                username=username, full_name="Jane Doe", dob="1990-01-01"
+            )
+
+    def test_usernames_differing_in_case(self):
+        self.create_people(["jane", "John", "john", "JOHN"])
+        message = "Rename the people with these usernames: JOHN, John, john"
+        with self.assertRaisesMessage(CommandError, message):
+            self.migrate(self.migrate_to)
+
+    def test_unique_usernames(self):
+        self.create_people(["jane", "john"])
+        self.migrate(self.migrate_to)
@@ -1,3 +1,7 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.db import IntegrityError, connection, transaction
 from django.test import SimpleTestCase, TestCase
 from django.utils.module_loading import import_string
 
@@ -7,7 +11,8 @@ from people.constants import (
     INTERPERSONAL_RELATIONSHIP_CHOICES,
 )
 from people.factories import InterpersonalRelationshipFactory, PersonFactory
-from people.utils import get_age, get_age_category
+from people.models import Person
+from people.utils import AGE_CATEGORIES, get_age, get_age_category, get_years_ago
 
 
 class PersonModelTestCase(TestCase):
@@ -44,6 +49,115 @@ class PersonModelTestCase(TestCase):
         self.assertEqual(self.person.is_adult, self.person.age >= AGE_OF_MAJORITY)
 
 
+class PersonQuerySetTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        today = date.today()
+        ages = [0, 12, 13, 17, 18, 19, 20, 29, 30, 44, 45, 65, 66, 115]
+        dobs = []
+        for age in ages:
+            birthday = get_years_ago(age, today)
+            dobs += [birthday, birthday - timedelta(days=1)]
+            if age > 0:
+                dobs.append(birthday + timedelta(days=1))
+        cls.people = [PersonFactory(dob=dob) for dob in dobs]
+
+    def test_with_age(self):
+        for person in Person.objects.with_age():
+            with self.subTest(dob=person.dob):
+                self.assertEqual(person.age, get_age(person.dob))
+                self.assertEqual(person.age_category, get_age_category(person.age))
+                self.assertEqual(person.is_adult, person.age >= AGE_OF_MAJORITY)
+
+    def test_order_by_age(self):
+        people = Person.objects.with_age().order_by("age", "-dob")
+        self.assertEqual(list(people), sorted(self.people, key=lambda p: p.dob)[::-1])
+
+    def test_filter_by_age_category(self):
+        people = Person.objects.with_age().filter(age_category="teenager")
+        self.assertTrue(all(person.age_category == "teenager" for person in people))
+
+    def test_aged(self):
+        people = Person.objects.aged(minimum=18, maximum=29)
+        expected_people = [p for p in self.people if 18 <= get_age(p.dob) <= 29]
+        self.assertQuerysetEqual(people, expected_people, ordered=False)
+
+    def test_in_age_category(self):
+        for age_category in AGE_CATEGORIES:
+            with self.subTest(age_category=age_category):
+                people = Person.objects.in_age_category(age_category)
+                expected_people = [
+                    p for p in self.people if p.age_category == age_category
+                ]
+                self.assertQuerysetEqual(people, expected_people, ordered=False)
+
+    def test_adults(self):
+        expected_people = [p for p in self.people if p.is_adult]
+        self.assertQuerysetEqual(
+            Person.objects.adults(), expected_people, ordered=False
+        )
+
+    def test_children(self):
+        expected_people = [p for p in self.people if not p.is_adult]
+        self.assertQuerysetEqual(
+            Person.objects.children(), expected_people, ordered=False
+        )
+
+
+class PersonSharedNameTokensTestCase(TestCase):
+    def test_with_shared_name_tokens(self):
+        jane = PersonFactory(full_name="Jane Doe")
+        janet = PersonFactory(full_name="Janet Mary Doe")
+        PersonFactory(full_name="John Smith")
+        people = Person.objects.with_shared_name_tokens({"jane", "mary", "doe"})
+        self.assertQuerysetEqual(
+            people,
+            [(jane, 2, 2), (janet, 2, 3)],
+            transform=lambda p: (p, p.shared_tokens, p.name_token_count),
+            ordered=False,
+        )
+
+
+class PersonUsernameLookupTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.person = PersonFactory(username="JaneDoe")
+        cls.other_person = PersonFactory(username="john")
+
+    def test_with_username(self):
+        for username in ["JaneDoe", "janedoe", "JANEDOE"]:
+            with self.subTest(username=username):
+                people = Person.objects.with_username(username)
+                self.assertEqual(list(people), [self.person])
+        self.assertFalse(Person.objects.with_username("jane").exists())
+
+    def test_with_usernames(self):
+        people = Person.objects.with_usernames(["janedoe", "JOHN", "peter"])
+        self.assertEqual(list(people), [self.person, self.other_person])
+
+    def test_in_bulk_by_username(self):
+        people = Person.objects.in_bulk_by_username(["JANEDOE", "john", "peter"])
+        self.assertEqual(people, {"janedoe": self.person, "john": self.other_person})
+        with self.assertNumQueries(0):
+            self.assertEqual(Person.objects.in_bulk_by_username([]), {})
+
+    def test_unique_lower_username(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            PersonFactory(username="JANEDOE")
+
+    def test_with_username_uses_index(self):
+        if connection.vendor == "postgresql":
+            # the planner prefers a sequential scan of a table this small
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = Person.objects.with_username("janedoe").order_by().explain()
+        self.assertIn("people_unique_person_lower_username", plan)
+
+
 class PersonModelFieldsTestCase(SimpleTestCase):
     @classmethod
     def setUpClass(cls):
@@ -317,6 +431,54 @@ class PersonLastModifiedTestCase(PersonModelFieldsTestCase):
         self.assertEqual(self.field.verbose_name, "last modified")
 
 
+class PersonNameTokenModelTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.person = PersonFactory(full_name="Jane Mary Doe")
+        cls.name_token = cls.person.name_tokens.get(token="jane")
+        cls.name_token_meta = cls.name_token._meta
+
+    def test_constraints(self):
+        self.assertEqual(len(self.name_token_meta.constraints), 1)
+        self.assertIsInstance(
+            self.name_token_meta.constraints[0],
+            import_string("django.db.models.UniqueConstraint"),
+        )
+
+    def test_db_table(self):
+        self.assertEqual(self.name_token_meta.db_table, "people_name_token")
+
+    def test_string_repr(self):
+        self.assertEqual(str(self.name_token), "jane")
+
+    def test_tokens_on_create(self):
+        tokens = self.person.name_tokens.values_list("token", flat=True)
+        self.assertCountEqual(tokens, ["doe", "jane", "mary"])
+
+    def test_tokens_on_update(self):
+        person = PersonFactory(full_name="John Doe")
+        person.full_name = "John O'Brien"
+        person.save()
+        tokens = person.name_tokens.values_list("token", flat=True)
+        self.assertCountEqual(tokens, ["brien", "john", "o"])
+
+    def test_tokens_kept_when_update_fails(self):
+        person = PersonFactory(full_name="John Doe")
+        person.full_name = "John O'Brien"
+        with patch(
+            "people.models.PersonNameToken.objects.bulk_create",
+            side_effect=IntegrityError,
+        ):
+            with self.assertRaises(IntegrityError):
+                person.save()
+        person.refresh_from_db()
+        tokens = person.name_tokens.values_list("token", flat=True)
+        self.assertEqual(person.full_name, "John Doe")
+        self.assertCountEqual(tokens, ["doe", "john"])
+
+
 class InterpersonalRelationshipModelTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
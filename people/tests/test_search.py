@@ -0,0 +1,129 @@
+from unittest import SkipTest, skipUnless
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from people import search
+from people.factories import InterpersonalRelationshipFactory, PersonFactory
+from people.models import InterpersonalRelationship, Person
+
+
+class GetSearchBackendTestCase(TestCase):
+    @override_settings(SEARCH_BACKEND="people.search.SearchBackend")
+    def test_configured_backend(self):
+        self.assertIsInstance(search.get_search_backend(), search.SearchBackend)
+
+    @override_settings(SEARCH_BACKEND=None)
+    def test_default_backend(self):
+        if connection.vendor == "postgresql" and not search.has_trigram_extension():
+            raise SkipTest("Requires the pg_trgm extension")
+        if connection.vendor == "sqlite" and not search.has_trigram_tokenizer():
+            raise SkipTest("Requires SQLite 3.34 or later")
+        backend = search.DEFAULT_SEARCH_BACKENDS[connection.vendor]
+        self.assertEqual(
+            search.get_search_backend().__class__.__name__, backend.split(".")[-1]
+        )
+
+    @override_settings(SEARCH_BACKEND=None)
+    @patch("people.search.connection")
+    @patch("people.search.has_trigram_extension", return_value=False)
+    def test_default_backend_without_trigram_extension(self, _, mock_connection):
+        mock_connection.vendor = "postgresql"
+        self.assertIs(search.get_search_backend().__class__, search.SearchBackend)
+
+    @override_settings(SEARCH_BACKEND=None)
+    @patch("people.search.connection")
+    def test_default_backend_without_trigram_tokenizer(self, mock_connection):
+        mock_connection.vendor = "sqlite"
+        mock_connection.Database.sqlite_version_info = (3, 33, 0)
+        self.assertIs(search.get_search_backend().__class__, search.SearchBackend)
+
+
+class SearchBackendTestCase(TestCase):
+    backend_class = search.SearchBackend
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.jane = PersonFactory(username="jane", full_name="Jane Doe")
+        cls.janet = PersonFactory(username="janet", full_name="Janet Atieno Doe")
+        cls.john = PersonFactory(username="john", full_name="John Smith")
+        cls.relationship = InterpersonalRelationshipFactory(
+            person=cls.john, relative=cls.jane
+        )
+
+    def setUp(self):
+        self.backend = self.backend_class()
+
+    def search_people(self, query):
+        fields = ["username", "full_name"]
+        return self.backend.search(Person.objects.all(), query, fields)
+
+    def test_single_word(self):
+        people = self.search_people("jane")
+        self.assertQuerysetEqual(people, [self.jane, self.janet], ordered=False)
+
+    def test_every_word_matches(self):
+        people = self.search_people("doe atieno")
+        self.assertQuerysetEqual(people, [self.janet])
+
+    def test_case_insensitive(self):
+        people = self.search_people("SMITH")
+        self.assertQuerysetEqual(people, [self.john])
+
+    def test_short_word(self):
+        people = self.search_people("jo")
+        self.assertQuerysetEqual(people, [self.john])
+
+    def test_no_results(self):
+        self.assertQuerysetEqual(self.search_people("does not exist"), [])
+
+    def test_related_fields(self):
+        fields = ["person__username", "relative__username"]
+        queryset = InterpersonalRelationship.objects.all()
+        relationships = self.backend.search(queryset, "jane", fields)
+        self.assertQuerysetEqual(relationships, [self.relationship])
+
+
+@skipUnless(connection.vendor == "sqlite", "Requires SQLite")
+class SQLiteSearchBackendTestCase(SearchBackendTestCase):
+    backend_class = search.SQLiteSearchBackend
+
+    @classmethod
+    def setUpClass(cls):
+        if not search.has_trigram_tokenizer():
+            raise SkipTest("Requires SQLite 3.34 or later")
+
+        super().setUpClass()
+
+    def test_ranking(self):
+        people = self.search_people("jane doe")
+        self.assertEqual(list(people), [self.jane, self.janet])
+
+    def test_updated_person(self):
+        self.john.full_name = "John Otieno"
+        self.john.save()
+        self.assertQuerysetEqual(self.search_people("smith"), [])
+        self.assertQuerysetEqual(self.search_people("otieno"), [self.john])
+
+    def test_number_of_queries(self):
+        with self.assertNumQueries(1):
+            list(self.search_people("jane doe"))
+
+
+@skipUnless(connection.vendor == "postgresql", "Requires PostgreSQL")
+class PostgresSearchBackendTestCase(SearchBackendTestCase):
+    backend_class = search.PostgresSearchBackend
+
+    @classmethod
+    def setUpClass(cls):
+        if not search.has_trigram_extension():
+            raise SkipTest("Requires the pg_trgm extension")
+
+        super().setUpClass()
+
+    def test_ranking(self):
+        people = self.search_people("jane")
+        self.assertEqual(list(people), [self.jane, self.janet])
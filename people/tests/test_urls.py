@@ -137,3 +137,30 @@ class ParentChildRelationshipCreateURLTestCase(SimpleTestCase):
         self.assertEqual(
             self.match.view_name, "people:parent_child_relationship_create"
         )
+
+
+class PeopleExportURLTestCase(SimpleTestCase):
+    def setUp(self):
+        self.match = resolve("/people/export/")
+
+    def test_view_func(self):
+        self.assertEqual(
+            self.match.func.view_class, import_string("people.views.PeopleExportView")
+        )
+
+    def test_view_name(self):
+        self.assertEqual(self.match.view_name, "people:people_export")
+
+
+class RelationshipsExportURLTestCase(SimpleTestCase):
+    def setUp(self):
+        self.match = resolve("/people/relationships/export/")
+
+    def test_view_func(self):
+        self.assertEqual(
+            self.match.func.view_class,
+            import_string("people.views.RelationshipsExportView"),
+        )
+
+    def test_view_name(self):
+        self.assertEqual(self.match.view_name, "people:relationships_export")
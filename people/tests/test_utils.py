@@ -1,8 +1,12 @@
 from datetime import date, timedelta
 from random import randint
+from unittest.mock import patch
 
+from django.db.models import QuerySet
 from django.test import SimpleTestCase, TestCase
 
+from thefuzz import fuzz
+
 from accounts.factories import UserFactory
 from people import utils
 from people.constants import AGE_OF_MAJORITY, MAX_HUMAN_AGE
@@ -11,6 +15,7 @@ from people.factories import (
     InterpersonalRelationshipFactory,
     PersonFactory,
 )
+from people.models import Person
 
 
 class GetAgeTestCase(SimpleTestCase):
@@ -24,6 +29,22 @@ class GetAgeTestCase(SimpleTestCase):
         dob = date.today() - timedelta(days=days_lived)
         self.assertEqual(utils.get_age(dob), 1)
 
+    def test_age_on_date(self):
+        dob = date(2000, 6, 15)
+        self.assertEqual(utils.get_age(dob, today=date(2010, 6, 14)), 9)
+        self.assertEqual(utils.get_age(dob, today=date(2010, 6, 15)), 10)
+
+
+class GetYearsAgoTestCase(SimpleTestCase):
+    def test_age(self):
+        dob = utils.get_years_ago(AGE_OF_MAJORITY)
+        self.assertEqual(utils.get_age(dob), AGE_OF_MAJORITY)
+        self.assertEqual(utils.get_age(dob + timedelta(days=1)), AGE_OF_MAJORITY - 1)
+
+    def test_leap_day(self):
+        dob = utils.get_years_ago(1, today=date(2024, 2, 29))
+        self.assertEqual(dob, date(2023, 2, 28))
+
 
 class GetTodaysAdultDOBTestCase(SimpleTestCase):
     def test_age(self):
@@ -116,6 +137,41 @@ class GetPersonalDetailsTestCase(TestCase):
         self.assertEqual(utils.get_personal_details(user), None)
 
 
+class GetNameTokensTestCase(SimpleTestCase):
+    def test_normalization(self):
+        tokens = utils.get_name_tokens("  Jane   DOE-Smith ")
+        self.assertEqual(tokens, {"jane", "doe", "smith"})
+
+    def test_repeated_tokens(self):
+        self.assertEqual(utils.get_name_tokens("Jane Jane Doe"), {"jane", "doe"})
+
+    def test_no_tokens(self):
+        self.assertEqual(utils.get_name_tokens(" - "), set())
+
+
+class BulkCreatePeopleTestCase(TestCase):
+    def test_name_tokens(self):
+        people = utils.bulk_create_people(
+            [PersonFactory.build(full_name="Jane Doe"), PersonFactory.build()]
+        )
+        self.assertTrue(all(person.pk for person in people))
+        tokens = people[0].name_tokens.values_list("token", flat=True)
+        self.assertCountEqual(tokens, ["doe", "jane"])
+
+    def test_without_returned_primary_keys(self):
+        bulk_create = QuerySet.bulk_create
+
+        def bulk_create_without_pks(queryset, objs, *args, **kwargs):
+            objs = bulk_create(queryset, objs, *args, **kwargs)
+            for obj in objs:
+                obj.pk = None
+            return objs
+
+        with patch.object(QuerySet, "bulk_create", bulk_create_without_pks):
+            people = utils.bulk_create_people([PersonFactory.build(username="jane")])
+        self.assertEqual(people[0].pk, Person.objects.get(username="jane").pk)
+
+
 class IsDuplicatePersonTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -166,6 +222,35 @@ class IsDuplicatePersonTestCase(TestCase):
         person = PersonFactory.build(**data)
         self.assertTrue(utils.is_duplicate_person(person))
 
+    def test_shorter_full_name(self):
+        PersonFactory(full_name="Jane Mary Doe", created_by=self.user)
+        person = PersonFactory.build(full_name="doe, jane", created_by=self.user)
+        self.assertTrue(utils.is_duplicate_person(person))
+
+    def test_partially_overlapping_full_name(self):
+        PersonFactory(full_name="Jane Mary Doe", created_by=self.user)
+        person = PersonFactory.build(full_name="Jane Doe Smith", created_by=self.user)
+        self.assertFalse(utils.is_duplicate_person(person))
+
+    def test_matches_token_set_ratio(self):
+        names = ["Jane Doe", "Jane Mary Doe", "John Doe", "Mary Jane", "Doe"]
+        for name in names:
+            PersonFactory(full_name=name, created_by=self.user)
+        for name in ["Jane Doe", "Mary Doe", "Jane Smith", "Mary Jane Doe Smith"]:
+            with self.subTest(name=name):
+                person = PersonFactory.build(full_name=name, created_by=self.user)
+                queryset = Person.objects.filter(created_by=self.user)
+                expected = any(
+                    fuzz.token_set_ratio(name, p.full_name) == 100 for p in queryset
+                )
+                self.assertEqual(utils.is_duplicate_person(person), expected)
+
+    def test_number_of_queries(self):
+        PersonFactory.create_batch(20, created_by=self.user)
+        person = PersonFactory.build(**self.data)
+        with self.assertNumQueries(1):
+            utils.is_duplicate_person(person)
+
 
 class IsDuplicateInterpersonalRelationshipTestCase(TestCase):
     @classmethod
@@ -1,6 +1,7 @@
 from unittest.mock import call, patch
 
 from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.http.response import Http404
 from django.test import RequestFactory, TestCase
@@ -16,6 +17,7 @@ from people.factories import (
     PersonFactory,
 )
 from people.models import InterpersonalRelationship, Person
+from people.utils import get_years_ago
 
 from .helpers import search_interpersonal_relationships, search_people
 
@@ -28,6 +30,7 @@ class PeopleListViewTestCase(TestCase):
         cls.authorized_user = cls.get_authorized_user()
 
     def setUp(self):
+        cache.clear()
         self.factory = RequestFactory()
         self.request = self.build_get_request()
         self.view_class = views.PeopleListView
@@ -93,7 +96,16 @@ class PeopleListViewTestCase(TestCase):
         self.request = self.build_get_request({"q": search_term})
         self.view.setup(self.request)
         queryset = self.view.get_queryset()
-        self.assertQuerysetEqual(queryset, search_people(search_term))
+        self.assertQuerysetEqual(queryset, search_people(search_term), ordered=False)
+
+    def test_queryset_with_age_category(self):
+        AdultFactory.create_batch(2)
+        children = ChildFactory.create_batch(2)
+        self.request = self.build_get_request({"age_category": "child"})
+        self.view.setup(self.request)
+        queryset = self.view.get_queryset()
+        expected_people = [p for p in children if p.age_category == "child"]
+        self.assertQuerysetEqual(queryset, expected_people, ordered=False)
 
     # MultipleObjectMixin
     def test_paginate_by(self):
@@ -121,6 +133,7 @@ class PeopleListViewTestCase(TestCase):
             "object_list",
             context_object_name,
             "view",
+            "age_categories",
         ]
         self.assertEqual(list(context_data.keys()), expected_context_data_keys)
 
@@ -170,6 +183,21 @@ class PeopleListViewTestCase(TestCase):
             self.assertInHTML("There are no people yet!", response.content.decode())
         self.assertInHTML(self.table_head, response.content.decode())
 
+    def test_response_with_age_category_filter(self):
+        # setup
+        PersonFactory.create_batch(11, dob=get_years_ago(30))
+        self.request = self.build_get_request({"age_category": "adult"})
+        self.request.user = self.authorized_user
+        response = self.view_func(self.request)
+        response.render()
+        content = response.content.decode()
+
+        # test
+        self.assertInHTML(
+            '<option value="adult" selected>Adult</option>', content, count=1
+        )
+        self.assertIn("?age_category=adult&amp;page=2", content)
+
     def test_response_with_no_search_results(self):
         # setup
         search_term = "does not exist"
@@ -194,6 +222,7 @@ class PersonDetailViewTestCase(TestCase):
         cls.person = PersonFactory()
 
     def setUp(self):
+        cache.clear()
         self.factory = RequestFactory()
         self.request = self.factory.get("dummy_path")
         self.view_class = views.PersonDetailView
@@ -216,6 +245,11 @@ class PersonDetailViewTestCase(TestCase):
         obj = self.view.get_object()
         self.assertEqual(obj, self.person)
 
+    def test_object_with_existing_person_in_another_case(self):
+        self.view.setup(self.request, username=self.person.username.upper())
+        obj = self.view.get_object()
+        self.assertEqual(obj, self.person)
+
     def test_object_with_non_existent_person(self):
         self.view.setup(self.request, username="non-existent-person")
         with self.assertRaises(Http404):
@@ -233,9 +267,42 @@ class PersonDetailViewTestCase(TestCase):
         self.view.object = obj
         context_object_name = self.view.get_context_object_name(obj)
         context_data = self.view.get_context_data()
-        expected_context_data_keys = ["object", context_object_name, "view"]
+        expected_context_data_keys = [
+            "object",
+            context_object_name,
+            "view",
+            "family_tree",
+        ]
         self.assertEqual(list(context_data.keys()), expected_context_data_keys)
 
+    def test_family_tree(self):
+        child = PersonFactory()
+        InterpersonalRelationshipFactory(
+            person=self.person, relative=child, relation="PC"
+        )
+        self.view.setup(self.request, username=self.person.username)
+        self.view.object = self.view.get_object()
+        context_data = self.view.get_context_data()
+        self.assertEqual(context_data["family_tree"].children, [child])
+
+    def test_number_of_queries(self):
+        parent = PersonFactory()
+        children = PersonFactory.create_batch(3)
+        for child in children:
+            InterpersonalRelationshipFactory(
+                person=parent, relative=child, relation="PC"
+            )
+            InterpersonalRelationshipFactory(
+                person=child, relative=PersonFactory(), relation="PC"
+            )
+        view_person = Permission.objects.filter(name="Can view person")
+        self.request.user = UserFactory(user_permissions=tuple(view_person))
+        self.view_func(self.request, username=parent.username).render()
+        cache.clear()
+        # the person and then their family's relationships
+        with self.assertNumQueries(2):
+            self.view_func(self.request, username=parent.username).render()
+
     # SingleObjectTemplateResponseMixin
     def test_template_name(self):
         self.view.setup(self.request)
@@ -683,6 +750,19 @@ class AdultSelfRegisterViewTestCase(TestCase):
         self.assertEqual(person.created_by, self.user)
         self.assertEqual(person.user, self.user)
 
+    @patch("django.contrib.messages.success")
+    def test_form_valid_refreshes_personal_details(self, mock_success):
+        user = UserFactory()
+        self.assertIsNone(user.personal_details)
+        self.request.user = user
+        self.view.setup(self.request)
+        form = self.view.get_form()
+        self.assertTrue(form.is_valid())
+        self.view.form_valid(form)
+        person = Person.objects.get(username=self.form_data["username"])
+        with self.assertNumQueries(0):
+            self.assertEqual(user.personal_details, person)
+
     # ModelFormMixin
     def test_form_valid_with_duplicate(self):
         # setup
@@ -1137,6 +1217,7 @@ class InterpersonalRelationshipsListViewTestCase(TestCase):
         cls.authorized_user = cls.get_authorized_user()
 
     def setUp(self):
+        cache.clear()
         self.factory = RequestFactory()
         self.request = self.build_get_request()
         self.view_class = views.RelationshipsListView
@@ -1207,7 +1288,7 @@ class InterpersonalRelationshipsListViewTestCase(TestCase):
         self.view.setup(self.request)
         queryset = self.view.get_queryset()
         self.assertQuerysetEqual(
-            queryset, search_interpersonal_relationships(search_term)
+            queryset, search_interpersonal_relationships(search_term), ordered=False
         )
 
     # MultipleObjectMixin
@@ -1307,6 +1388,16 @@ class InterpersonalRelationshipsListViewTestCase(TestCase):
             "Your search didn't yield any results", response.content.decode()
         )
 
+    def test_number_of_queries(self):
+        # setup
+        self.request.user = self.authorized_user
+        self.view_func(self.request).render()  # warm up the permission cache
+        InterpersonalRelationshipFactory.create_batch(10)
+
+        # test
+        with self.assertNumQueries(2):
+            self.view_func(self.request).render()
+
 
 class InterpersonalRelationshipCreateViewTestCase(TestCase):
     @classmethod
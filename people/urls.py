@@ -14,6 +14,11 @@ urlpatterns = [
         views.RelationshipCreateView.as_view(),
         name="relationship_create",
     ),
+    path(
+        "relationships/export/",
+        views.RelationshipsExportView.as_view(),
+        name="relationships_export",
+    ),
     path(
         "relationships/",
         views.RelationshipsListView.as_view(),
@@ -27,6 +32,7 @@ urlpatterns = [
     path("add/adult/", views.AdultCreateView.as_view(), name="adult_create"),
     path("add/child/", views.ChildCreateView.as_view(), name="child_create"),
     path("add/", views.PersonCreateView.as_view(), name="person_create"),
+    path("export/", views.PeopleExportView.as_view(), name="people_export"),
     path(
         "<str:username>/update/", views.PersonUpdateView.as_view(), name="person_update"
     ),
@@ -2,8 +2,10 @@ from datetime import date, timedelta
 from math import ceil
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F, Q
 
 from thefuzz import fuzz
+from thefuzz import utils as fuzz_utils
 
 from . import constants
 
@@ -18,14 +20,34 @@ ADULT = (constants.YOUNG_ADULTHOOD[1] + 1, constants.MIDDLE_AGE[0] - 1)
 MIDDLE_AGED = constants.MIDDLE_AGE
 SENIOR_CITIZEN = (constants.AGE_OF_SENIORITY + 1, constants.MAX_HUMAN_AGE)
 
+AGE_CATEGORIES = {
+    "child": CHILD,
+    "teenager": TEENAGER,
+    "young adult": YOUNG_ADULT,
+    "adult": ADULT,
+    "middle-aged": MIDDLE_AGED,
+    "senior citizen": SENIOR_CITIZEN,
+}
 
-def get_age(dob):
-    today = date.today()
+
+def get_age(dob, today=None):
+    if today is None:
+        today = date.today()
     age = today.year - dob.year
     age -= (today.month, today.day) < (dob.month, dob.day)
     return age
 
 
+def get_years_ago(years, today=None):
+    """Returns the latest date of birth of someone who is `years` old today"""
+    if today is None:
+        today = date.today()
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:  # today is the 29th of February
+        return today.replace(year=today.year - years, day=28)
+
+
 def get_todays_adult_dob():
     days_lived = ceil(365.25 * constants.AGE_OF_MAJORITY)
     dob = date.today() - timedelta(days=days_lived)
@@ -70,12 +92,68 @@ def get_personal_details(user):
         return None
 
 
+def get_name_tokens(full_name):
+    """Returns the set of tokens `fuzz.token_set_ratio` compares for a name"""
+    return set(fuzz_utils.full_process(full_name, force_ascii=True).split())
+
+
+def update_name_tokens(person):
+    from .models import PersonNameToken
+
+    PersonNameToken.objects.filter(person=person).delete()
+    PersonNameToken.objects.bulk_create(
+        [
+            PersonNameToken(person=person, token=token)
+            for token in get_name_tokens(person.full_name)
+        ]
+    )
+
+
+def bulk_create_people(people, batch_size=None):
+    """Saves `people` with `bulk_create`, along with their name tokens"""
+    from .models import Person, PersonNameToken
+
+    people = Person.objects.bulk_create(people, batch_size=batch_size)
+    if any(person.pk is None for person in people):
+        # the database can't return the primary keys of the inserted rows
+        usernames = [person.username for person in people]
+        pks = dict(
+            Person.objects.filter(username__in=usernames).values_list("username", "pk")
+        )
+        for person in people:
+            person.pk = pks[person.username]
+
+    PersonNameToken.objects.bulk_create(
+        [
+            PersonNameToken(person=person, token=token)
+            for person in people
+            for token in get_name_tokens(person.full_name)
+        ],
+        batch_size=batch_size,
+    )
+    return people
+
+
 def is_duplicate_person(person):
+    """Checks whether the person's creator has added someone with a full name
+    whose `fuzz.token_set_ratio` with the person's full name is 100.
+
+    A ratio of 100 requires one name's tokens to be a subset of the other's, so
+    the name token index is used to only fetch people who either have all of the
+    person's tokens or whose tokens are all among the person's tokens.
+    """
     from .models import Person
 
-    queryset = Person.objects.filter(created_by=person.created_by)
-    full_names = list(map(lambda p: p.full_name, queryset))
-    for name in full_names:
+    tokens = get_name_tokens(person.full_name)
+    if not tokens:
+        return False
+
+    queryset = (
+        Person.objects.filter(created_by=person.created_by)
+        .with_shared_name_tokens(tokens)
+        .filter(Q(shared_tokens=len(tokens)) | Q(shared_tokens=F("name_token_count")))
+    )
+    for name in queryset.values_list("full_name", flat=True):
         ratio = fuzz.token_set_ratio(person.full_name, name)
         if ratio == 100:
             return True
@@ -87,4 +165,4 @@ def is_duplicate_interpersonal_relationship(relationship):
 
     queryset = InterpersonalRelationship.objects.filter(person=relationship.person)
     queryset = queryset.filter(relative=relationship.relative)
-    return queryset.count() > 0
+    return queryset.exists()
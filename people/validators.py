@@ -1,4 +1,4 @@
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 
 from .constants import AGE_OF_MAJORITY, MAX_HUMAN_AGE
 from .utils import get_age, get_todays_adult_dob
@@ -35,19 +35,14 @@ def validate_child(dob):
 
 
 def validate_person_username(username):
-    try:
-        from .models import Person
+    from .models import Person
 
-        Person.objects.get(username=username)
-    except ObjectDoesNotExist:
+    if not Person.objects.with_username(username).exists():
         raise ValidationError(PERSON_DOES_NOT_EXIST_ERROR % dict(username=username))
 
 
 def validate_unique_case_insensitive_username(username):
-    try:
-        from .models import Person
+    from .models import Person
 
-        Person.objects.get(username__iexact=username)
+    if Person.objects.with_username(username).exists():
         raise ValidationError(NON_UNIQUE_USERNAME_ERROR)
-    except ObjectDoesNotExist:
-        pass
@@ -10,7 +10,9 @@ from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DetailView, ListView, UpdateView
 
-from extra_views import SearchableListMixin
+from core.cache import CachePageMixin
+from core.exports import ExportMixin
+from core.pagination import CursorPaginationMixin
 
 from .forms import (
     DUPLICATE_RELATIONSHIPS_ERROR,
@@ -21,20 +23,59 @@ from .forms import (
     PersonCreationForm,
     PersonUpdateForm,
 )
+from .graph import FamilyTree
 from .models import InterpersonalRelationship, Person
-from .utils import is_duplicate_interpersonal_relationship, is_duplicate_person
+from .search import SearchMixin
+from .utils import (
+    AGE_CATEGORIES,
+    is_duplicate_interpersonal_relationship,
+    is_duplicate_person,
+)
 
 
 class PeopleListView(
-    LoginRequiredMixin, PermissionRequiredMixin, SearchableListMixin, ListView
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    CachePageMixin,
+    SearchMixin,
+    CursorPaginationMixin,
+    ListView,
 ):
+    cache_models = [Person]
     context_object_name = "people"
+    cursor_ordering = ["username", "id"]
     model = Person
     paginate_by = 10
     permission_required = "people.view_person"
     search_fields = ["username", "full_name"]
     template_name = "people/people_list.html"
 
+    def get_queryset(self):
+        queryset = super().get_queryset().with_age()
+        age_category = self.request.GET.get("age_category")
+        if age_category in AGE_CATEGORIES:
+            queryset = queryset.in_age_category(age_category)
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+        context_data["age_categories"] = list(AGE_CATEGORIES)
+        return context_data
+
+
+class PeopleExportView(ExportMixin, PeopleListView):
+    export_fields = {
+        "username": "username",
+        "full_name": "full_name",
+        "gender": "gender",
+        "dob": "dob",
+        "age": "age",
+        "age_category": "age_category",
+        "phone_number": "phone_number",
+        "created_at": "created_at",
+    }
+    export_filename = "people"
+
 
 class PersonCreateView(
     LoginRequiredMixin, PermissionRequiredMixin, SuccessMessageMixin, CreateView
@@ -76,7 +117,11 @@ class AdultSelfRegisterView(AdultCreateView):
 
     def form_valid(self, form):
         form.instance.user = self.request.user
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        if form.instance.pk is not None:
+            # refresh the user's memoized personal details
+            self.request.user.personal_details = form.instance
+        return response
 
 
 class ChildCreateView(PersonCreateView, UserPassesTestMixin):
@@ -123,16 +168,47 @@ class ChildCreateView(PersonCreateView, UserPassesTestMixin):
         return response
 
 
-class PersonDetailView(LoginRequiredMixin, PermissionRequiredMixin, DetailView):
+class PersonObjectMixin:
+    """Looks the person up by the URL's username, ignoring its case, with the
+    index on `LOWER(username)`
+    """
+
+    def get_object(self, queryset=None):
+        if queryset is None:
+            queryset = self.get_queryset()
+        username = self.kwargs[self.slug_url_kwarg]
+        return get_object_or_404(queryset.with_username(username))
+
+
+class PersonDetailView(
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    CachePageMixin,
+    PersonObjectMixin,
+    DetailView,
+):
+    cache_models = [Person, InterpersonalRelationship]
     model = Person
     permission_required = "people.view_person"
     slug_field = "username"
     slug_url_kwarg = "username"
     template_name = "people/person_detail.html"
 
+    def get_queryset(self):
+        return super().get_queryset().with_age()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["family_tree"] = FamilyTree.for_person(self.object)
+        return context
+
 
 class PersonUpdateView(
-    LoginRequiredMixin, PermissionRequiredMixin, SuccessMessageMixin, UpdateView
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    SuccessMessageMixin,
+    PersonObjectMixin,
+    UpdateView,
 ):
     form_class = PersonUpdateForm
     model = Person
@@ -152,16 +228,34 @@ class PersonUpdateView(
 
 
 class RelationshipsListView(
-    LoginRequiredMixin, PermissionRequiredMixin, SearchableListMixin, ListView
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    CachePageMixin,
+    SearchMixin,
+    CursorPaginationMixin,
+    ListView,
 ):
+    cache_models = [InterpersonalRelationship, Person]
     context_object_name = "relationships"
+    cursor_ordering = ["person__username", "created_at", "id"]
     model = InterpersonalRelationship
+    queryset = InterpersonalRelationship.objects.select_related("person", "relative")
     paginate_by = 10
     permission_required = "people.view_interpersonalrelationship"
     search_fields = ["person__username", "relative__username"]
     template_name = "people/relationships_list.html"
 
 
+class RelationshipsExportView(ExportMixin, RelationshipsListView):
+    export_fields = {
+        "person": "person__username",
+        "relative": "relative__username",
+        "relation": "relation",
+        "created_at": "created_at",
+    }
+    export_filename = "relationships"
+
+
 class RelationshipCreateView(
     LoginRequiredMixin, PermissionRequiredMixin, SuccessMessageMixin, CreateView
 ):
@@ -192,7 +286,7 @@ class ParentChildRelationshipCreateView(RelationshipCreateView, UserPassesTestMi
         return self.request.user.personal_details is not None
 
     def get_child(self):
-        return get_object_or_404(Person, username=self.kwargs["username"])
+        return get_object_or_404(Person.objects.with_username(self.kwargs["username"]))
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -2,3 +2,6 @@ from decimal import Decimal
 
 MAX_HUMAN_BODY_TEMP = Decimal(45)
 MIN_HUMAN_BODY_TEMP = Decimal(30)
+
+# readings above this are counted as fevers by the daily summaries
+FEVER_THRESHOLD = Decimal("37.5")
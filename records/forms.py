@@ -1,7 +1,17 @@
 from django import forms
+from django.contrib.auth.validators import UnicodeUsernameValidator
+
+from core.cache import bump_cache_version
+from people.models import Person
+from people.validators import PERSON_DOES_NOT_EXIST_ERROR
 
 from . import constants
 from .models import TemperatureRecord
+from .summaries import add_to_summaries
+from .utils import get_duplicate_temp_records, get_record_date
+
+DUPLICATE_TEMP_RECORD_ERROR = "%(person)s's temperature record already exists"
+DUPLICATE_BATCH_PERSON_ERROR = "%(person)s appears more than once in this batch"
 
 
 class TemperatureRecordCreationForm(forms.ModelForm):
@@ -15,3 +25,82 @@ class TemperatureRecordCreationForm(forms.ModelForm):
     class Meta:  # noqa
         model = TemperatureRecord
         fields = ["body_temperature"]
+
+
+class TemperatureRecordBatchForm(TemperatureRecordCreationForm):
+    username = forms.CharField(
+        label="The person's username",
+        max_length=25,
+        validators=[UnicodeUsernameValidator()],
+    )
+
+    class Meta(TemperatureRecordCreationForm.Meta):  # noqa
+        fields = ["username", "body_temperature"]
+
+
+class BaseTemperatureRecordBatchFormSet(forms.BaseFormSet):
+    """Captures the temperature records of many people in one submission.
+
+    The people of every row are looked up in one query and the existing records
+    they would duplicate in another, instead of once per row. `rows` sets the
+    number of blank rows an unbound formset shows, up to `max_num`.
+    """
+
+    def __init__(self, *args, rows=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if rows is not None:
+            rows = min(max(rows, self.min_num), self.max_num)
+            self.extra = rows - self.min_num
+
+    def get_filled_forms(self):
+        return [form for form in self.forms if form.has_changed()]
+
+    def clean(self):
+        forms = [
+            form
+            for form in self.get_filled_forms()
+            if form.cleaned_data.get("username")
+        ]
+        usernames = {form.cleaned_data["username"] for form in forms}
+        people = Person.objects.in_bulk_by_username(usernames)
+
+        batch_forms = {}
+        for form in forms:
+            username = form.cleaned_data["username"]
+            person = people.get(username.lower())
+            if person is None:
+                error = PERSON_DOES_NOT_EXIST_ERROR % dict(username=username)
+                form.add_error("username", error)
+            elif person.pk in batch_forms:
+                error = DUPLICATE_BATCH_PERSON_ERROR % dict(person=person)
+                form.add_error("username", error)
+            else:
+                form.instance.person = person
+                form.instance.record_date = get_record_date(form.instance)
+                batch_forms[person.pk] = form
+
+        temp_records = [form.instance for form in batch_forms.values()]
+        duplicates = get_duplicate_temp_records(temp_records)
+        for person_id in duplicates.values_list("person_id", flat=True):
+            form = batch_forms[person_id]
+            error = DUPLICATE_TEMP_RECORD_ERROR % dict(person=form.instance.person)
+            form.add_error(None, error)
+
+    def save(self, created_by=None):
+        temp_records = []
+        for form in self.get_filled_forms():
+            form.instance.created_by = created_by
+            temp_records.append(form.instance)
+        temp_records = TemperatureRecord.objects.bulk_create(temp_records)
+        add_to_summaries(temp_records)
+        bump_cache_version(TemperatureRecord)
+        return temp_records
+
+
+TemperatureRecordBatchFormSet = forms.formset_factory(
+    TemperatureRecordBatchForm,
+    formset=BaseTemperatureRecordBatchFormSet,
+    extra=10,
+    min_num=1,
+    validate_min=True,
+)
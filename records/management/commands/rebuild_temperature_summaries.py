@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from records.summaries import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Recomputes the daily temperature summaries from every temperature record."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="The number of records read at a time.",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_summaries(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} daily summaries"))
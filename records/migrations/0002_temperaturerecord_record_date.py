@@ -0,0 +1,75 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:41
+
+from django.core.management.base import CommandError
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+DUPLICATE_RECORDS_ERROR = (
+    "People can only have one temperature record a day before the unique "
+    "constraint on the person and record date is added. Delete the extra "
+    "records of these people on these dates: %s"
+)
+
+
+def set_record_dates(apps, schema_editor):
+    TemperatureRecord = apps.get_model("records", "TemperatureRecord")
+
+    tzinfo = timezone.get_current_timezone()
+    TemperatureRecord.objects.update(record_date=TruncDate("created_at", tzinfo=tzinfo))
+
+
+def check_duplicate_records(apps, schema_editor):
+    """Reports the people with more than one record on a day, which concurrent
+    requests could save past the views' check, instead of failing to add the
+    constraint
+    """
+    TemperatureRecord = apps.get_model("records", "TemperatureRecord")
+
+    duplicates = (
+        TemperatureRecord.objects.values("person__username", "record_date")
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .order_by("person__username", "record_date")
+    )
+    if duplicates:
+        records = ", ".join(
+            f"{d['person__username']} ({d['record_date']:%Y-%m-%d})" for d in duplicates
+        )
+        raise CommandError(DUPLICATE_RECORDS_ERROR % records)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("records", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="temperaturerecord",
+            name="record_date",
+            field=models.DateField(
+                editable=False,
+                help_text="The local date the record was taken on.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(set_record_dates, migrations.RunPython.noop),
+        migrations.RunPython(check_duplicate_records, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="temperaturerecord",
+            name="record_date",
+            field=models.DateField(
+                editable=False, help_text="The local date the record was taken on."
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="temperaturerecord",
+            constraint=models.UniqueConstraint(
+                fields=("person", "record_date"),
+                name="records_unique_daily_temperaturerecord",
+            ),
+        ),
+    ]
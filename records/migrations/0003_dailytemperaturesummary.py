@@ -0,0 +1,106 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:25
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+from records.summaries import SummaryTotals, get_age_category_on
+
+
+def summarize_temperature_records(apps, schema_editor):
+    TemperatureRecord = apps.get_model("records", "TemperatureRecord")
+    DailyTemperatureSummary = apps.get_model("records", "DailyTemperatureSummary")
+
+    buckets = defaultdict(SummaryTotals)
+    rows = TemperatureRecord.objects.values_list(
+        "record_date", "person__dob", "body_temperature"
+    )
+    for record_date, dob, body_temperature in rows.iterator():
+        age_category = get_age_category_on(dob, record_date)
+        buckets[(record_date, age_category)].add(body_temperature)
+
+    DailyTemperatureSummary.objects.bulk_create(
+        [
+            DailyTemperatureSummary(
+                date=record_date, age_category=age_category, **vars(totals)
+            )
+            for (record_date, age_category), totals in buckets.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("records", "0002_temperaturerecord_record_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTemperatureSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "age_category",
+                    models.CharField(
+                        choices=[
+                            ("child", "Child"),
+                            ("teenager", "Teenager"),
+                            ("young adult", "Young adult"),
+                            ("adult", "Adult"),
+                            ("middle-aged", "Middle-aged"),
+                            ("senior citizen", "Senior citizen"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "total_temperature",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="The sum of the body temperatures.",
+                        max_digits=12,
+                    ),
+                ),
+                (
+                    "max_temperature",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=4),
+                ),
+                (
+                    "fever_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of readings above the fever threshold.",
+                    ),
+                ),
+                ("last_modified", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "records_daily_temperature_summary",
+                "ordering": ["-date", "age_category"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="temperaturerecord",
+            index=models.Index(fields=["record_date"], name="records_temp_date_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="dailytemperaturesummary",
+            constraint=models.UniqueConstraint(
+                fields=("date", "age_category"),
+                name="records_unique_dailytemperaturesummary",
+            ),
+        ),
+        migrations.RunPython(summarize_temperature_records, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.0.10 on 2026-10-16 23:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0011_query_indexes"),
+        ("records", "0003_dailytemperaturesummary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="temperaturerecord",
+            name="person",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                to="people.person",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="temperaturerecord",
+            index=models.Index(
+                fields=["person", "created_at"], name="records_temp_person_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="temperaturerecord",
+            index=models.Index(fields=["created_at"], name="records_temp_created_idx"),
+        ),
+    ]
@@ -1,9 +1,12 @@
 import uuid
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
-from .utils import format_temperature
+from people.utils import AGE_CATEGORIES
+
+from .summaries import add_to_summaries, get_summary_key, refresh_summary
+from .utils import format_temperature, get_record_date
 from .validators import validate_human_body_temperature
 
 
@@ -11,7 +14,11 @@ class TemperatureRecord(models.Model):
     id = models.UUIDField(
         editable=False, default=uuid.uuid4, primary_key=True, verbose_name="ID"
     )
-    person = models.ForeignKey("people.Person", on_delete=models.PROTECT)
+    person = models.ForeignKey(
+        "people.Person",
+        on_delete=models.PROTECT,
+        db_index=False,  # covered by records_temp_person_time_idx
+    )
     body_temperature = models.DecimalField(
         max_digits=4,
         decimal_places=2,
@@ -24,13 +31,94 @@ class TemperatureRecord(models.Model):
         null=True,
         help_text="The user who created this record.",
     )
+    record_date = models.DateField(
+        editable=False, help_text="The local date the record was taken on."
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     last_modified = models.DateTimeField(auto_now=True)
 
     class Meta:  # noqa
+        constraints = [
+            models.UniqueConstraint(
+                fields=["person", "record_date"],
+                name="%(app_label)s_unique_daily_%(class)s",
+            )
+        ]
         db_table = "records_temperature"
+        indexes = [
+            models.Index(fields=["record_date"], name="records_temp_date_idx"),
+            # a person's records in the order they're listed
+            models.Index(
+                fields=["person", "created_at"], name="records_temp_person_time_idx"
+            ),
+            models.Index(fields=["created_at"], name="records_temp_created_idx"),
+        ]
         ordering = ["person__username", "created_at"]
 
     def __str__(self):
         temp = format_temperature(self.body_temperature)
         return f"{self.person} was {temp} at {self.created_at}"
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if self.record_date is None:
+            self.record_date = get_record_date(self)
+        super().save(*args, **kwargs)
+        if adding:
+            add_to_summaries([self])
+        else:
+            refresh_summary(*get_summary_key(self))
+
+    @transaction.atomic
+    def delete(self, *args, **kwargs):
+        summary_key = get_summary_key(self)
+        deleted = super().delete(*args, **kwargs)
+        refresh_summary(*summary_key)
+        return deleted
+
+
+class DailyTemperatureSummary(models.Model):
+    """The temperature records of a day and age category, added up.
+
+    `TemperatureRecord.save()` and `.delete()` keep the summaries up to date.
+    Changes that bypass them, like `QuerySet.delete()`, need the summaries to be
+    rebuilt with the `rebuild_temperature_summaries` command.
+    """
+
+    date = models.DateField()
+    age_category = models.CharField(
+        max_length=20,
+        choices=[(category, category.capitalize()) for category in AGE_CATEGORIES],
+    )
+    count = models.PositiveIntegerField(default=0)
+    total_temperature = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        help_text="The sum of the body temperatures.",
+    )
+    max_temperature = models.DecimalField(max_digits=4, decimal_places=2, default=0)
+    fever_count = models.PositiveIntegerField(
+        default=0, help_text="The number of readings above the fever threshold."
+    )
+    last_modified = models.DateTimeField(auto_now=True)
+
+    class Meta:  # noqa
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "age_category"],
+                name="%(app_label)s_unique_%(class)s",
+            )
+        ]
+        db_table = "records_daily_temperature_summary"
+        ordering = ["-date", "age_category"]
+
+    def __str__(self):
+        return f"{self.count} {self.age_category} temperature records on {self.date}"
+
+    @property
+    def mean_temperature(self):
+        if not self.count:
+            return None
+        return self.total_temperature / self.count
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+
+from core.cache import invalidate_cache
+
+from .models import TemperatureRecord
+
+
+def connect_signals():
+    post_save.connect(invalidate_cache, sender=TemperatureRecord)
+    post_delete.connect(invalidate_cache, sender=TemperatureRecord)
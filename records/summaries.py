@@ -0,0 +1,187 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Avg, Count, DateField, F, Max, Min, Q, Sum, Value
+from django.db.models.functions import Greatest, Trunc
+from django.utils import timezone
+
+from core.cache import bump_cache_version
+from people.constants import MAX_HUMAN_AGE
+from people.utils import AGE_CATEGORIES, get_age, get_age_category, get_years_ago
+
+from .constants import FEVER_THRESHOLD
+
+# the span of each bucket size's history, None for all of it
+HISTORY_SPANS = {
+    "day": timedelta(days=92),
+    "week": timedelta(weeks=104),
+    "month": None,
+}
+
+
+def get_age_category_on(dob, record_date):
+    """Returns the age category of someone born on `dob` on `record_date`"""
+    age = min(max(get_age(dob, today=record_date), 0), MAX_HUMAN_AGE)
+    return get_age_category(age)
+
+
+def get_summary_key(temp_record):
+    return (
+        temp_record.record_date,
+        get_age_category_on(temp_record.person.dob, temp_record.record_date),
+    )
+
+
+class SummaryTotals:
+    def __init__(self):
+        self.count = 0
+        self.total_temperature = Decimal(0)
+        self.max_temperature = None
+        self.fever_count = 0
+
+    def add(self, body_temperature):
+        body_temperature = Decimal(body_temperature)
+        self.count += 1
+        self.total_temperature += body_temperature
+        if self.max_temperature is None or body_temperature > self.max_temperature:
+            self.max_temperature = body_temperature
+        self.fever_count += body_temperature > FEVER_THRESHOLD
+
+
+def add_to_summaries(temp_records):
+    """Adds new temperature records to their days' summaries.
+
+    The records are grouped by day and age category first, so each summary
+    they touch is incremented with a single `UPDATE`.
+    """
+    buckets = defaultdict(SummaryTotals)
+    for temp_record in temp_records:
+        buckets[get_summary_key(temp_record)].add(temp_record.body_temperature)
+
+    for (record_date, age_category), totals in buckets.items():
+        summary = get_or_create_summary(record_date, age_category)
+        type(summary).objects.filter(pk=summary.pk).update(
+            count=F("count") + totals.count,
+            total_temperature=F("total_temperature") + totals.total_temperature,
+            max_temperature=Greatest(
+                F("max_temperature"), Value(totals.max_temperature)
+            ),
+            fever_count=F("fever_count") + totals.fever_count,
+        )
+
+
+def get_or_create_summary(record_date, age_category):
+    from .models import DailyTemperatureSummary
+
+    summary, _ = DailyTemperatureSummary.objects.get_or_create(
+        date=record_date, age_category=age_category
+    )
+    return summary
+
+
+def refresh_summary(record_date, age_category):
+    """Recomputes one summary from the day's records, e.g. after a deletion"""
+    from .models import DailyTemperatureSummary, TemperatureRecord
+
+    youngest, oldest = AGE_CATEGORIES[age_category]
+    temp_records = TemperatureRecord.objects.filter(
+        record_date=record_date,
+        person__dob__gt=get_years_ago(oldest + 1, today=record_date),
+        person__dob__lte=get_years_ago(youngest, today=record_date),
+    )
+    totals = SummaryTotals()
+    for body_temperature in temp_records.values_list("body_temperature", flat=True):
+        totals.add(body_temperature)
+
+    summaries = DailyTemperatureSummary.objects.filter(
+        date=record_date, age_category=age_category
+    )
+    if not totals.count:
+        summaries.delete()
+        return
+    summaries.update_or_create(
+        date=record_date, age_category=age_category, defaults=vars(totals)
+    )
+
+
+@transaction.atomic
+def rebuild_summaries(chunk_size=2000):
+    """Replaces every summary with ones computed from all the records"""
+    from .models import DailyTemperatureSummary, TemperatureRecord
+
+    buckets = defaultdict(SummaryTotals)
+    rows = TemperatureRecord.objects.values_list(
+        "record_date", "person__dob", "body_temperature"
+    ).order_by()
+    for record_date, dob, body_temperature in rows.iterator(chunk_size=chunk_size):
+        age_category = get_age_category_on(dob, record_date)
+        buckets[(record_date, age_category)].add(body_temperature)
+
+    DailyTemperatureSummary.objects.all().delete()
+    DailyTemperatureSummary.objects.bulk_create(
+        [
+            DailyTemperatureSummary(
+                date=record_date, age_category=age_category, **vars(totals)
+            )
+            for (record_date, age_category), totals in buckets.items()
+        ],
+        batch_size=chunk_size,
+    )
+    bump_cache_version(DailyTemperatureSummary)
+    return len(buckets)
+
+
+def get_daily_totals(summaries):
+    """Adds up the age category summaries of each day"""
+    return (
+        summaries.order_by("-date")
+        .values("date")
+        .annotate(
+            count=Sum("count"),
+            total_temperature=Sum("total_temperature"),
+            max_temperature=Max("max_temperature"),
+            fever_count=Sum("fever_count"),
+        )
+    )
+
+
+def get_history_start(bucket, today):
+    """The start of the first bucket of the history, or None for all of it"""
+    span = HISTORY_SPANS[bucket]
+    if span is None:
+        return None
+    start = today - span
+    if bucket == "week":
+        start -= timedelta(days=start.weekday())
+    return timezone.make_aware(datetime.combine(start, time.min))
+
+
+def get_temperature_history(person, bucket="day", today=None):
+    """Downsamples a person's temperature records into day, week or month buckets.
+
+    Each bucket has the number of readings, their mean, lowest and highest
+    temperatures and how many were fevers, most recent first. The database adds
+    them up from the records it reads with the index on `(person, created_at)`.
+    """
+    from .models import TemperatureRecord
+
+    temp_records = TemperatureRecord.objects.filter(person=person)
+    start = get_history_start(bucket, today or timezone.localdate())
+    if start is not None:
+        temp_records = temp_records.filter(created_at__gte=start)
+    return (
+        temp_records.annotate(
+            period=Trunc("created_at", bucket, output_field=DateField())
+        )
+        .order_by("-period")
+        .values("period")
+        .annotate(
+            count=Count("pk"),
+            mean_temperature=Avg("body_temperature"),
+            min_temperature=Min("body_temperature"),
+            max_temperature=Max("body_temperature"),
+            fever_count=Count("pk", filter=Q(body_temperature__gt=FEVER_THRESHOLD)),
+        )
+    )
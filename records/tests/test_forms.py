@@ -1,8 +1,14 @@
-from django.test import SimpleTestCase
+from datetime import date
+
+from django.test import SimpleTestCase, TestCase
 from django.utils.module_loading import import_string
 
+from accounts.factories import UserFactory
+from people.factories import PersonFactory
 from records import constants
-from records.forms import TemperatureRecordCreationForm
+from records.factories import TemperatureRecordFactory
+from records.forms import TemperatureRecordBatchFormSet, TemperatureRecordCreationForm
+from records.models import TemperatureRecord
 
 
 class TemperatureRecordCreationFormTestCase(SimpleTestCase):
@@ -70,3 +76,102 @@ class TemperatureRecordBodyTemperatureTestCase(
             "body_temperature": ["Ensure this value is greater than or equal to 30."]
         }
         self.assertEqual(form.errors, errors)
+
+
+class TemperatureRecordBatchFormSetTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.people = PersonFactory.create_batch(3, dob=date(1990, 1, 1))
+
+    def get_formset(self, rows):
+        data = {
+            "form-TOTAL_FORMS": len(rows),
+            "form-INITIAL_FORMS": 0,
+            "form-MIN_NUM_FORMS": 1,
+            "form-MAX_NUM_FORMS": 1000,
+        }
+        for index, (username, body_temperature) in enumerate(rows):
+            data[f"form-{index}-username"] = username
+            data[f"form-{index}-body_temperature"] = body_temperature
+        return TemperatureRecordBatchFormSet(data=data)
+
+    def test_valid_batch(self):
+        rows = [(person.username, "36.50") for person in self.people]
+        formset = self.get_formset([*rows, ("", "")])
+        self.assertTrue(formset.is_valid())
+        user = UserFactory()
+        temp_records = formset.save(created_by=user)
+        self.assertEqual(len(temp_records), 3)
+        self.assertEqual(TemperatureRecord.objects.filter(created_by=user).count(), 3)
+
+    def test_usernames_ignore_case(self):
+        person = self.people[0]
+        formset = self.get_formset([(person.username.upper(), "36.50")])
+        self.assertTrue(formset.is_valid())
+        self.assertEqual(formset.forms[0].instance.person, person)
+
+    def test_empty_batch(self):
+        formset = self.get_formset([("", "")])
+        self.assertFalse(formset.is_valid())
+
+    def test_row_errors(self):
+        formset = self.get_formset(
+            [
+                (self.people[0].username, "36.50"),
+                ("does_not_exist", "36.50"),
+                (self.people[1].username, constants.MAX_HUMAN_BODY_TEMP + 1),
+            ]
+        )
+        self.assertFalse(formset.is_valid())
+        self.assertEqual(formset.errors[0], {})
+        self.assertEqual(
+            formset.errors[1],
+            {"username": ["A person with username 'does_not_exist' does not exist"]},
+        )
+        self.assertEqual(
+            formset.errors[2],
+            {"body_temperature": ["Ensure this value is less than or equal to 45."]},
+        )
+
+    def test_person_repeated_in_batch(self):
+        person = self.people[0]
+        formset = self.get_formset(
+            [(person.username, "36.50"), (person.username, "37.00")]
+        )
+        self.assertFalse(formset.is_valid())
+        self.assertEqual(
+            formset.errors[1],
+            {"username": [f"{person} appears more than once in this batch"]},
+        )
+
+    def test_existing_record(self):
+        person = self.people[0]
+        TemperatureRecordFactory(person=person)
+        formset = self.get_formset(
+            [(person.username, "36.50"), (self.people[1].username, "36.50")]
+        )
+        self.assertFalse(formset.is_valid())
+        self.assertEqual(
+            formset.errors[0],
+            {"__all__": [f"{person}'s temperature record already exists"]},
+        )
+        self.assertEqual(formset.errors[1], {})
+
+    def test_rows(self):
+        self.assertEqual(len(TemperatureRecordBatchFormSet().forms), 11)
+        for rows, expected_rows in [(50, 50), (0, 1), (5000, 1000)]:
+            with self.subTest(rows=rows):
+                formset = TemperatureRecordBatchFormSet(rows=rows)
+                self.assertEqual(len(formset.forms), expected_rows)
+
+    def test_number_of_queries(self):
+        rows = [(person.username, "36.50") for person in self.people]
+        formset = self.get_formset(rows)
+        with self.assertNumQueries(2):
+            self.assertTrue(formset.is_valid())
+        # insert the records, then create the summary of their age category and
+        # add them to it
+        with self.assertNumQueries(6):
+            formset.save()
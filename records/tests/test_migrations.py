@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+
+class RecordDateMigrationTestCase(TransactionTestCase):
+    migrate_from = [("records", "0001_initial")]
+    migrate_to = [("records", "0002_temperaturerecord_record_date")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        apps = self.migrate(self.migrate_from)
+        apps.get_model("records", "TemperatureRecord").objects.all().delete()
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+        super().tearDown()
+
+    def create_records(self, times):
+        apps = self.migrate(self.migrate_from)
+        Person = apps.get_model("people", "Person")
+        TemperatureRecord = apps.get_model("records", "TemperatureRecord")
+
+        person = Person.objects.create(
+            username="jane", full_name="Jane Doe", dob="1990-01-01"
+        )
+        records = [
+            TemperatureRecord.objects.create(person=person, body_temperature=36.5)
+            for _ in times
+        ]
+        for record, created_at in zip(records, times):
+            TemperatureRecord.objects.filter(pk=record.pk).update(created_at=created_at)
+        return records
+
+    def test_record_dates(self):
+        # 22:30 UTC is 01:30 the next day in Nairobi
+        evening = timezone.make_aware(datetime(2022, 1, 1, 22, 30), timezone.utc)
+        records = self.create_records([evening, evening - timedelta(hours=4)])
+
+        apps = self.migrate(self.migrate_to)
+        TemperatureRecord = apps.get_model("records", "TemperatureRecord")
+        self.assertQuerysetEqual(
+            TemperatureRecord.objects.order_by("record_date"),
+            [(records[1].pk, "2022-01-01"), (records[0].pk, "2022-01-02")],
+            transform=lambda r: (r.pk, r.record_date.isoformat()),
+        )
+
+    def test_duplicate_records(self):
+        evening = timezone.make_aware(datetime(2022, 1, 1, 22, 30), timezone.utc)
+        times = [evening, evening + timedelta(minutes=1), evening - timedelta(hours=4)]
+        self.create_records(times)
+        message = "records of these people on these dates: jane (2022-01-02)"
+        with self.assertRaisesMessage(CommandError, message):
+            self.migrate(self.migrate_to)
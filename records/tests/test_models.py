@@ -1,4 +1,6 @@
+from django.db import IntegrityError
 from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
 from django.utils.module_loading import import_string
 
 from records.factories import TemperatureRecordFactory
@@ -29,6 +31,21 @@ class TemperatureRecordModelTestCase(TestCase):
             self.temp_record_meta.verbose_name_plural, "temperature records"
         )
 
+    def test_constraints(self):
+        constraint = self.temp_record_meta.constraints[0]
+        self.assertEqual(constraint.fields, ("person", "record_date"))
+        self.assertEqual(constraint.name, "records_unique_daily_temperaturerecord")
+
+    def test_record_date(self):
+        self.assertEqual(
+            self.temp_record.record_date,
+            timezone.localdate(self.temp_record.created_at),
+        )
+
+    def test_unique_daily_record(self):
+        with self.assertRaises(IntegrityError):
+            TemperatureRecordFactory(person=self.temp_record.person)
+
     def test_string_repr(self):
         person = self.temp_record.person
         temp = format_temperature(self.temp_record.body_temperature)
@@ -167,6 +184,29 @@ class TemperatureRecordCreatedByTestCase(TemperatureRecordModelFieldsTestCase):
         self.assertEqual(self.field.verbose_name, "created by")
 
 
+class TemperatureRecordRecordDateTestCase(TemperatureRecordModelFieldsTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.field = cls.temp_record_meta.get_field("record_date")
+
+    def test_class_name(self):
+        self.assertEqual(self.field.__class__.__name__, "DateField")
+
+    def test_editable(self):
+        self.assertFalse(self.field.editable)
+
+    def test_help_text(self):
+        help_text = "The local date the record was taken on."
+        self.assertEqual(self.field.help_text, help_text)
+
+    def test_null(self):
+        self.assertFalse(self.field.null)
+
+    def test_verbose_name(self):
+        self.assertEqual(self.field.verbose_name, "record date")
+
+
 class TemperatureRecordCreatedAtTestCase(TemperatureRecordModelFieldsTestCase):
     @classmethod
     def setUpClass(cls):
@@ -0,0 +1,297 @@
+import io
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import Http404
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from accounts.factories import UserFactory
+from people.factories import PersonFactory
+from records import views
+from records.factories import TemperatureRecordFactory
+from records.models import DailyTemperatureSummary, TemperatureRecord
+from records.summaries import (
+    get_age_category_on,
+    get_daily_totals,
+    get_temperature_history,
+    rebuild_summaries,
+)
+
+
+def get_summary_values():
+    return list(
+        DailyTemperatureSummary.objects.values_list(
+            "date",
+            "age_category",
+            "count",
+            "total_temperature",
+            "max_temperature",
+            "fever_count",
+        )
+    )
+
+
+def create_temp_records(person, readings):
+    """Creates the person's records of the local `(datetime, temperature)`
+    readings
+    """
+    readings = [(timezone.make_aware(at), temp) for at, temp in readings]
+    temp_records = TemperatureRecord.objects.bulk_create(
+        [
+            TemperatureRecord(
+                person=person,
+                body_temperature=Decimal(temp),
+                record_date=timezone.localdate(at),
+            )
+            for at, temp in readings
+        ]
+    )
+    for temp_record, (at, _) in zip(temp_records, readings):
+        TemperatureRecord.objects.filter(pk=temp_record.pk).update(created_at=at)
+
+
+class GetAgeCategoryOnTestCase(TestCase):
+    def test_age_on_record_date(self):
+        dob = date(2000, 6, 15)
+        self.assertEqual(get_age_category_on(dob, date(2013, 6, 14)), "child")
+        self.assertEqual(get_age_category_on(dob, date(2013, 6, 15)), "teenager")
+
+
+class DailyTemperatureSummaryTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.today = timezone.localdate()
+        cls.adult = PersonFactory(dob=date(1990, 1, 1))
+        cls.other_adult = PersonFactory(dob=date(1990, 1, 1))
+        cls.child = PersonFactory(dob=cls.today - timedelta(days=365 * 5))
+
+    def create_record(self, person, body_temperature, **kwargs):
+        return TemperatureRecordFactory(
+            person=person, body_temperature=Decimal(body_temperature), **kwargs
+        )
+
+    def test_records_are_added_to_summaries(self):
+        self.create_record(self.adult, "36.50")
+        self.create_record(self.other_adult, "38.00")
+        self.create_record(self.child, "37.00")
+        self.assertEqual(
+            get_summary_values(),
+            [
+                (self.today, "adult", 2, Decimal("74.50"), Decimal("38.00"), 1),
+                (self.today, "child", 1, Decimal("37.00"), Decimal("37.00"), 0),
+            ],
+        )
+
+    def test_mean_temperature(self):
+        self.create_record(self.adult, "36.50")
+        self.create_record(self.other_adult, "37.50")
+        summary = DailyTemperatureSummary.objects.get()
+        self.assertEqual(summary.mean_temperature, Decimal("37.00"))
+
+    def test_updated_record(self):
+        temp_record = self.create_record(self.adult, "39.00")
+        self.create_record(self.other_adult, "36.50")
+        temp_record.body_temperature = Decimal("36.00")
+        temp_record.save()
+        self.assertEqual(
+            get_summary_values(),
+            [(self.today, "adult", 2, Decimal("72.50"), Decimal("36.50"), 0)],
+        )
+
+    def test_deleted_record(self):
+        temp_record = self.create_record(self.adult, "39.00")
+        self.create_record(self.child, "36.50")
+        temp_record.delete()
+        self.assertEqual(
+            get_summary_values(),
+            [(self.today, "child", 1, Decimal("36.50"), Decimal("36.50"), 0)],
+        )
+
+    def test_rebuild(self):
+        yesterday = self.today - timedelta(days=1)
+        self.create_record(self.adult, "36.50")
+        self.create_record(self.adult, "38.50", record_date=yesterday)
+        expected_values = get_summary_values()
+        DailyTemperatureSummary.objects.update(count=0)
+        TemperatureRecord.objects.filter(record_date=yesterday).delete()
+        self.assertEqual(rebuild_summaries(), 1)
+        self.assertEqual(get_summary_values(), expected_values[:1])
+
+    def test_rebuild_command(self):
+        self.create_record(self.adult, "36.50")
+        DailyTemperatureSummary.objects.all().delete()
+        stdout = io.StringIO()
+        call_command("rebuild_temperature_summaries", stdout=stdout)
+        self.assertIn("Rebuilt 1 daily summaries", stdout.getvalue())
+        self.assertEqual(DailyTemperatureSummary.objects.count(), 1)
+
+    def test_daily_totals(self):
+        self.create_record(self.adult, "36.50")
+        self.create_record(self.child, "38.00")
+        totals = get_daily_totals(DailyTemperatureSummary.objects.all())
+        self.assertEqual(
+            list(totals),
+            [
+                {
+                    "date": self.today,
+                    "count": 2,
+                    "total_temperature": Decimal("74.50"),
+                    "max_temperature": Decimal("38.00"),
+                    "fever_count": 1,
+                }
+            ],
+        )
+
+
+class TemperatureSummaryViewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        view_temp = Permission.objects.filter(name="Can view temperature record")
+        cls.user = UserFactory(user_permissions=tuple(view_temp))
+        TemperatureRecordFactory.create_batch(3)
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get("dummy_path")
+        self.request.user = self.user
+        self.view_func = views.TemperatureSummaryView.as_view()
+
+    def test_context_data(self):
+        response = self.view_func(self.request)
+        days = response.context_data["days"]
+        self.assertEqual(len(days), 1)
+        self.assertEqual(days[0]["count"], 3)
+        self.assertEqual(sum(summary.count for summary in days[0]["age_categories"]), 3)
+
+    def test_number_of_queries(self):
+        self.view_func(self.request).render()
+        TemperatureRecordFactory.create_batch(10)
+        # the summaries and their daily totals, however many records there are
+        with self.assertNumQueries(2):
+            self.view_func(self.request).render()
+
+
+class TemperatureHistoryTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.today = date(2026, 3, 18)
+        cls.person = PersonFactory()
+        create_temp_records(
+            cls.person,
+            [
+                (datetime(2026, 3, 18, 8), "38.00"),
+                (datetime(2026, 3, 16, 8), "36.00"),
+                (datetime(2026, 3, 10, 1, 30), "36.50"),
+                (datetime(2026, 2, 10, 8), "36.60"),
+                (datetime(2025, 1, 5, 8), "36.70"),
+                (datetime(2023, 6, 1, 8), "36.80"),
+            ],
+        )
+        create_temp_records(PersonFactory(), [(datetime(2026, 3, 18, 8), "39.00")])
+
+    def get_history(self, bucket):
+        return list(get_temperature_history(self.person, bucket, today=self.today))
+
+    def test_days(self):
+        history = self.get_history("day")
+        self.assertEqual(
+            [day["period"] for day in history],
+            [
+                date(2026, 3, 18),
+                date(2026, 3, 16),
+                date(2026, 3, 10),
+                date(2026, 2, 10),
+            ],
+        )
+        self.assertEqual(history[0]["count"], 1)
+        self.assertEqual(history[0]["fever_count"], 1)
+
+    def test_weeks(self):
+        history = self.get_history("week")
+        self.assertEqual(
+            [week["period"] for week in history],
+            [date(2026, 3, 16), date(2026, 3, 9), date(2026, 2, 9), date(2024, 12, 30)],
+        )
+        week = history[0]
+        self.assertEqual(week["count"], 2)
+        self.assertEqual(week["mean_temperature"], Decimal("37"))
+        self.assertEqual(week["min_temperature"], Decimal("36"))
+        self.assertEqual(week["max_temperature"], Decimal("38"))
+        self.assertEqual(week["fever_count"], 1)
+
+    def test_months(self):
+        history = self.get_history("month")
+        self.assertEqual(
+            [(month["period"], month["count"]) for month in history],
+            [
+                (date(2026, 3, 1), 3),
+                (date(2026, 2, 1), 1),
+                (date(2025, 1, 1), 1),
+                (date(2023, 6, 1), 1),
+            ],
+        )
+
+    def test_number_of_queries(self):
+        with self.assertNumQueries(1):
+            self.get_history("week")
+
+
+class TemperatureHistoryViewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        view_temp = Permission.objects.filter(name="Can view temperature record")
+        cls.user = UserFactory(user_permissions=tuple(view_temp))
+        cls.person = PersonFactory()
+        create_temp_records(
+            cls.person,
+            [(datetime.combine(timezone.localdate(), datetime.min.time()), "36.50")],
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.view_func = views.TemperatureHistoryView.as_view()
+
+    def get(self, query=None, username=None):
+        request = RequestFactory().get("dummy_path", query)
+        request.user = self.user
+        return self.view_func(request, username=username or self.person.username)
+
+    def test_context_data(self):
+        response = self.get()
+        self.assertEqual(response.context_data["person"], self.person)
+        self.assertEqual(response.context_data["bucket"], "day")
+        self.assertEqual(response.context_data["buckets"], ["day", "week", "month"])
+        self.assertEqual(len(response.context_data["history"]), 1)
+
+    def test_bucket(self):
+        response = self.get({"bucket": "month"})
+        self.assertEqual(response.context_data["bucket"], "month")
+        [month] = response.context_data["history"]
+        self.assertEqual(month["period"], timezone.localdate().replace(day=1))
+
+    def test_unknown_bucket(self):
+        response = self.get({"bucket": "year"})
+        self.assertEqual(response.context_data["bucket"], "day")
+
+    def test_non_existent_person(self):
+        with self.assertRaises(Http404):
+            self.get(username="non-existent-person")
+
+    def test_number_of_queries(self):
+        self.get({"bucket": "week"}).render()  # warm up the permission cache
+        cache.clear()
+        # the person and their history
+        with self.assertNumQueries(2):
+            self.get({"bucket": "week"}).render()
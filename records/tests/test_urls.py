@@ -29,3 +29,61 @@ class TemperatureRecordCreateURLTestCase(SimpleTestCase):
 
     def test_view_name(self):
         self.assertEqual(self.match.view_name, "records:temperature_record_create")
+
+
+class TemperatureRecordBatchCreateURLTestCase(SimpleTestCase):
+    def setUp(self):
+        self.match = resolve("/records/temperature/add/")
+
+    def test_view_func(self):
+        self.assertEqual(
+            self.match.func.view_class,
+            import_string("records.views.TemperatureRecordBatchCreateView"),
+        )
+
+    def test_view_name(self):
+        self.assertEqual(
+            self.match.view_name, "records:temperature_record_batch_create"
+        )
+
+
+class TemperatureRecordsExportURLTestCase(SimpleTestCase):
+    def setUp(self):
+        self.match = resolve("/records/temperature/export/")
+
+    def test_view_func(self):
+        self.assertEqual(
+            self.match.func.view_class,
+            import_string("records.views.TemperatureRecordsExportView"),
+        )
+
+    def test_view_name(self):
+        self.assertEqual(self.match.view_name, "records:temperature_records_export")
+
+
+class TemperatureSummaryURLTestCase(SimpleTestCase):
+    def setUp(self):
+        self.match = resolve("/records/temperature/summary/")
+
+    def test_view_func(self):
+        self.assertEqual(
+            self.match.func.view_class,
+            import_string("records.views.TemperatureSummaryView"),
+        )
+
+    def test_view_name(self):
+        self.assertEqual(self.match.view_name, "records:temperature_summary")
+
+
+class TemperatureHistoryURLTestCase(SimpleTestCase):
+    def setUp(self):
+        self.match = resolve("/records/temperature/username/history/")
+
+    def test_view_func(self):
+        self.assertEqual(
+            self.match.func.view_class,
+            import_string("records.views.TemperatureHistoryView"),
+        )
+
+    def test_view_name(self):
+        self.assertEqual(self.match.view_name, "records:temperature_history")
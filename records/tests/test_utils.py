@@ -1,57 +1,46 @@
 from datetime import timedelta
 
 from django.test import TestCase
+from django.utils import timezone
 
-from accounts.factories import UserFactory
-from people.factories import PersonFactory
 from records.factories import TemperatureRecordFactory
-from records.utils import is_duplicate_temp_record
+from records.utils import get_duplicate_temp_records, get_record_date
 
 
-class IsDuplicateTemperatureRecordTestCase(TestCase):
+class GetRecordDateTestCase(TestCase):
+    def test_with_created_at(self):
+        created_at = timezone.make_aware(timezone.datetime(2021, 10, 10, 22, 30))
+        temp_record = TemperatureRecordFactory.build(created_at=created_at)
+        self.assertEqual(get_record_date(temp_record), timezone.localdate(created_at))
+
+    def test_without_created_at(self):
+        temp_record = TemperatureRecordFactory.build()
+        self.assertEqual(get_record_date(temp_record), timezone.localdate())
+
+
+class GetDuplicateTemperatureRecordsTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
 
-        cls.user = UserFactory()
-        cls.temp_record = TemperatureRecordFactory(created_by=cls.user)
-        cls.data = {
-            "person": cls.temp_record.person,
-            "body_temperature": cls.temp_record.body_temperature,
-            "created_at": cls.temp_record.created_at,
-        }
-
-    def test_exact_duplicate(self):
-        temp_record = TemperatureRecordFactory.build(**self.data)
-        self.assertTrue(is_duplicate_temp_record(temp_record))
-
-    def test_different_body_temperature(self):
-        data = self.data.copy()
-        data.pop("body_temperature")
-        temp_record = TemperatureRecordFactory.build(**data)
-        self.assertTrue(is_duplicate_temp_record(temp_record))
-
-    def test_different_creator(self):
-        data = self.data.copy()
-        data["created_by"] = UserFactory()
-        temp_record = TemperatureRecordFactory.build(**data)
-        self.assertTrue(is_duplicate_temp_record(temp_record))
-
-    def test_different_date(self):
-        data = self.data.copy()
-        data["created_at"] = data["created_at"] - timedelta(days=1)
-        temp_record = TemperatureRecordFactory.build(**data)
-        self.assertFalse(is_duplicate_temp_record(temp_record))
-
-    def test_null_date(self):
-        data = self.data.copy()
-        data.pop("created_at")
-        temp_record = TemperatureRecordFactory.build(**data)
-        self.assertIsNone(temp_record.created_at)
-        self.assertTrue(is_duplicate_temp_record(temp_record))
-
-    def test_not_duplicate(self):
-        data = self.data.copy()
-        data["person"] = PersonFactory()
-        temp_record = TemperatureRecordFactory.build(**data)
-        self.assertFalse(is_duplicate_temp_record(temp_record))
+        cls.temp_record = TemperatureRecordFactory()
+        cls.yesterdays_record = TemperatureRecordFactory(
+            record_date=timezone.localdate() - timedelta(days=1)
+        )
+
+    def test_duplicates(self):
+        temp_records = [
+            TemperatureRecordFactory.build(person=self.temp_record.person),
+            TemperatureRecordFactory.build(person=self.yesterdays_record.person),
+            TemperatureRecordFactory.build(
+                person=self.yesterdays_record.person,
+                record_date=self.yesterdays_record.record_date,
+            ),
+        ]
+        with self.assertNumQueries(1):
+            duplicates = list(get_duplicate_temp_records(temp_records))
+        self.assertCountEqual(duplicates, [self.temp_record, self.yesterdays_record])
+
+    def test_no_records(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(list(get_duplicate_temp_records([])), [])
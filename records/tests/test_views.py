@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.http.response import Http404
 from django.test import RequestFactory, TestCase
@@ -24,6 +25,7 @@ class TemperatureRecordsListViewTestCase(TestCase):
         cls.authorized_user = cls.get_authorized_user()
 
     def setUp(self):
+        cache.clear()
         self.factory = RequestFactory()
         self.request = self.build_get_request()
         self.view_class = views.TemperatureRecordsListView
@@ -91,7 +93,9 @@ class TemperatureRecordsListViewTestCase(TestCase):
         self.request = self.build_get_request({"q": search_term})
         self.view.setup(self.request)
         queryset = self.view.get_queryset()
-        self.assertQuerysetEqual(queryset, search_temperature_records(search_term))
+        self.assertQuerysetEqual(
+            queryset, search_temperature_records(search_term), ordered=False
+        )
 
     # MultipleObjectMixin
     def test_paginate_by(self):
@@ -187,6 +191,16 @@ class TemperatureRecordsListViewTestCase(TestCase):
             "Your search didn't yield any results", response.content.decode()
         )
 
+    def test_number_of_queries(self):
+        # setup
+        self.request.user = self.authorized_user
+        self.view_func(self.request).render()  # warm up the permission cache
+        TemperatureRecordFactory.create_batch(10)
+
+        # test
+        with self.assertNumQueries(2):
+            self.view_func(self.request).render()
+
 
 class TemperatureRecordCreateViewTestCase(TestCase):
     @classmethod
@@ -345,3 +359,91 @@ class TemperatureRecordCreateViewTestCase(TestCase):
         self.view.setup(self.request)
         permission_required = self.view.get_permission_required()
         self.assertEqual(permission_required, ("records.add_temperaturerecord",))
+
+
+class TemperatureRecordBatchCreateViewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.people = PersonFactory.create_batch(2)
+        cls.user = UserFactory()
+        cls.form_data = {
+            "form-TOTAL_FORMS": 2,
+            "form-INITIAL_FORMS": 0,
+            "form-MIN_NUM_FORMS": 1,
+            "form-MAX_NUM_FORMS": 1000,
+        }
+        for index, person in enumerate(cls.people):
+            cls.form_data[f"form-{index}-username"] = person.username
+            cls.form_data[f"form-{index}-body_temperature"] = "36.50"
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.request = self.factory.post("dummy_path", data=self.form_data)
+        self.request.user = self.user
+        self.view_class = views.TemperatureRecordBatchCreateView
+        self.view = self.view_class()
+
+    # FormMixin
+    def test_form_class(self):
+        self.view.setup(self.request)
+        self.assertEqual(
+            self.view.get_form_class(),
+            import_string("records.forms.TemperatureRecordBatchFormSet"),
+        )
+
+    def test_success_url(self):
+        self.view.setup(self.request)
+        success_url = self.view.get_success_url()
+        self.assertEqual(success_url, reverse("records:temperature_records_list"))
+
+    def test_form_rows(self):
+        for query, expected_rows in [
+            ({}, 11),
+            ({"rows": "50"}, 50),
+            ({"rows": "x"}, 11),
+        ]:
+            with self.subTest(query=query):
+                self.view.setup(self.factory.get("dummy_path", data=query))
+                self.assertEqual(self.view.get_form().total_form_count(), expected_rows)
+
+    # template logic
+    def test_response_with_rows(self):
+        add_temp = Permission.objects.filter(codename="add_temperaturerecord")
+        request = self.factory.get("dummy_path", data={"rows": "3"})
+        request.user = UserFactory(user_permissions=tuple(add_temp))
+        response = self.view_class.as_view()(request)
+        response.render()
+        content = response.content.decode()
+        self.assertIn('name="form-2-username"', content)
+        self.assertNotIn('name="form-3-username"', content)
+        self.assertIn('name="rows" type="number" min="1" max="1000" value="3"', content)
+
+    # SuccessMessageMixin
+    @patch("django.contrib.messages.success")
+    def test_form_valid(self, mock_success):
+        self.view.setup(self.request)
+        form = self.view.get_form()
+        self.assertTrue(form.is_valid())
+        response = self.view.form_valid(form)
+        self.assertEqual(response.status_code, 302)
+        mock_success.assert_called_once_with(
+            self.request, "2 temperature records have been added successfully."
+        )
+        temp_records = TemperatureRecord.objects.filter(created_by=self.user)
+        self.assertCountEqual(
+            [temp_record.person for temp_record in temp_records], self.people
+        )
+
+    def test_form_valid_with_concurrent_duplicate(self):
+        self.view.setup(self.request)
+        form = self.view.get_form()
+        self.assertTrue(form.is_valid())
+        TemperatureRecordFactory(person=self.people[1])
+        response = self.view.form_valid(form)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(TemperatureRecord.objects.filter(created_by=self.user))
+        response.render()
+        error_message = f"{self.people[1]}'s temperature record already exists"
+        self.assertInHTML(error_message, response.content.decode())
@@ -4,11 +4,31 @@ from . import views
 
 app_name = "records"
 urlpatterns = [
+    path(
+        "temperature/add/",
+        views.TemperatureRecordBatchCreateView.as_view(),
+        name="temperature_record_batch_create",
+    ),
     path(
         "temperature/<str:username>/add/",
         views.TemperatureRecordCreateView.as_view(),
         name="temperature_record_create",
     ),
+    path(
+        "temperature/<str:username>/history/",
+        views.TemperatureHistoryView.as_view(),
+        name="temperature_history",
+    ),
+    path(
+        "temperature/export/",
+        views.TemperatureRecordsExportView.as_view(),
+        name="temperature_records_export",
+    ),
+    path(
+        "temperature/summary/",
+        views.TemperatureSummaryView.as_view(),
+        name="temperature_summary",
+    ),
     path(
         "temperature/",
         views.TemperatureRecordsListView.as_view(),
@@ -1,17 +1,34 @@
-from datetime import date
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from django.utils import timezone
 
 
 def format_temperature(temperature):
     return "{:.2f}\N{DEGREE SIGN}C".format(temperature)
 
 
-def is_duplicate_temp_record(temp_record):
+def get_record_date(temp_record):
+    """Returns the local date a temperature record was (or is being) taken on"""
+    if temp_record.created_at is None:
+        return timezone.localdate()
+    return timezone.localdate(temp_record.created_at)
+
+
+def get_duplicate_temp_records(temp_records):
+    """Returns the existing records duplicated by any of `temp_records`"""
     from .models import TemperatureRecord
 
-    creation_date = date.today()
-    if temp_record.created_at is not None:
-        creation_date = temp_record.created_at.date()
+    people = {}
+    for temp_record in temp_records:
+        record_date = temp_record.record_date or get_record_date(temp_record)
+        people.setdefault(record_date, []).append(temp_record.person)
+    if not people:
+        return TemperatureRecord.objects.none()
 
-    queryset = TemperatureRecord.objects.filter(person=temp_record.person)
-    queryset = queryset.filter(created_at__date=creation_date)
-    return queryset.count() > 0
+    filters = [
+        Q(record_date=record_date, person__in=people[record_date])
+        for record_date in people
+    ]
+    return TemperatureRecord.objects.filter(reduce(or_, filters))
@@ -1,29 +1,59 @@
+from datetime import timedelta
+
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
-from django.views.generic import CreateView, ListView
-
-from extra_views import SearchableListMixin
+from django.utils import timezone
+from django.views.generic import CreateView, FormView, ListView, TemplateView
 
+from core.cache import CachePageMixin
+from core.exports import ExportMixin
+from core.pagination import CursorPaginationMixin
 from people.models import Person
+from people.search import SearchMixin
 
-from .forms import TemperatureRecordCreationForm
-from .models import TemperatureRecord
-from .utils import is_duplicate_temp_record
+from .constants import FEVER_THRESHOLD
+from .forms import (
+    DUPLICATE_TEMP_RECORD_ERROR,
+    TemperatureRecordBatchFormSet,
+    TemperatureRecordCreationForm,
+)
+from .models import DailyTemperatureSummary, TemperatureRecord
+from .summaries import HISTORY_SPANS, get_daily_totals, get_temperature_history
 
 
 class TemperatureRecordsListView(
-    LoginRequiredMixin, PermissionRequiredMixin, SearchableListMixin, ListView
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    CachePageMixin,
+    SearchMixin,
+    CursorPaginationMixin,
+    ListView,
 ):
+    cache_models = [TemperatureRecord, Person]
     context_object_name = "temperature_records"
+    cursor_ordering = ["person__username", "created_at", "id"]
     model = TemperatureRecord
+    queryset = TemperatureRecord.objects.select_related("person")
     paginate_by = 10
     permission_required = "records.view_temperaturerecord"
     search_fields = ["person__username", "person__full_name"]
     template_name = "records/temperature_records_list.html"
 
 
+class TemperatureRecordsExportView(ExportMixin, TemperatureRecordsListView):
+    export_fields = {
+        "person": "person__username",
+        "body_temperature": "body_temperature",
+        "record_date": "record_date",
+        "created_at": "created_at",
+        "created_by": "created_by__username",
+    }
+    export_filename = "temperature_records"
+
+
 class TemperatureRecordCreateView(
     LoginRequiredMixin, PermissionRequiredMixin, SuccessMessageMixin, CreateView
 ):
@@ -34,7 +64,7 @@ class TemperatureRecordCreateView(
     template_name = "records/temperature_record_form.html"
 
     def get_person(self):
-        return get_object_or_404(Person, username=self.kwargs["username"])
+        return get_object_or_404(Person.objects.with_username(self.kwargs["username"]))
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -44,13 +74,98 @@ class TemperatureRecordCreateView(
     def form_valid(self, form):
         form.instance.person = self.get_person()
         form.instance.created_by = self.request.user
-        if is_duplicate_temp_record(form.instance):
-            error_message = "%(person)s's temperature record already exists"
-            form.add_error(
-                field=None, error=error_message % dict(person=form.instance.person)
-            )
+        try:
+            # the database rejects a second record for the person on the same day
+            with transaction.atomic():
+                return super().form_valid(form)
+        except IntegrityError:
+            error = DUPLICATE_TEMP_RECORD_ERROR % dict(person=form.instance.person)
+            form.add_error(field=None, error=error)
             return self.form_invalid(form)
-        return super().form_valid(form)
 
     def get_success_message(self, cleaned_data):
         return self.success_message % dict(person=self.object.person)
+
+
+class TemperatureRecordBatchCreateView(
+    LoginRequiredMixin, PermissionRequiredMixin, SuccessMessageMixin, FormView
+):
+    form_class = TemperatureRecordBatchFormSet
+    permission_required = "records.add_temperaturerecord"
+    rows_kwarg = "rows"
+    success_url = reverse_lazy("records:temperature_records_list")
+    success_message = "%(count)d temperature records have been added successfully."
+    template_name = "records/temperature_record_batch_form.html"
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        try:
+            kwargs["rows"] = int(self.request.GET[self.rows_kwarg])
+        except (KeyError, ValueError):
+            pass
+        return kwargs
+
+    def form_valid(self, form):
+        try:
+            with transaction.atomic():
+                self.object_list = form.save(created_by=self.request.user)
+        except IntegrityError:
+            # another user recorded someone in the batch after it was validated,
+            # validating it again reports the rows that are now duplicates
+            form.full_clean()
+            return self.form_invalid(form)
+        return super().form_valid(form)
+
+    def get_success_message(self, cleaned_data):
+        return self.success_message % dict(count=len(self.object_list))
+
+
+class TemperatureSummaryView(
+    LoginRequiredMixin, PermissionRequiredMixin, CachePageMixin, TemplateView
+):
+    cache_models = [TemperatureRecord, DailyTemperatureSummary]
+    days = 14
+    permission_required = "records.view_temperaturerecord"
+    template_name = "records/temperature_summary.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        start = timezone.localdate() - timedelta(days=self.days - 1)
+        summaries = DailyTemperatureSummary.objects.filter(date__gte=start)
+        categories = {}
+        for summary in summaries:
+            categories.setdefault(summary.date, []).append(summary)
+        days = list(get_daily_totals(summaries))
+        for day in days:
+            day["mean_temperature"] = day["total_temperature"] / day["count"]
+            day["age_categories"] = categories.get(day["date"], [])
+        context["days"] = days
+        context["fever_threshold"] = FEVER_THRESHOLD
+        return context
+
+
+class TemperatureHistoryView(
+    LoginRequiredMixin, PermissionRequiredMixin, CachePageMixin, TemplateView
+):
+    """A person's temperature records, added up by day, week or month"""
+
+    cache_models = [TemperatureRecord, Person]
+    default_bucket = "day"
+    permission_required = "records.view_temperaturerecord"
+    template_name = "records/temperature_history.html"
+
+    def get_person(self):
+        return get_object_or_404(Person.objects.with_username(self.kwargs["username"]))
+
+    def get_bucket(self):
+        bucket = self.request.GET.get("bucket")
+        return bucket if bucket in HISTORY_SPANS else self.default_bucket
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["person"] = person = self.get_person()
+        context["bucket"] = bucket = self.get_bucket()
+        context["buckets"] = list(HISTORY_SPANS)
+        context["history"] = get_temperature_history(person, bucket)
+        context["fever_threshold"] = FEVER_THRESHOLD
+        return context